@@ -0,0 +1,43 @@
+"""Benchmark the model’s data loading at start, with and without the snapshot cache.
+
+Usage: python -m benchmarks.bench_cold_start
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+from chess_tournament.models.model import Model
+from chess_tournament.models.storage import JSONStorage
+
+from .synthetic import generate_archive
+
+TOTAL_PLAYERS = 10000
+TOTAL_TOURNAMENTS = 1000
+
+
+def timed_load(data_path: Path, lazy: bool = False) -> tuple[Model, float]:
+    """Return a model loaded from the given path and its loading time."""
+    model = Model(data_path)
+    start = time.perf_counter()
+    model.load(lazy)
+    return model, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        data_path = Path(directory)
+        players, tournaments = generate_archive(TOTAL_PLAYERS, TOTAL_TOURNAMENTS)
+        JSONStorage(data_path).save(players, tournaments, players_file=True, tournaments_file=True)
+        print(f"{TOTAL_PLAYERS} players / {TOTAL_TOURNAMENTS} tournaments")
+
+        model, decoding_time = timed_load(data_path)
+        print(f"JSON decoding:  {decoding_time * 1000:>9.1f} ms")
+        model.close()  # writes the snapshot cache
+
+        model, cached_time = timed_load(data_path)
+        print(f"snapshot cache: {cached_time * 1000:>9.1f} ms")
+        assert len(model.tournaments) == TOTAL_TOURNAMENTS
+
+        _, lazy_time = timed_load(data_path, lazy=True)
+        print(f"lazy headers:   {lazy_time * 1000:>9.1f} ms")
@@ -0,0 +1,49 @@
+"""Benchmark the score groups decomposition of the matchmaking by score against the global pairing.
+
+Usage: python -m benchmarks.bench_decomposition
+"""
+
+import random
+import time
+
+from chess_tournament.models.chessdata import PairingConfig
+from chess_tournament.models.chessdata.pairing_engines import PAIRING_ENGINES, get_pairing_engine_class, score_gap_cost
+from chess_tournament.models.chessdata.played_pairs import PlayedPairs
+from chess_tournament.models.chessdata.score_groups import ScoreGroupsEngine
+
+from .synthetic import generate_players, generate_tournament
+
+TOURNAMENTS_SIZES = (64, 256, 1024)
+TOTAL_PLAYED_ROUNDS = 3
+TIME_LIMIT = 10.0  # seconds, for the cp-sat engine
+
+
+def bench_decomposition(total_participants: int, engine: str, decomposition: bool) -> tuple[float, float | None]:
+    """Return the pairing time and cost (None if no pairing was found) after a few played rounds."""
+    rng = random.Random(total_participants)
+    players = list(generate_players(total_participants).values())
+    tournament = generate_tournament(0, players, total_participants, TOTAL_PLAYED_ROUNDS + 1, TOTAL_PLAYED_ROUNDS, rng)
+    played_pairs = PlayedPairs(tournament.participants)
+    for round in tournament.rounds:
+        for match in round.matches:
+            played_pairs.add(match.participants_pair)
+    pairing_config = PairingConfig(engine=engine, max_time_in_seconds=TIME_LIMIT, decomposition=decomposition)
+    pairing_engine = ScoreGroupsEngine() if decomposition else get_pairing_engine_class(engine)()
+
+    start = time.perf_counter()
+    pairs = pairing_engine.solve(played_pairs, pairing_config)
+    pairing_time = time.perf_counter() - start
+    return pairing_time, sum(score_gap_cost(*pair) for pair in pairs) if pairs is not None else None
+
+
+if __name__ == "__main__":
+    print("engine  | participants | global (ms) | cost    | decomposed (ms) | cost")
+    for engine, engine_class in PAIRING_ENGINES.items():
+        if not engine_class.is_available:
+            continue
+        for size in TOURNAMENTS_SIZES:
+            results = [bench_decomposition(size, engine, decomposition) for decomposition in (False, True)]
+            print(
+                f"{engine:<7} | {size:>12} | "
+                + " | ".join(f"{pairing_time * 1000:>11.1f} | {str(cost):<7}" for pairing_time, cost in results)
+            )
@@ -0,0 +1,44 @@
+"""Benchmark the tournaments encoding done by each autosave, depending on the size of the archive.
+
+Usage: python -m benchmarks.bench_encode
+"""
+
+import random
+import time
+
+from chess_tournament.models.chessdata import Match
+
+from .synthetic import generate_archive, generate_random_round, generate_tournament
+
+ARCHIVE_SIZES = (10, 100, 1000)
+TOTAL_AUTOSAVES = 32
+
+
+def bench_encode(total_archived_tournaments: int) -> tuple[float, float]:
+    """Return the full encoding time and the mean encoding time of an autosave following a score registration."""
+    rng = random.Random(total_archived_tournaments)
+    players, tournaments = generate_archive(total_players=500, total_tournaments=total_archived_tournaments)
+    live_tournament = generate_tournament(len(tournaments), list(players.values()), 64, 5, 2, rng)
+    live_round = generate_random_round(2, live_tournament.participants, rng)
+    live_tournament.add_round(live_round)
+    live_round.start_round()
+    tournaments.append(live_tournament)
+
+    start = time.perf_counter()
+    [tournament.cached_encode() for tournament in tournaments]  # first encoding: nothing cached yet
+    full_encoding_time = time.perf_counter() - start
+
+    autosaves_time = 0.0
+    for match_m in range(TOTAL_AUTOSAVES):
+        live_round.register_score(match_m, (Match.Points.DRAW, Match.Points.DRAW))
+        start = time.perf_counter()
+        [tournament.cached_encode() for tournament in tournaments]
+        autosaves_time += time.perf_counter() - start
+    return full_encoding_time, autosaves_time / TOTAL_AUTOSAVES
+
+
+if __name__ == "__main__":
+    print(f"{'archived tournaments':>20} | {'full encoding (ms)':>18} | {'autosave encoding (ms)':>22}")
+    for archive_size in ARCHIVE_SIZES:
+        full_time, autosave_time = bench_encode(archive_size)
+        print(f"{archive_size:>20} | {full_time * 1000:>18.3f} | {autosave_time * 1000:>22.3f}")
@@ -0,0 +1,132 @@
+"""Benchmark how the matchmaking by score scales, writing machine-readable JSON results.
+
+For each engine and tournament size, a seeded synthetic tournament plays its first round (randomly paired), then
+each next round is generated by Tournament.set_next_round and played with random results. The model build time, the
+solve time and the end-to-end set_next_round time of each round are reported, so that the results of two versions
+can be compared.
+
+Usage: python -m benchmarks.bench_matchmaking [--output results.json] [--baseline previous_results.json]
+                                              [--sizes 8 32 ...] [--engines cp-sat ...]
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+from chess_tournament.models.chessdata import PairingConfig, Participant, Tournament
+from chess_tournament.models.chessdata.pairing_engines import PAIRING_ENGINES
+
+from .synthetic import generate_players, play_round
+
+TOURNAMENTS_SIZES = (8, 32, 128, 512, 1024)
+TOTAL_ROUNDS = 5
+TIME_LIMIT = 10.0  # seconds, for the cp-sat engine
+SEED = 0
+
+
+def bench_matchmaking(
+    total_participants: int, engine: str, total_rounds: int, time_limit: float, seed: int
+) -> list[dict[str, Any]]:
+    """Return the timings (in seconds) of each round paired by score of a synthetic tournament."""
+    rng = random.Random(seed)
+    random.seed(seed)  # the first round is randomly generated
+    players = generate_players(total_participants)
+    tournament = Tournament(
+        name="Benchmark",
+        location="Paris",
+        begin_date=date(2000, 1, 1),
+        end_date=date(2000, 1, 2),
+        total_rounds=total_rounds,
+        participants=[Participant(player) for player in players.values()],
+        pairing_config=PairingConfig(engine=engine, max_time_in_seconds=time_limit),
+    )
+    rounds_timings = []
+    for round_r in range(total_rounds):
+        tournament.pairing_cache.clear()  # each round is solved
+        start = time.perf_counter()
+        tournament.set_next_round()
+        set_next_round_time = time.perf_counter() - start
+        round = tournament.current_round
+        if round_r > 0:  # the first round is not paired by the engine
+            rounds_timings.append(
+                {
+                    "round": round_r + 1,
+                    "build_time": round.pairing_build_time,
+                    "solve_time": round.pairing_solve_time,
+                    "set_next_round_time": set_next_round_time,
+                }
+            )
+        play_round(round, rng)
+    return rounds_timings
+
+
+def run_suite(
+    sizes: list[int], engines: list[str], total_rounds: int, time_limit: float, seed: int
+) -> dict[str, Any]:
+    """Return the benchmark results of every engine and tournament size, with the environment description."""
+    results = []
+    for engine in engines:
+        for size in sizes:
+            rounds_timings = bench_matchmaking(size, engine, total_rounds, time_limit, seed)
+            results.append(
+                {
+                    "engine": engine,
+                    "participants": size,
+                    "rounds": rounds_timings,
+                    "mean": {
+                        timing: sum(round_timings[timing] for round_timings in rounds_timings) / len(rounds_timings)
+                        for timing in ("build_time", "solve_time", "set_next_round_time")
+                    },
+                }
+            )
+            print(f"{engine:<7} | {size:>5} participants | {results[-1]['mean']}", file=sys.stderr)
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "settings": {"total_rounds": total_rounds, "time_limit": time_limit, "seed": seed},
+        "results": results,
+    }
+
+
+def compare_with_baseline(suite_results: dict[str, Any], baseline_results: dict[str, Any]) -> None:
+    """Print the ratio of each mean timing to the baseline one (above 1: slower than the baseline)."""
+    baseline = {(result["engine"], result["participants"]): result["mean"] for result in baseline_results["results"]}
+    for result in suite_results["results"]:
+        baseline_mean = baseline.get((result["engine"], result["participants"]))
+        if baseline_mean is None:
+            continue
+        ratios = ", ".join(
+            f"{timing} x{mean / baseline_mean[timing]:.2f}" if baseline_mean[timing] else f"{timing} -"
+            for timing, mean in result["mean"].items()
+        )
+        print(f"{result['engine']:<7} | {result['participants']:>5} participants | {ratios}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    available_engines = [engine for engine, engine_class in PAIRING_ENGINES.items() if engine_class.is_available]
+    parser = argparse.ArgumentParser(description="Benchmark how the matchmaking by score scales.")
+    parser.add_argument("-o", "--output", help="write the JSON results in this file (default: stdout)", type=Path)
+    parser.add_argument("--baseline", help="compare the mean timings with these previous JSON results", type=Path)
+    parser.add_argument("--sizes", default=TOURNAMENTS_SIZES, help="tournaments sizes", nargs="+", type=int)
+    parser.add_argument("--engines", choices=available_engines, default=available_engines, nargs="+")
+    parser.add_argument("--rounds", default=TOTAL_ROUNDS, help="rounds per tournament (at least 2)", type=int)
+    parser.add_argument("--time-limit", default=TIME_LIMIT, help="solver time limit in seconds", type=float)
+    parser.add_argument("--seed", default=SEED, type=int)
+    args = parser.parse_args()
+    suite_results = run_suite(args.sizes, args.engines, max(2, args.rounds), args.time_limit, args.seed)
+    if args.output is not None:
+        args.output.write_text(json.dumps(suite_results, indent=2), encoding="utf-8")
+    else:
+        print(json.dumps(suite_results, indent=2))
+    if args.baseline is not None:
+        compare_with_baseline(suite_results, json.loads(args.baseline.read_text(encoding="utf-8")))
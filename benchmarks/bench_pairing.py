@@ -0,0 +1,55 @@
+"""Benchmark the matchmaking by score engines, separating the model build time from the solve time.
+
+The solve time saved by the solver hints (greedy pairing or previous solution) is measured for the cp-sat engine.
+
+Usage: python -m benchmarks.bench_pairing
+"""
+
+import random
+from datetime import date
+
+from chess_tournament.models.chessdata import PairingConfig, Participant, Tournament
+from chess_tournament.models.chessdata.pairing_engines import PAIRING_ENGINES
+
+from .synthetic import generate_players, play_round
+
+TOURNAMENTS_SIZES = (16, 24, 32)
+TOTAL_ROUNDS = 5
+
+
+def bench_pairing(total_participants: int, engine: str) -> tuple[float, float, float | None]:
+    """Return the mean model build time, solve time and solve time saved by the hints of the rounds after the first."""
+    rng = random.Random(total_participants)
+    random.seed(total_participants)  # the first round is randomly generated
+    players = generate_players(total_participants)
+    tournament = Tournament(
+        name="Benchmark",
+        location="Paris",
+        begin_date=date(2000, 1, 1),
+        end_date=date(2000, 1, 2),
+        total_rounds=TOTAL_ROUNDS,
+        participants=[Participant(player) for player in players.values()],
+        pairing_config=PairingConfig(engine=engine, measure_hints=True),
+    )
+    for _ in range(TOTAL_ROUNDS):
+        tournament.set_next_round()
+        play_round(tournament.current_round, rng)
+    rounds = tournament.rounds[1:]  # the first round is not paired by the engine
+    build_time = sum(round.pairing_build_time for round in rounds) / len(rounds)
+    solve_time = sum(round.pairing_solve_time for round in rounds) / len(rounds)
+    if any(round.hints_saved_time is None for round in rounds):  # engine without hints
+        return build_time, solve_time, None
+    return build_time, solve_time, sum(round.hints_saved_time for round in rounds) / len(rounds)
+
+
+if __name__ == "__main__":
+    print("engine  | participants | model build (ms) | solve (ms) | saved by hints (ms)")
+    for engine, engine_class in PAIRING_ENGINES.items():
+        if not engine_class.is_available:
+            continue
+        for size in TOURNAMENTS_SIZES:
+            build_time, solve_time, hints_saved_time = bench_pairing(size, engine)
+            print(
+                f"{engine:<7} | {size:>12} | {build_time * 1000:>16.1f} | {solve_time * 1000:>10.1f} | "
+                + (f"{hints_saved_time * 1000:>18.1f}" if hints_saved_time is not None else f"{'-':>18}")
+            )
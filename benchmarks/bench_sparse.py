@@ -0,0 +1,59 @@
+"""Benchmark the candidate pairs limited to the nearest opponents by score against all the not played pairs.
+
+Usage: python -m benchmarks.bench_sparse
+"""
+
+import random
+import time
+
+from chess_tournament.models.chessdata import PairingConfig
+from chess_tournament.models.chessdata.pairing_engines import PAIRING_ENGINES, get_pairing_engine_class, score_gap_cost
+from chess_tournament.models.chessdata.played_pairs import PlayedPairs
+
+from .synthetic import generate_players, generate_tournament
+
+TOURNAMENTS_SIZES = (64, 256, 1024)
+TOTAL_PLAYED_ROUNDS = 3
+NEAREST_OPPONENTS = 8
+TIME_LIMIT = 10.0  # seconds, for the cp-sat engine
+
+
+def bench_sparse(total_participants: int, engine: str, nearest_opponents: int) -> tuple[int, float, float | None]:
+    """Return the number of candidate pairs, the pairing time and cost (None if no pairing was found)."""
+    rng = random.Random(total_participants)
+    players = list(generate_players(total_participants).values())
+    tournament = generate_tournament(0, players, total_participants, TOTAL_PLAYED_ROUNDS + 1, TOTAL_PLAYED_ROUNDS, rng)
+    played_pairs = PlayedPairs(tournament.participants)
+    for round in tournament.rounds:
+        for match in round.matches:
+            played_pairs.add(match.participants_pair)
+    pairing_config = PairingConfig(engine=engine, max_time_in_seconds=TIME_LIMIT, nearest_opponents=nearest_opponents)
+    if nearest_opponents:
+        total_candidates = len(played_pairs.nearest_slots_pairs(nearest_opponents))
+    else:
+        total_candidates = len(played_pairs.remaining_slots_pairs())
+
+    start = time.perf_counter()
+    pairs = get_pairing_engine_class(engine)().solve(played_pairs, pairing_config)
+    pairing_time = time.perf_counter() - start
+    return (
+        total_candidates,
+        pairing_time,
+        sum(score_gap_cost(*pair) for pair in pairs) if pairs is not None else None,
+    )
+
+
+if __name__ == "__main__":
+    print(f"engine  | participants | all pairs | time (ms) | cost    | {NEAREST_OPPONENTS} nearest | time (ms) | cost")
+    for engine, engine_class in PAIRING_ENGINES.items():
+        if not engine_class.is_available:
+            continue
+        for size in TOURNAMENTS_SIZES:
+            results = [bench_sparse(size, engine, nearest_opponents) for nearest_opponents in (0, NEAREST_OPPONENTS)]
+            print(
+                f"{engine:<7} | {size:>12} | "
+                + " | ".join(
+                    f"{total_candidates:>9} | {pairing_time * 1000:>9.1f} | {str(cost):<7}"
+                    for total_candidates, pairing_time, cost in results
+                )
+            )
@@ -0,0 +1,80 @@
+"""Define a seeded synthetic chess data generator used by the benchmarks."""
+
+import random
+from datetime import date, timedelta
+
+from chess_tournament.models.chessdata import Match, Participant, Player, Round, Tournament
+
+
+def generate_players(total_players: int) -> dict[str, Player]:
+    """Return players with valid national identifiers (2 letters then 5 digits)."""
+    players = {}
+    for p in range(total_players):
+        identifier = f"{chr(65 + p // 100000 // 26 % 26)}{chr(65 + p // 100000 % 26)}{p % 100000:05d}"
+        players[identifier] = Player(
+            identifier=identifier,
+            last_name=f"LAST{p}",
+            first_name=f"First{p}",
+            birth_date=date(1950, 1, 1) + timedelta(days=p % 20000),
+        )
+    return players
+
+
+def generate_random_round(round_r: int, participants: list[Participant], rng: random.Random) -> Round:
+    """Return a round with randomly paired participants (not registered in any tournament)."""
+    shuffled_participants = rng.sample(participants, len(participants))
+    matches = tuple(Match(pair) for pair in zip(shuffled_participants[::2], shuffled_participants[1::2]))
+    return Round(name=f"Round {round_r + 1}", matches=matches)
+
+
+def play_round(round: Round, rng: random.Random) -> None:
+    """Start the round, register a random score for each of its matches, then end it."""
+    round.start_round()
+    for match_m in range(round.total_matches):
+        round.register_score(match_m, Match.get_pairs_score_from_first(rng.choice(list(Match.Points))))
+    round.end_round()
+
+
+def generate_tournament(
+    tournament_t: int,
+    players: list[Player],
+    total_participants: int,
+    total_rounds: int,
+    total_played_rounds: int,
+    rng: random.Random,
+) -> Tournament:
+    """Return a tournament whose first rounds were randomly paired and played."""
+    participants = [Participant(player) for player in rng.sample(players, total_participants)]
+    rounds = []
+    for round_r in range(total_played_rounds):
+        round = generate_random_round(round_r, participants, rng)
+        play_round(round, rng)
+        rounds.append(round)
+    begin_date = date(2000, 1, 1) + timedelta(days=tournament_t)
+    return Tournament(
+        name=f"Tournament {tournament_t}",
+        location="Paris",
+        begin_date=begin_date,
+        end_date=begin_date + timedelta(days=1),
+        total_rounds=total_rounds,
+        participants=participants,
+        rounds=rounds,
+    )
+
+
+def generate_archive(
+    total_players: int,
+    total_tournaments: int,
+    total_participants: int = 32,
+    total_rounds: int = 5,
+    seed: int = 0,
+) -> tuple[dict[str, Player], list[Tournament]]:
+    """Return players and ended tournaments (as an archive of several years of history would be)."""
+    rng = random.Random(seed)
+    players = generate_players(total_players)
+    players_list = list(players.values())
+    tournaments = [
+        generate_tournament(t, players_list, total_participants, total_rounds, total_rounds, rng)
+        for t in range(total_tournaments)
+    ]
+    return players, tournaments
@@ -9,6 +9,8 @@ from chess_tournament.views.requests import Request
 from ..helpers import ConjugatedWord, write_list_in_file
 from ..states import State
 
+PROGRESS_REFRESH_PERIOD = 0.2  # seconds
+
 
 class CommonController:
     """Mixin class defining common tools to be used by other Controller mixin classes."""
@@ -18,6 +20,23 @@ class CommonController:
     view: IView
     context: Any
 
+    def wait_next_round(self, tournament_t: int) -> None:
+        """Show the background matchmaking progress until the next round is registered (Ctrl-C stopping the search)."""
+        if not self.model.is_next_round_pending(tournament_t):
+            return
+        is_stopped = False
+        while True:
+            try:
+                self.view.show_matchmaking_progress(*self.model.get_next_round_progress(tournament_t))
+                if self.model.collect_next_round(tournament_t, timeout=PROGRESS_REFRESH_PERIOD):
+                    break
+            except KeyboardInterrupt:
+                self.model.stop_next_round_search(tournament_t)
+                is_stopped = True
+        if is_stopped:
+            self.view.log(False, "Matchmaking search stopped: the best pairing found so far is used")
+        self.view.log(True, f"{self.model.get_total_matches(tournament_t)} matches >>> generated")
+
     def report(self, total: int, data_info: list, conjugated_name: ConjugatedWord, back_state: State) -> None:
         """Show the given list, deal with print and export requests, then back to the previous state."""
         request, _ = self.view.show_list_menu(total, conjugated_name.conjugated_with_number(total))
@@ -14,7 +14,7 @@ class ParticipantsController(CommonController):
 
     def show_manage_participants_menu(self) -> None:
         """Show the main participants menu and redirect the user’s request to the main state manager system."""
-        total_participants = len(list(self.model.get_participants_id(self.context)))
+        total_participants = len(self.model.get_participants_id(self.context))
         request, _ = self.view.show_manage_participants_menu(total_participants)
         if request == Request.ADD_PARTICIPANT:
             self.status = State.ADD_PARTICIPANT_MENU
@@ -28,11 +28,8 @@ class ParticipantsController(CommonController):
     def show_add_participant_menu(self) -> None:
         """Show the tournament participant registration menu, register the player, then back to the previous state."""
         selected_tournament = self.context
-        players_id = [
-            player_id
-            for player_id in self.model.get_players_id()
-            if player_id not in self.model.get_participants_id(selected_tournament)
-        ]
+        participants_id = self.model.get_participants_id(selected_tournament)
+        players_id = [player_id for player_id in self.model.get_players_id() if player_id not in participants_id]
         if not players_id:
             self.view.log(False, "No available players to add")
             self.status = State.MANAGE_PARTICIPANTS_MENU
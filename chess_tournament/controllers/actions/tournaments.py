@@ -1,7 +1,7 @@
 """Define tournaments related Controller’s behaviours."""
 
 from chess_tournament.controllers.states import State
-from chess_tournament.models.model import InconsistentDates
+from chess_tournament.models.model import InconsistentDates, UnreadyTournament
 from chess_tournament.views.requests import Request
 
 from ..helpers import ConjugatedWord
@@ -32,9 +32,21 @@ class TournamentsController(CommonController):
                 self.status = State.SELECT_TOURNAMENT_MENU
         elif request == Request.LIST_TOURNAMENTS:
             self.status = State.LIST_TOURNAMENTS_MENU
+        elif request == Request.GENERATE_NEXT_ROUNDS:
+            self.generate_next_rounds()
+            self.status = State.MANAGE_TOURNAMENTS_MENU
         else:
             self.status = State.MAIN_MENU
 
+    def generate_next_rounds(self) -> None:
+        """Generate at once the next round of all the tournaments whose last round ended, then log each result."""
+        tournaments_t = self.model.get_tournaments_awaiting_next_round()
+        if not tournaments_t:
+            self.view.log(False, "No tournament is awaiting its next round")
+            return
+        for log in self.model.generate_next_rounds(tournaments_t):
+            self.view.log(*log)
+
     def show_tournament_registration(self) -> None:
         """Show the tournament registration menu, register the tournament, then back to the previous state."""
         request, request_data = self.view.show_tournament_registration()
@@ -94,7 +106,12 @@ class TournamentsController(CommonController):
         if request == Request.MANAGE_PARTICIPANTS:
             self.status = State.MANAGE_PARTICIPANTS_MENU
         elif request == Request.GENERATE_MATCHES:
-            tournament_to_log, matches_to_log = self.model.start_tournament(selected_tournament)
+            try:
+                tournament_to_log, matches_to_log = self.model.start_tournament(selected_tournament)
+            except UnreadyTournament as err:
+                self.view.log(False, err.args[0] + " >>> not started")
+                self.status = State.MANAGE_UNREADY_TOURNAMENT_MENU
+                return
             self.view.log(True, f"Tournament: {tournament_to_log} >>> started")
             self.view.log(True, f"{matches_to_log} matches >>> generated")
             self.status = State.MANAGE_TOURNAMENT_MENU
@@ -104,6 +121,7 @@ class TournamentsController(CommonController):
     def show_manage_tournament_menu(self) -> None:
         """The selected tournament started, display the normal tournament menu, then deal with the user’s request."""
         selected_tournament = self.context
+        self.wait_next_round(selected_tournament)
         tournament_info = self.model.get_tournament_info(selected_tournament)
         if not self.model.get_total_all_matches(selected_tournament):
             self.status = State.MANAGE_UNREADY_TOURNAMENT_MENU
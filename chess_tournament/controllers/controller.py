@@ -1,8 +1,11 @@
 """Define the main Controller behaviour."""
 
 from pathlib import Path
+from typing import Any, Optional
 
+from chess_tournament.models.chessdata import PairingConfig
 from chess_tournament.models.model import Model
+from chess_tournament.models.storage import IStorage, JSONStorage
 from chess_tournament.views.interface import IView
 
 from .actions import (
@@ -24,13 +27,22 @@ class Controller(
 ):
     """Main Controller class (which inherits from specialized ones)."""
 
-    def __init__(self, view: IView, data_path: Path) -> None:
+    def __init__(
+        self,
+        view: IView,
+        data_path: Path,
+        storage_class: type[IStorage] = JSONStorage,
+        lazy_loading: bool = False,
+        pairing_config: Optional[PairingConfig] = None,
+        persistent_pairing_cache: bool = False,
+        pairing_overrides: Optional[dict[str, Any]] = None,
+    ) -> None:
         """Initialize the controller (with the given view) and load data from backup save."""
         # -- view --
         self.view = view
         # -- model --
-        self.model = Model(data_path)
-        players_load_log, tournaments_load_log = self.model.load()  # load previous data
+        self.model = Model(data_path, storage_class, pairing_config, persistent_pairing_cache, pairing_overrides)
+        players_load_log, tournaments_load_log = self.model.load(lazy_loading)  # load previous data
         self.view.log(*players_load_log)
         self.view.log(*tournaments_load_log)
         # -- controller --
@@ -62,3 +74,4 @@ class Controller(
 
         while self.status != State.QUIT:
             state_to_action[self.status]()  # execute the action corresponding to the current state
+        self.model.close()
@@ -1,5 +1,8 @@
 from .match import Match  # noqa: F401
+from .pairing_cache import PairingCache  # noqa: F401
+from .pairing_config import PairingConfig  # noqa: F401
 from .participant import Participant  # noqa: F401
 from .player import Player  # noqa: F401
 from .round import Round  # noqa: F401
-from .tournament import Tournament  # noqa: F401
+from .status_index import TournamentsStatusIndex  # noqa: F401
+from .tournament import Tournament, TournamentHeader, generate_encoded_next_round  # noqa: F401
@@ -0,0 +1,380 @@
+"""Define the Edmonds’ blossom algorithm, computing a maximum weight matching of a general graph in O(n³).
+
+The implementation follows the primal-dual method described by Z. Galil ("Efficient algorithms for finding maximum
+matching in graphs", ACM Computing Surveys, 1986), with integer weights so that all the computations are exact.
+"""
+
+from typing import Iterator
+
+Edge = tuple[int, int, int]  # vertex, other vertex, weight
+
+
+def max_weight_matching(edges: list[Edge], max_cardinality: bool = False) -> list[int]:
+    """Return the mate of each vertex (-1 if unmatched) in a maximum weight matching of the given graph.
+
+    The vertices are the integers from 0 to the greatest vertex of the edges. If max_cardinality is True, the matching
+    has the maximum weight among the matchings of maximum cardinality."""
+    if not edges:
+        return []
+
+    total_edges = len(edges)
+    total_vertices = 1 + max(max(vertex, other_vertex) for vertex, other_vertex, _ in edges)
+    max_weight = max(0, max(weight for _, _, weight in edges))
+
+    # the endpoints of the edge k are 2k and 2k + 1 (so p ^ 1 is the opposite endpoint of p)
+    endpoint = [edges[p // 2][p % 2] for p in range(2 * total_edges)]
+    # the remote endpoints of the edges incident to each vertex
+    neighbors_endpoints: list[list[int]] = [[] for _ in range(total_vertices)]
+    for k, (vertex, other_vertex, _) in enumerate(edges):
+        neighbors_endpoints[vertex].append(2 * k + 1)
+        neighbors_endpoints[other_vertex].append(2 * k)
+
+    # the remote endpoint of the matched edge of each vertex (-1 if single)
+    mate = [-1] * total_vertices
+    # blossoms are numbered from total_vertices, a single vertex being a trivial blossom
+    # label of each top-level blossom (and vertex): 0 free, 1 S-blossom, 2 T-blossom
+    label = [0] * (2 * total_vertices)
+    # the endpoint through which a labeled blossom (or vertex) was reached
+    label_end = [-1] * (2 * total_vertices)
+    in_blossom = list(range(total_vertices))
+    blossom_parent = [-1] * (2 * total_vertices)
+    blossom_children: list[list[int] | None] = [None] * (2 * total_vertices)
+    blossom_base = list(range(total_vertices)) + [-1] * total_vertices
+    # the endpoints of the edges connecting the sub-blossoms of each blossom
+    blossom_endpoints: list[list[int] | None] = [None] * (2 * total_vertices)
+    # the least-slack edge to a different S-blossom (or from a free vertex to an S-vertex)
+    best_edge = [-1] * (2 * total_vertices)
+    blossom_best_edges: list[list[int] | None] = [None] * (2 * total_vertices)
+    unused_blossoms = list(range(total_vertices, 2 * total_vertices))
+    dual_variable = [max_weight] * total_vertices + [0] * total_vertices
+    # the edges with zero slack (allowed to be used to grow the alternating trees)
+    allowed_edge = [False] * total_edges
+    queue: list[int] = []
+
+    def slack(k: int) -> int:
+        """Return 2 × the slack of the edge k (no blossom containing it)."""
+        vertex, other_vertex, weight = edges[k]
+        return dual_variable[vertex] + dual_variable[other_vertex] - 2 * weight
+
+    def blossom_leaves(blossom: int) -> Iterator[int]:
+        """Yield the vertices of the given blossom."""
+        if blossom < total_vertices:
+            yield blossom
+        else:
+            for child in blossom_children[blossom]:
+                if child < total_vertices:
+                    yield child
+                else:
+                    yield from blossom_leaves(child)
+
+    def assign_label(vertex: int, vertex_label: int, p: int) -> None:
+        """Label a free vertex and its top-level blossom, reached through the endpoint p."""
+        blossom = in_blossom[vertex]
+        label[vertex] = label[blossom] = vertex_label
+        label_end[vertex] = label_end[blossom] = p
+        best_edge[vertex] = best_edge[blossom] = -1
+        if vertex_label == 1:
+            queue.extend(blossom_leaves(blossom))
+        else:  # the mate of the T-blossom base becomes an S-vertex
+            base = blossom_base[blossom]
+            assign_label(endpoint[mate[base]], 1, mate[base] ^ 1)
+
+    def scan_blossom(vertex: int, other_vertex: int) -> int:
+        """Trace back from two S-vertices, return the base of the new blossom or -1 if there is an augmenting path."""
+        path = []
+        base = -1
+        while vertex != -1 or other_vertex != -1:
+            blossom = in_blossom[vertex]
+            if label[blossom] & 4:  # already visited from the other vertex
+                base = blossom_base[blossom]
+                break
+            path.append(blossom)
+            label[blossom] = 5
+            if label_end[blossom] == -1:  # root of the alternating tree
+                vertex = -1
+            else:
+                vertex = endpoint[label_end[blossom]]
+                vertex = endpoint[label_end[in_blossom[vertex]]]
+            if other_vertex != -1:
+                vertex, other_vertex = other_vertex, vertex
+        for blossom in path:
+            label[blossom] = 1
+        return base
+
+    def add_blossom(base: int, k: int) -> None:
+        """Build a new blossom from the given base and the edge k connecting two S-vertices."""
+        vertex, other_vertex, _ = edges[k]
+        base_blossom = in_blossom[base]
+        vertex_blossom = in_blossom[vertex]
+        other_vertex_blossom = in_blossom[other_vertex]
+        blossom = unused_blossoms.pop()
+        blossom_base[blossom] = base
+        blossom_parent[blossom] = -1
+        blossom_parent[base_blossom] = blossom
+        blossom_children[blossom] = path = []
+        blossom_endpoints[blossom] = endpoints = []
+        # trace back from the vertex to the base
+        while vertex_blossom != base_blossom:
+            blossom_parent[vertex_blossom] = blossom
+            path.append(vertex_blossom)
+            endpoints.append(label_end[vertex_blossom])
+            vertex_blossom = in_blossom[endpoint[label_end[vertex_blossom]]]
+        path.append(base_blossom)
+        path.reverse()
+        endpoints.reverse()
+        endpoints.append(2 * k)
+        # trace back from the other vertex to the base
+        while other_vertex_blossom != base_blossom:
+            blossom_parent[other_vertex_blossom] = blossom
+            path.append(other_vertex_blossom)
+            endpoints.append(label_end[other_vertex_blossom] ^ 1)
+            other_vertex_blossom = in_blossom[endpoint[label_end[other_vertex_blossom]]]
+        label[blossom] = 1
+        label_end[blossom] = label_end[base_blossom]
+        dual_variable[blossom] = 0
+        for leaf in blossom_leaves(blossom):
+            if label[in_blossom[leaf]] == 2:  # former T-vertices become S-vertices
+                queue.append(leaf)
+            in_blossom[leaf] = blossom
+        # compute the least-slack edges to the other S-blossoms
+        best_edge_to = [-1] * (2 * total_vertices)
+        for child in path:
+            if blossom_best_edges[child] is None:
+                neighbors_lists = [[p // 2 for p in neighbors_endpoints[leaf]] for leaf in blossom_leaves(child)]
+            else:
+                neighbors_lists = [blossom_best_edges[child]]
+            for neighbors_list in neighbors_lists:
+                for edge_k in neighbors_list:
+                    edge_vertex, edge_other_vertex, _ = edges[edge_k]
+                    if in_blossom[edge_other_vertex] == blossom:
+                        edge_vertex, edge_other_vertex = edge_other_vertex, edge_vertex
+                    other_blossom = in_blossom[edge_other_vertex]
+                    if (
+                        other_blossom != blossom
+                        and label[other_blossom] == 1
+                        and (best_edge_to[other_blossom] == -1 or slack(edge_k) < slack(best_edge_to[other_blossom]))
+                    ):
+                        best_edge_to[other_blossom] = edge_k
+            blossom_best_edges[child] = None
+            best_edge[child] = -1
+        blossom_best_edges[blossom] = [edge_k for edge_k in best_edge_to if edge_k != -1]
+        best_edge[blossom] = -1
+        for edge_k in blossom_best_edges[blossom]:
+            if best_edge[blossom] == -1 or slack(edge_k) < slack(best_edge[blossom]):
+                best_edge[blossom] = edge_k
+
+    def expand_blossom(blossom: int, is_end_stage: bool) -> None:
+        """Expand the given top-level blossom into its sub-blossoms."""
+        for child in blossom_children[blossom]:
+            blossom_parent[child] = -1
+            if child < total_vertices:
+                in_blossom[child] = child
+            elif is_end_stage and dual_variable[child] == 0:
+                expand_blossom(child, is_end_stage)
+            else:
+                for leaf in blossom_leaves(child):
+                    in_blossom[leaf] = child
+        if not is_end_stage and label[blossom] == 2:
+            # relabel the sub-blossoms on the even length path from the entry child to the base
+            entry_child = in_blossom[endpoint[label_end[blossom] ^ 1]]
+            j = blossom_children[blossom].index(entry_child)
+            if j & 1:  # go forward and wrap
+                j -= len(blossom_children[blossom])
+                j_step, endpoint_trick = 1, 0
+            else:  # go backward
+                j_step, endpoint_trick = -1, 1
+            p = label_end[blossom]
+            while j != 0:
+                label[endpoint[p ^ 1]] = 0
+                label[endpoint[blossom_endpoints[blossom][j - endpoint_trick] ^ endpoint_trick ^ 1]] = 0
+                assign_label(endpoint[p ^ 1], 2, p)
+                allowed_edge[blossom_endpoints[blossom][j - endpoint_trick] // 2] = True
+                j += j_step
+                p = blossom_endpoints[blossom][j - endpoint_trick] ^ endpoint_trick
+                allowed_edge[p // 2] = True
+                j += j_step
+            # relabel the base T-sub-blossom without creating a new S-vertex
+            child = blossom_children[blossom][j]
+            label[endpoint[p ^ 1]] = label[child] = 2
+            label_end[endpoint[p ^ 1]] = label_end[child] = p
+            best_edge[child] = -1
+            # unlabel the sub-blossoms not on the path, unless one of their vertices was reached
+            j += j_step
+            while blossom_children[blossom][j] != entry_child:
+                child = blossom_children[blossom][j]
+                if label[child] == 1:
+                    j += j_step
+                    continue
+                reached_leaf = next((leaf for leaf in blossom_leaves(child) if label[leaf] != 0), None)
+                if reached_leaf is not None:
+                    label[reached_leaf] = 0
+                    label[endpoint[mate[blossom_base[child]]]] = 0
+                    assign_label(reached_leaf, 2, label_end[reached_leaf])
+                j += j_step
+        label[blossom] = label_end[blossom] = -1
+        blossom_children[blossom] = blossom_endpoints[blossom] = None
+        blossom_base[blossom] = -1
+        blossom_best_edges[blossom] = None
+        best_edge[blossom] = -1
+        unused_blossoms.append(blossom)
+
+    def augment_blossom(blossom: int, vertex: int) -> None:
+        """Swap the matched and unmatched edges of the path from the given vertex to the base of the blossom."""
+        child = vertex
+        while blossom_parent[child] != blossom:
+            child = blossom_parent[child]
+        if child >= total_vertices:
+            augment_blossom(child, vertex)
+        i = j = blossom_children[blossom].index(child)
+        if i & 1:  # go forward and wrap
+            j -= len(blossom_children[blossom])
+            j_step, endpoint_trick = 1, 0
+        else:  # go backward
+            j_step, endpoint_trick = -1, 1
+        while j != 0:
+            j += j_step
+            child = blossom_children[blossom][j]
+            p = blossom_endpoints[blossom][j - endpoint_trick] ^ endpoint_trick
+            if child >= total_vertices:
+                augment_blossom(child, endpoint[p])
+            j += j_step
+            child = blossom_children[blossom][j]
+            if child >= total_vertices:
+                augment_blossom(child, endpoint[p ^ 1])
+            mate[endpoint[p]] = p ^ 1
+            mate[endpoint[p ^ 1]] = p
+        # rotate the sub-blossoms so that the vertex becomes the new base
+        blossom_children[blossom] = blossom_children[blossom][i:] + blossom_children[blossom][:i]
+        blossom_endpoints[blossom] = blossom_endpoints[blossom][i:] + blossom_endpoints[blossom][:i]
+        blossom_base[blossom] = blossom_base[blossom_children[blossom][0]]
+
+    def augment_matching(k: int) -> None:
+        """Swap the matched and unmatched edges of the augmenting path going through the edge k."""
+        vertex, other_vertex, _ = edges[k]
+        for s, p in ((vertex, 2 * k + 1), (other_vertex, 2 * k)):
+            while True:
+                s_blossom = in_blossom[s]
+                if s_blossom >= total_vertices:
+                    augment_blossom(s_blossom, s)
+                mate[s] = p
+                if label_end[s_blossom] == -1:  # root of the alternating tree
+                    break
+                t = endpoint[label_end[s_blossom]]
+                t_blossom = in_blossom[t]
+                s = endpoint[label_end[t_blossom]]
+                j = endpoint[label_end[t_blossom] ^ 1]
+                if t_blossom >= total_vertices:
+                    augment_blossom(t_blossom, j)
+                mate[j] = label_end[t_blossom]
+                p = label_end[t_blossom] ^ 1
+
+    for _ in range(total_vertices):  # each stage augments the matching by one edge (or ends the search)
+        label[:] = [0] * (2 * total_vertices)
+        best_edge[:] = [-1] * (2 * total_vertices)
+        blossom_best_edges[total_vertices:] = [None] * total_vertices
+        allowed_edge[:] = [False] * total_edges
+        queue[:] = []
+        for vertex in range(total_vertices):
+            if mate[vertex] == -1 and label[in_blossom[vertex]] == 0:
+                assign_label(vertex, 1, -1)
+
+        is_augmented = False
+        while True:
+            # grow the alternating trees from the S-vertices
+            while queue and not is_augmented:
+                vertex = queue.pop()
+                for p in neighbors_endpoints[vertex]:
+                    k = p // 2
+                    other_vertex = endpoint[p]
+                    if in_blossom[vertex] == in_blossom[other_vertex]:
+                        continue
+                    if not allowed_edge[k]:
+                        k_slack = slack(k)
+                        if k_slack <= 0:
+                            allowed_edge[k] = True
+                    if allowed_edge[k]:
+                        if label[in_blossom[other_vertex]] == 0:
+                            assign_label(other_vertex, 2, p ^ 1)
+                        elif label[in_blossom[other_vertex]] == 1:
+                            base = scan_blossom(vertex, other_vertex)
+                            if base >= 0:
+                                add_blossom(base, k)
+                            else:
+                                augment_matching(k)
+                                is_augmented = True
+                                break
+                        elif label[other_vertex] == 0:  # unreached vertex inside a T-blossom
+                            label[other_vertex] = 2
+                            label_end[other_vertex] = p ^ 1
+                    elif label[in_blossom[other_vertex]] == 1:
+                        blossom = in_blossom[vertex]
+                        if best_edge[blossom] == -1 or k_slack < slack(best_edge[blossom]):
+                            best_edge[blossom] = k
+                    elif label[other_vertex] == 0:
+                        if best_edge[other_vertex] == -1 or k_slack < slack(best_edge[other_vertex]):
+                            best_edge[other_vertex] = k
+            if is_augmented:
+                break
+
+            # no augmenting path found with the allowed edges: update the dual variables
+            delta_type, delta, delta_edge, delta_blossom = -1, 0, -1, -1
+            if not max_cardinality:  # the dual variable of a single vertex reaches zero
+                delta_type, delta = 1, min(dual_variable[:total_vertices])
+            for vertex in range(total_vertices):  # an edge from a free vertex to an S-vertex gets a zero slack
+                if label[in_blossom[vertex]] == 0 and best_edge[vertex] != -1:
+                    vertex_delta = slack(best_edge[vertex])
+                    if delta_type == -1 or vertex_delta < delta:
+                        delta_type, delta, delta_edge = 2, vertex_delta, best_edge[vertex]
+            for blossom in range(2 * total_vertices):  # an edge between two S-blossoms gets a zero slack
+                if blossom_parent[blossom] == -1 and label[blossom] == 1 and best_edge[blossom] != -1:
+                    blossom_delta = slack(best_edge[blossom]) // 2
+                    if delta_type == -1 or blossom_delta < delta:
+                        delta_type, delta, delta_edge = 3, blossom_delta, best_edge[blossom]
+            for blossom in range(total_vertices, 2 * total_vertices):  # a T-blossom dual variable reaches zero
+                if (
+                    blossom_base[blossom] >= 0
+                    and blossom_parent[blossom] == -1
+                    and label[blossom] == 2
+                    and (delta_type == -1 or dual_variable[blossom] < delta)
+                ):
+                    delta_type, delta, delta_blossom = 4, dual_variable[blossom], blossom
+            if delta_type == -1:  # maximum cardinality reached, final update to end the search
+                delta_type, delta = 1, max(0, min(dual_variable[:total_vertices]))
+
+            for vertex in range(total_vertices):
+                if label[in_blossom[vertex]] == 1:
+                    dual_variable[vertex] -= delta
+                elif label[in_blossom[vertex]] == 2:
+                    dual_variable[vertex] += delta
+            for blossom in range(total_vertices, 2 * total_vertices):
+                if blossom_base[blossom] >= 0 and blossom_parent[blossom] == -1:
+                    if label[blossom] == 1:
+                        dual_variable[blossom] += delta
+                    elif label[blossom] == 2:
+                        dual_variable[blossom] -= delta
+
+            if delta_type == 1:  # optimum reached
+                break
+            elif delta_type == 2:
+                allowed_edge[delta_edge] = True
+                vertex, other_vertex, _ = edges[delta_edge]
+                queue.append(vertex if label[in_blossom[vertex]] != 0 else other_vertex)
+            elif delta_type == 3:
+                allowed_edge[delta_edge] = True
+                queue.append(edges[delta_edge][0])
+            else:
+                expand_blossom(delta_blossom, False)
+
+        if not is_augmented:
+            break
+        # expand the S-blossoms whose dual variable reached zero
+        for blossom in range(total_vertices, 2 * total_vertices):
+            if (
+                blossom_parent[blossom] == -1
+                and blossom_base[blossom] >= 0
+                and label[blossom] == 1
+                and dual_variable[blossom] == 0
+            ):
+                expand_blossom(blossom, True)
+
+    return [endpoint[mate[vertex]] if mate[vertex] >= 0 else -1 for vertex in range(total_vertices)]
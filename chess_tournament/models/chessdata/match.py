@@ -50,6 +50,7 @@ class Match(Serializable):
     def register_score(self, participants_status: tuple[Points, Points]) -> None:
         """Register the score in the match attribute and update participant total tournament score."""
         self.participants_scores = participants_status
+        self.set_dirty()
         for participant, score in zip(self.participants_pair, self.participants_scores):
             participant.add_score(score.value)
 
@@ -63,26 +64,15 @@ class Match(Serializable):
         }
 
     @classmethod
-    def decode(cls, encoded_data: dict[str, Any], participants_db: list[Participant]) -> Self:
-        """Instantiate a new object from data in JSON format."""
-
-        def get_participant_index_from_player_id(player_id: str) -> int:
-            """Return the participant index from its player ID."""
-            for p_index, participant in enumerate(participants_db):
-                if participant.player.identifier == player_id:
-                    return p_index
-            return -1
-
+    def decode(cls, encoded_data: dict[str, Any], participants_db: dict[str, Participant]) -> Self:
+        """Instantiate a new object from data in JSON format (participants being indexed by their player ID)."""
         encoded_data["participants_scores"] = (
             tuple([cls.Points[encoded_score] for encoded_score in encoded_data["participants_scores"]])
             if encoded_data["participants_scores"]
             else None
         )
         encoded_data["participants_pair"] = tuple(
-            [
-                participants_db[get_participant_index_from_player_id(encoded_participant)]
-                for encoded_participant in encoded_data["participants_pair"]
-            ]
+            [participants_db[encoded_participant] for encoded_participant in encoded_data["participants_pair"]]
         )
 
         return cls(**encoded_data)
@@ -1,86 +1,81 @@
 """Define matchmaking related data structures."""
 
 import random
-from itertools import combinations
-
-from ortools.sat.python import cp_model
+from itertools import product
+from typing import Optional
 
 from ..chessdata import Match, Participant, Round
-
-
-def solve_by_constraints(
-    participants: list[Participant], remaining_matches_possibilities: set[tuple[Participant, Participant]]
-) -> list[tuple[Participant, Participant]] | None:
-    """Return a list of participants pairs generated using constraints solver.
-
-    in formal methods, a SAT solver aims to solve the boolean satisfiability (SAT) problem
-    cp = Constraint Programming
-    here we want :
-    - to select exactly one match per player from all possible (remaining) combination of 2
-    - to consider the global minimal score difference between players (calculated for each possibility)
-    """
-
-    def weight(participants_pair: tuple[Participant, Participant], match_model_variable: cp_model.IntVar) -> int:
-        """Privilege the smallest score gaps for matchmaking."""
-        return match_model_variable * (abs(participants_pair[0].score - participants_pair[1].score) ** 2)
-
-    model = cp_model.CpModel()
-    solver = cp_model.CpSolver()
-
-    matches_model_variables = {}
-    for match in remaining_matches_possibilities:
-        # specify to model that a match (e.g. pairing players A & B) can be True or False (i.e. selected or not)
-        match_model_variable = model.NewBoolVar(f"{str(match[0])}-{str(match[1])}")
-        matches_model_variables[match] = match_model_variable
-
-    # specify to model the constraint that only one match per player can be selected at the same time
-    # e.g. AB or AC or AD (i.e. AB + AC + AD = 1)
-    for player in participants:
-        player_matches_model_variables = [
-            model_variable for match, model_variable in matches_model_variables.items() if player in match
-        ]
-        model.Add(sum(player_matches_model_variables) == 1)
-
-    # specify to model how to select the best choice by giving a weight to each possibility
-    # here based on players scores difference
-    model.Minimize(
-        sum(
-            (
-                weight(players_pair, match_model_variable)
-                for players_pair, match_model_variable in matches_model_variables.items()
-            )
-        )
-    )
-
-    # call the solver to find the best solution respecting the given constraints
-    # i.e. selecting exactly one match per player AND selecting minimal weight
-    status = solver.Solve(model)
-    if status == cp_model.OPTIMAL:
-        solution = [
-            players_pair for players_pair, match_var in matches_model_variables.items() if solver.Value(match_var)
-        ]
-    else:
-        solution = None
-    return solution
+from .pairing_cache import PairingCache
+from .pairing_config import PairingConfig
+from .pairing_engines import MatchingEngine, PairingEngine, get_pairing_engine_class
+from .played_pairs import PlayedPairs
+from .round_robin import RoundSchedule, berger_schedule, scheduled_pairs
+from .score_groups import ScoreGroupsEngine
 
 
 class MatchMaking:
     """Do the matchmaking by generating list of participant pairs (matches)."""
 
-    def _update_remaining_matches_possibilities(self, matches_list: list[tuple[Participant, Participant]]) -> None:
-        """Remove current round matches from the not done/remaining matches possibilities."""
-        self._remaining_matches_possibilities -= set(matches_list)
-
-    def reconstruct_remaining_possibilities_from_past_matches(
-        self, participants: list[Participant], rounds: list[Round]
-    ) -> None:
-        self._generate_all_matches_possibilities(participants)
+    pairing_config: PairingConfig
+    total_rounds: int
+    round_robin: bool
+    round_robin_schedule: Optional[list[RoundSchedule]]
+
+    def __init__(self) -> None:
+        self.pairing_cache = PairingCache()  # the model gives its own to the tournaments it loads (shared by them)
+        self._played_pairs = PlayedPairs([])
+        self._pairing_engine: Optional[PairingEngine] = None
+        self.pairing_stats: dict[str, float | None] = {}
+        self._speculative_states: Optional[list[PlayedPairs]] = None  # states of the last speculative pairing
+        self._speculative_engines: list[PairingEngine] = []  # engines of the running speculative pairing
+
+    @property
+    def pairing_engine(self) -> PairingEngine:
+        """Return the matchmaking by score engine set by the pairing config (kept from round to round)."""
+        if self.pairing_config.decomposition:
+            engine_class = ScoreGroupsEngine
+        else:
+            engine_class = get_pairing_engine_class(self.pairing_config.engine)
+        if not isinstance(self._pairing_engine, engine_class):
+            self._pairing_engine = engine_class()
+        return self._pairing_engine
+
+    @property
+    def matching_engine(self) -> MatchingEngine:
+        """Return the engine pairing the whole tournament at once (the score groups engine relying on it)."""
+        return self._matching_engine_of(self.pairing_engine)
+
+    def _matching_engine_of(self, pairing_engine: PairingEngine) -> MatchingEngine:
+        """Return the given engine if it pairs the whole tournament at once, a new matching engine otherwise."""
+        if isinstance(pairing_engine, MatchingEngine):
+            return pairing_engine
+        return get_pairing_engine_class(self.pairing_config.engine)()
+
+    def stop_pairing(self) -> None:
+        """Ask the pairing engine to stop its search (from another thread than the matchmaking one)."""
+        self.pairing_engine.stop()
+
+    def _record_pairing_stats(self, pairing_engine: PairingEngine) -> None:
+        """Keep the last matchmaking by score metadata, to be reported in the round."""
+        self.pairing_stats = {
+            "pairing_build_time": pairing_engine.build_time,
+            "pairing_solve_time": pairing_engine.solve_time,
+            "hints_saved_time": pairing_engine.hints_saved_time,
+        }
+
+    def _register_played_pairs(self, matches_list: list[tuple[Participant, Participant]]) -> None:
+        """Register current round matches as played (i.e. removed from the remaining matches possibilities)."""
+        for participants_pair in matches_list:
+            self._played_pairs.add(participants_pair)
+
+    def reconstruct_played_pairs_from_past_matches(self, participants: list[Participant], rounds: list[Round]) -> None:
+        self._reset_played_pairs(participants)
         past_pairs = [match.participants_pair for round in rounds for match in round.matches]
-        self._update_remaining_matches_possibilities(past_pairs)
+        self._register_played_pairs(past_pairs)
 
-    def _generate_all_matches_possibilities(self, participants: list[Participant]) -> None:
-        """Generate all possible combination of 2 from a list of participants."""
-        self._remaining_matches_possibilities = set(combinations(participants, 2))
+    def _reset_played_pairs(self, participants: list[Participant]) -> None:
+        """Make all the combinations of 2 participants possible again."""
+        self._played_pairs = PlayedPairs(participants)
 
     @staticmethod
     def _generate_pairs_random(participants: list[Participant]) -> list[tuple[Participant, Participant]]:
@@ -89,31 +84,131 @@ class MatchMaking:
         pairs = list(zip(shuffled_participants[::2], shuffled_participants[1::2]))
         return pairs
 
-    def _generate_pairs_from_score(self, participants: list[Participant]) -> list[tuple[Participant, Participant]]:
-        """Generate list of participant pairs using a constraints solver to do the matchmaking."""
+    def _generate_pairs_greedy(self, participants: list[Participant]) -> list[tuple[Participant, Participant]]:
+        """Generate list of participant pairs with a fast greedy matchmaking by score (random if it is incomplete)."""
+        slots_pairs = self._played_pairs.greedy_slots_pairs()
+        if 2 * len(slots_pairs) < len(participants):  # some participants have met all the following ones
+            return self._generate_pairs_random(participants)
+        participants = self._played_pairs.participants
+        return [(participants[first_slot], participants[second_slot]) for first_slot, second_slot in slots_pairs]
+
+    def _solve_pairs(
+        self, played_pairs: PlayedPairs, pairing_engine: PairingEngine
+    ) -> tuple[list[tuple[Participant, Participant]] | None, PairingEngine]:
+        """Return the pairs of the matchmaking by score of the given state (None if none found) and the engine used."""
+        if played_pairs.has_perfect_matching():
+            return pairing_engine.solve(played_pairs, self.pairing_config), pairing_engine
+        # some participants have to play again against an opponent, as few as possible
+        matching_engine = self._matching_engine_of(pairing_engine)
+        return matching_engine.solve_relaxed(played_pairs, self.pairing_config), matching_engine
+
+    def speculative_states(self, open_pairs: list[tuple[Participant, Participant]]) -> list[PlayedPairs]:
+        """Return the next round matchmaking states of every outcome (WIN/LOSE/DRAW) of the given open matches.
+
+        The states are detached copies of the played pairs, which can be solved while the matches go on (only the
+        last returned states being solved by the speculative pairing)."""
+        open_slots_pairs = [self._played_pairs.slots_pair(participants_pair) for participants_pair in open_pairs]
+        states = []
+        for outcome in product(Match.Points, repeat=len(open_pairs)):
+            played_pairs = self._played_pairs.copy()
+            if played_pairs.is_exhausted:  # as the matchmaking does, all pairs are possible again
+                played_pairs.clear()
+            for slots_pair, first_result in zip(open_slots_pairs, outcome):
+                for slot, points in zip(slots_pair, Match.get_pairs_score_from_first(first_result)):
+                    played_pairs.participants[slot].score += points.value
+            states.append(played_pairs)
+        self._speculative_states = states
+        return states
+
+    def speculate_pairs(self, states: list[PlayedPairs]) -> int:
+        """Solve the matchmaking by score of the given states into the pairing cache, until they are outdated.
+
+        Return the number of states whose pairing is cached."""
+        pairing_engine = type(self.pairing_engine)()  # the tournament engine is kept for the actual matchmaking
+        speculative_engines = [pairing_engine, self._matching_engine_of(pairing_engine)]
+        self._speculative_engines.extend(speculative_engines)
+        total_cached = 0
+        try:
+            for played_pairs in states:
+                if states is not self._speculative_states:  # stopped or replaced by a new speculative pairing
+                    break
+                cache_key = self.pairing_cache.key(played_pairs, self.pairing_config)
+                if cache_key not in self.pairing_cache:
+                    pairs, used_engine = self._solve_pairs(played_pairs, pairing_engine)
+                    if pairs is None or used_engine.is_stop_requested:
+                        continue
+                    self.pairing_cache.put(cache_key, pairs)
+                total_cached += 1
+        finally:
+            for speculative_engine in speculative_engines:
+                self._speculative_engines.remove(speculative_engine)
+        return total_cached
+
+    def stop_speculation(self) -> None:
+        """Ask the speculative pairing to stop (from another thread than the matchmaking one)."""
+        self._speculative_states = None
+        for speculative_engine in list(self._speculative_engines):
+            speculative_engine.stop()
 
-        # generate all possibilities of matches pairs
-        # (it is useful for the matchmaking by score and to avoid duplicate encounters)
-        # initialized at the first round and when the list of remaining possibilities is exhausted
-        if self._remaining_matches_possibilities is None or not self._remaining_matches_possibilities:
-            self._generate_all_matches_possibilities(participants)
+    def _generate_pairs_from_score(self, participants: list[Participant]) -> list[tuple[Participant, Participant]]:
+        """Generate list of participant pairs using the pairing engine to do the matchmaking."""
+
+        # the played pairs are excluded from the matchmaking by score (to avoid duplicate encounters)
+        # all pairs are possible again when the remaining possibilities are exhausted
+        if self._played_pairs.is_exhausted:
+            self._reset_played_pairs(participants)
+
+        cache_key = self.pairing_cache.key(self._played_pairs, self.pairing_config)
+        pairs = self.pairing_cache.get(cache_key, self._played_pairs)
+        if pairs is not None:  # already seen matchmaking state (e.g. replayed round or speculative pairing)
+            self.pairing_stats = {}  # not solved: no timings to report
+            return pairs
+
+        pairs, pairing_engine = self._solve_pairs(self._played_pairs, self.pairing_engine)
+        self._record_pairing_stats(pairing_engine)
+
+        if pairs is None:  # no solution found in time (or the isolated solver process was killed)
+            return self._generate_pairs_greedy(participants)
+        if not pairing_engine.is_stop_requested:  # a stopped search pairing may not be the best one
+            self.pairing_cache.put(cache_key, pairs)
+        return pairs
 
-        pairs = solve_by_constraints(participants, self._remaining_matches_possibilities)
+    def is_next_pairing_cached(self) -> bool:
+        """Return True if the matchmaking by score of the current state is served by the pairing cache."""
+        played_pairs = self._played_pairs
+        if played_pairs.is_exhausted:  # as the matchmaking does, all pairs are possible again
+            played_pairs = PlayedPairs(played_pairs.participants)
+        return self.pairing_cache.key(played_pairs, self.pairing_config) in self.pairing_cache
 
-        if pairs is None:  # no solution with the given constraints
-            self._generate_all_matches_possibilities(participants)  # safety-net
-            pairs = self._generate_pairs_from_score(participants)
-        return pairs
+    def register_generated_pairs(
+        self, total_started_rounds: int, participants: list[Participant], pairs: list[tuple[Participant, Participant]]
+    ) -> None:
+        """Register the pairs of a matchmaking done elsewhere (e.g. in a worker process) as generate_pairs does."""
+        if total_started_rounds == 0 or self._played_pairs.is_exhausted:
+            self._reset_played_pairs(participants)
+        if total_started_rounds > 0:
+            self.pairing_cache.put(self.pairing_cache.key(self._played_pairs, self.pairing_config), pairs)
+        self._register_played_pairs(pairs)
 
     def generate_pairs(self, total_started_rounds: int, participants: list[Participant]) -> tuple[Match, ...]:
         """Do the matchmaking by generating list of participant pairs (matches)."""
 
-        if total_started_rounds == 0:
-            self._generate_all_matches_possibilities(participants)
+        if self.round_robin:
+            if total_started_rounds == 0:  # the whole schedule is computed once, each round being looked up
+                self._reset_played_pairs(participants)
+                self.round_robin_schedule = berger_schedule(len(participants), self.total_rounds)
+            pairs_list = [
+                (participants[white], participants[black])
+                for white, black in scheduled_pairs(self.round_robin_schedule, total_started_rounds)
+            ]
+            self.pairing_stats = {}
+        elif total_started_rounds == 0:
+            self._reset_played_pairs(participants)
             pairs_list = self._generate_pairs_random(participants)  # first round is generated randomly
+            self.pairing_stats = {}
         else:
-            # after the first round, matchmaking is realized by a solver
+            # after the first round, matchmaking is realized by the pairing engine
             pairs_list = self._generate_pairs_from_score(participants)
 
-        self._update_remaining_matches_possibilities(pairs_list)  # to avoid duplicate encounters
+        self._register_played_pairs(pairs_list)  # to avoid duplicate encounters
         return tuple(Match(pair) for pair in pairs_list)
@@ -0,0 +1,102 @@
+"""Define the pairing cache, which serves the matchmaking by score of an already seen state without solving it."""
+
+import json
+from collections import OrderedDict
+from hashlib import blake2b
+from pathlib import Path
+from typing import Any, Optional
+
+from .pairing_config import PairingConfig
+from .participant import Participant
+from .played_pairs import PlayedPairs
+
+PlayersIdsPair = tuple[str, str]
+
+
+class PairingCache:
+    """Map a content hash of the matchmaking state (participants scores, played pairs and pairing config) to its pairs.
+
+    The most recently used pairings are kept in memory, and also in one JSON file per pairing if a cache directory is
+    given (so that the pairings survive the application restarts)."""
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_entries: int = 1024) -> None:
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, list[PlayersIdsPair]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the settings only (e.g. for a worker process, sharing the cache directory but not the memory)."""
+        return {"cache_dir": self.cache_dir, "max_entries": self.max_entries}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(**state)
+
+    @staticmethod
+    def key(played_pairs: PlayedPairs, pairing_config: PairingConfig) -> str:
+        """Return the content hash of the matchmaking state."""
+        state_hash = blake2b(digest_size=16)
+        state_hash.update(json.dumps(pairing_config.encode(), sort_keys=True).encode())
+        state_hash.update(played_pairs.fingerprint())
+        return state_hash.hexdigest()
+
+    def _entry_file(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def __contains__(self, key: str) -> bool:
+        """Return True if the pairing of the given state is cached (without counting a hit or a miss)."""
+        return key in self._entries or (self.cache_dir is not None and self._entry_file(key).exists())
+
+    def get(self, key: str, played_pairs: PlayedPairs) -> list[tuple[Participant, Participant]] | None:
+        """Return the cached participants pairs of the given state, None if they are not cached."""
+        players_ids_pairs = self._entries.get(key)
+        if players_ids_pairs is not None:
+            self._entries.move_to_end(key)
+        elif self.cache_dir is not None:
+            try:
+                with open(self._entry_file(key), "r", encoding="utf-8") as entry_file:
+                    players_ids_pairs = [tuple(players_ids_pair) for players_ids_pair in json.load(entry_file)]
+            except (OSError, ValueError):
+                pass
+            else:
+                self._remember(key, players_ids_pairs)
+        if players_ids_pairs is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        participants = played_pairs.participants
+        return [
+            (participants[played_pairs.slots[first_id]], participants[played_pairs.slots[second_id]])
+            for first_id, second_id in players_ids_pairs
+        ]
+
+    def _remember(self, key: str, players_ids_pairs: list[PlayersIdsPair]) -> None:
+        """Keep the pairing in memory, forgetting the least recently used one if the cache is full."""
+        self._entries[key] = players_ids_pairs
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def put(self, key: str, pairs: list[tuple[Participant, Participant]]) -> None:
+        """Cache the participants pairs of the given state."""
+        players_ids_pairs = [(first.player.identifier, second.player.identifier) for first, second in pairs]
+        self._remember(key, players_ids_pairs)
+        if self.cache_dir is not None:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                temporary_path = self._entry_file(key).with_suffix(".tmp")
+                with open(temporary_path, "w", encoding="utf-8") as entry_file:
+                    json.dump(players_ids_pairs, entry_file)
+                temporary_path.replace(self._entry_file(key))
+            except OSError:  # the pairing stays cached in memory only
+                pass
+
+    @property
+    def statistics(self) -> dict[str, int]:
+        """Return the number of hits, misses and pairings kept in memory."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+    def clear(self) -> None:
+        """Forget the pairings kept in memory (the files of the cache directory being kept)."""
+        self._entries.clear()
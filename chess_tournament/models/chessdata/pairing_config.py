@@ -0,0 +1,55 @@
+"""Define the matchmaking by score settings."""
+
+from dataclasses import dataclass
+from typing import Any, Optional, Self
+
+from ..serialization import Serializable
+
+
+@dataclass
+class PairingConfig(Serializable):
+    """Engine and constraints solver settings used by the matchmaking by score of a tournament.
+
+    When the time limit is reached, the best pairing found so far is accepted (even if not proved optimal)."""
+
+    engine: str = "cp-sat"  # "cp-sat" (constraints solver, replaced by "blossom" if ortools is missing) or "blossom"
+    num_search_workers: int = 0  # 0: as many workers as available cores
+    max_time_in_seconds: float = 10.0  # 0: no time limit
+    relative_gap_limit: float = 0.0  # stop once the pairing is proved within this relative gap of the optimal one
+    decomposition: bool = False  # pair each score group independently (in parallel for large tournaments)
+    nearest_opponents: int = 0  # candidate pairs limited to the k nearest opponents by score (0: all opponents)
+    measure_hints: bool = False  # solve again without the solver hints to measure the solve time they saved
+    isolated: bool = False  # solve in a dedicated process, killed after the time limit (plus a margin)
+    memory_limit_in_mb: int = 4096  # address space cap of the dedicated solver process (0: no limit)
+    speculative_matches: int = 0  # pair the next round of every outcome once at most this many matches are open
+
+    def encode(self) -> dict[str, Any]:
+        """Transform the instance of the object into JSON compatible format."""
+        return {
+            "engine": self.engine,
+            "num_search_workers": self.num_search_workers,
+            "max_time_in_seconds": self.max_time_in_seconds,
+            "relative_gap_limit": self.relative_gap_limit,
+            "decomposition": self.decomposition,
+            "nearest_opponents": self.nearest_opponents,
+            "measure_hints": self.measure_hints,
+            "isolated": self.isolated,
+            "memory_limit_in_mb": self.memory_limit_in_mb,
+            "speculative_matches": self.speculative_matches,
+        }
+
+    @classmethod
+    def decode(cls, encoded_data: dict[str, Any], db: Optional[dict | list] = None) -> Self:
+        """Instantiate a new object from data in JSON format."""
+        return cls(
+            engine=encoded_data.get("engine", cls.engine),  # not stored by the previous versions
+            num_search_workers=int(encoded_data["num_search_workers"]),
+            max_time_in_seconds=float(encoded_data["max_time_in_seconds"]),
+            relative_gap_limit=float(encoded_data["relative_gap_limit"]),
+            decomposition=bool(encoded_data.get("decomposition", cls.decomposition)),
+            nearest_opponents=int(encoded_data.get("nearest_opponents", cls.nearest_opponents)),
+            measure_hints=bool(encoded_data.get("measure_hints", cls.measure_hints)),
+            isolated=bool(encoded_data.get("isolated", cls.isolated)),
+            memory_limit_in_mb=int(encoded_data.get("memory_limit_in_mb", cls.memory_limit_in_mb)),
+            speculative_matches=int(encoded_data.get("speculative_matches", cls.speculative_matches)),
+        )
@@ -0,0 +1,402 @@
+"""Define the matchmaking by score engines, which pair the participants not met yet while minimizing score gaps."""
+
+from __future__ import annotations  # the ortools annotations are not evaluated (it may be unavailable)
+
+import time
+from abc import ABC, abstractmethod
+from dataclasses import replace
+from typing import Optional
+
+from .blossom import max_weight_matching
+from .pairing_config import PairingConfig
+from .participant import Participant
+from .played_pairs import PlayedPairs
+from .solver_process import TIMEOUT_MARGIN, solve_in_process
+
+try:
+    from ortools.sat.python import cp_model
+except ImportError:  # the constraints solver engine is unavailable without ortools
+    cp_model = None
+
+
+def score_gap_cost(first: Participant, second: Participant) -> float:
+    """Privilege the smallest score gaps for matchmaking."""
+    return abs(first.score - second.score) ** 2
+
+
+def integer_score_gap_cost(first: Participant, second: Participant) -> int:
+    """Return the score gap cost as an integer (scores are multiples of 0.5, so 4 × the squared gaps are integers)."""
+    return round(4 * score_gap_cost(first, second))
+
+
+MIN_SOLVE_TIME = 0.01  # seconds left to a solve once the time limit is spent (a time limit of 0 meaning none)
+
+
+class PairingEngine(ABC):
+    """A "valid" pairing engine must implements the following method (and record its timings)."""
+
+    is_available = True
+
+    def __init__(self) -> None:
+        self.build_time = 0.0
+        self.solve_time = 0.0
+        self.hints_saved_time: float | None = None  # only measured by the engines using hints, if asked
+        self.is_stop_requested = False
+
+    def stop(self) -> None:
+        """Ask the engine to stop its search, the best pairing found so far being used.
+
+        The engines that cannot be interrupted end their search normally."""
+        self.is_stop_requested = True
+
+    @abstractmethod
+    def solve(
+        self, played_pairs: PlayedPairs, pairing_config: PairingConfig
+    ) -> list[tuple[Participant, Participant]] | None:
+        """Return a list of the not played participants pairs minimizing the score gaps, None if there is none."""
+
+
+class MatchingEngine(PairingEngine):
+    """A pairing engine solving a perfect matching problem whose edges are candidate slots pairs.
+
+    If the pairing config limits the candidates to the k nearest opponents of each participant, k is doubled while the
+    problem is proven infeasible (all the not played pairs being candidates once k reaches the number of opponents),
+    the successive solves sharing the solver time limit."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._rematch_penalty = 0  # added to the played pairs costs, candidates of the relaxed matchmaking only
+        self.is_proven_infeasible = False  # set by solve_candidates (False if the search ended without a proof)
+
+    def pair_cost(self, played_pairs: PlayedPairs, first_slot: int, second_slot: int) -> int:
+        """Return the integer cost of a slots pair (score gap cost, plus the rematch penalty if they already met)."""
+        participants = played_pairs.participants
+        cost = integer_score_gap_cost(participants[first_slot], participants[second_slot])
+        if self._rematch_penalty and played_pairs.has_met_slots(first_slot, second_slot):
+            cost += self._rematch_penalty
+        return cost
+
+    @abstractmethod
+    def solve_candidates(
+        self, played_pairs: PlayedPairs, candidates: list[tuple[int, int]], pairing_config: PairingConfig
+    ) -> list[tuple[Participant, Participant]] | None:
+        """Return a list of candidate participants pairs minimizing the score gaps, None if there is none."""
+
+    def _solve_candidates(
+        self,
+        played_pairs: PlayedPairs,
+        candidates: list[tuple[int, int]],
+        pairing_config: PairingConfig,
+        deadline: Optional[float] = None,
+    ) -> list[tuple[Participant, Participant]] | None:
+        """Solve the candidate pairs, in a dedicated solver process if the pairing config asks it.
+
+        None is returned if the solver process timed out (at the given deadline, if any), exceeded its memory cap or
+        was stopped."""
+        self.is_proven_infeasible = False
+        if not pairing_config.isolated:
+            return self.solve_candidates(played_pairs, candidates, pairing_config)
+        start = time.perf_counter()
+        result = solve_in_process(
+            type(self),
+            played_pairs,
+            candidates,
+            self._rematch_penalty,
+            pairing_config,
+            lambda: self.is_stop_requested,
+            None if deadline is None else deadline + TIMEOUT_MARGIN,
+        )
+        if result is None:
+            self.solve_time += time.perf_counter() - start
+            return None
+        slots_pairs, build_time, solve_time, hints_saved_time, self.is_proven_infeasible = result
+        self.build_time += time.perf_counter() - start - solve_time  # including the process start
+        self.solve_time += solve_time
+        if hints_saved_time is not None:
+            self.hints_saved_time = (self.hints_saved_time or 0.0) + hints_saved_time
+        if slots_pairs is None:
+            return None
+        participants = played_pairs.participants
+        return [(participants[first_slot], participants[second_slot]) for first_slot, second_slot in slots_pairs]
+
+    def solve(
+        self, played_pairs: PlayedPairs, pairing_config: PairingConfig
+    ) -> list[tuple[Participant, Participant]] | None:
+        self.build_time = self.solve_time = 0.0
+        self.hints_saved_time = None
+        deadline = None
+        if pairing_config.max_time_in_seconds > 0:
+            deadline = time.perf_counter() + pairing_config.max_time_in_seconds
+        total_nearest = pairing_config.nearest_opponents
+        while True:
+            start = time.perf_counter()
+            is_complete = not 0 < total_nearest < len(played_pairs.participants) - 1
+            if is_complete:
+                candidates = played_pairs.remaining_slots_pairs()
+            else:
+                candidates = played_pairs.nearest_slots_pairs(total_nearest)
+            self.build_time += time.perf_counter() - start
+            solve_config = pairing_config
+            if deadline is not None:
+                remaining_time = max(MIN_SOLVE_TIME, deadline - time.perf_counter())
+                solve_config = replace(pairing_config, max_time_in_seconds=remaining_time)
+            pairs = self._solve_candidates(played_pairs, candidates, solve_config, deadline)
+            if pairs is not None or is_complete or not self.is_proven_infeasible or self.is_stop_requested:
+                return pairs
+            total_nearest *= 2
+
+    def solve_relaxed(
+        self, played_pairs: PlayedPairs, pairing_config: PairingConfig
+    ) -> list[tuple[Participant, Participant]] | None:
+        """Return participants pairs minimizing the number of rematches first, then the score gaps, None if none found.
+
+        All the pairs are candidates, the played ones being penalized by more than the cost of any pairing without
+        rematches."""
+        self.build_time = self.solve_time = 0.0
+        self.hints_saved_time = None
+        start = time.perf_counter()
+        participants = played_pairs.participants
+        candidates = [
+            (first_slot, second_slot)
+            for first_slot in range(len(participants))
+            for second_slot in range(first_slot + 1, len(participants))
+        ]
+        ordered_participants = sorted(participants, key=lambda participant: participant.score)
+        max_pair_cost = (
+            integer_score_gap_cost(ordered_participants[0], ordered_participants[-1]) if participants else 0
+        )
+        self._rematch_penalty = 1 + len(participants) // 2 * max_pair_cost
+        self.build_time += time.perf_counter() - start
+        try:
+            return self._solve_candidates(played_pairs, candidates, pairing_config)
+        finally:
+            self._rematch_penalty = 0
+
+
+if cp_model is not None:
+
+    class StoppableSearch(cp_model.CpSolverSolutionCallback):
+        """Solver callback through which the search can be stopped from another thread."""
+
+        def on_solution_callback(self) -> None:
+            """Nothing to do with the intermediate solutions."""
+
+
+class ConstraintsEngine(MatchingEngine):
+    """Generate participants pairs using a constraints solver, the solver model being kept from round to round.
+
+    in formal methods, a SAT solver aims to solve the boolean satisfiability (SAT) problem
+    cp = Constraint Programming
+    here we want :
+    - to select exactly one match per player from all possible (remaining) combination of 2
+    - to consider the global minimal score difference between players (calculated for each possibility)
+
+    The model (one variable per candidate pair and one constraint per participant) is only built again when the
+    participants change or when a candidate pair has no variable yet, a round only updating the variables domains of
+    the pairs that are not candidates anymore (e.g. played) and the objective."""
+
+    is_available = cp_model is not None
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._participants_ids: list[str] = []
+        self._model = cp_model.CpModel()
+        self._matches_model_variables: dict[tuple[int, int], cp_model.IntVar] = {}
+        self._excluded_slots_pairs: set[tuple[int, int]] = set()
+        self._objective_bound: cp_model.Constraint | None = None
+        self._previous_slots_pairs: list[tuple[int, int]] = []
+        # callback of the running search, through which it can be stopped from another thread
+        self._search_callback: StoppableSearch | None = None
+
+    def __getstate__(self) -> dict[str, float | None]:
+        """Return the timings only (the solver model is built again when needed)."""
+        return {
+            "build_time": self.build_time,
+            "solve_time": self.solve_time,
+            "hints_saved_time": self.hints_saved_time,
+        }
+
+    def __setstate__(self, state: dict[str, float | None]) -> None:
+        self.__init__()
+        self.__dict__.update(state)
+
+    def stop(self) -> None:
+        super().stop()
+        search_callback = self._search_callback  # read once: the worker thread clears it once the search ends
+        if search_callback is not None:
+            search_callback.StopSearch()
+
+    def _build(self, participants: list[Participant], candidates: list[tuple[int, int]]) -> None:
+        """Build the model variables and constraints for the given participants and candidate slots pairs."""
+        self._participants_ids = [participant.player.identifier for participant in participants]
+        self._model = cp_model.CpModel()
+        self._matches_model_variables = {}
+        self._excluded_slots_pairs = set()
+        # incidence index: the model variables of each participant’s matches
+        participants_model_variables: list[list[cp_model.IntVar]] = [[] for _ in participants]
+        for first_slot, second_slot in candidates:
+            # specify to model that a match (e.g. pairing players A & B) can be True or False
+            match_model_variable = self._model.NewBoolVar(f"{first_slot}-{second_slot}")
+            self._matches_model_variables[first_slot, second_slot] = match_model_variable
+            participants_model_variables[first_slot].append(match_model_variable)
+            participants_model_variables[second_slot].append(match_model_variable)
+
+        # specify to model the constraint that only one match per player can be selected at the same time
+        # e.g. AB or AC or AD (i.e. AB + AC + AD = 1)
+        for player_matches_model_variables in participants_model_variables:
+            self._model.AddExactlyOne(player_matches_model_variables)
+
+        # upper bound of the objective (its coefficients and bound being set at each round)
+        matches_model_variables = list(self._matches_model_variables.values())
+        self._objective_bound = self._model.Add(
+            cp_model.LinearExpr.WeightedSum(matches_model_variables, [1] * len(matches_model_variables)) >= 0
+        )
+
+    def _update(self, played_pairs: PlayedPairs, candidates: list[tuple[int, int]]) -> list[int]:
+        """Fix to False the variables of the pairs that are not candidates (and release the candidate ones).
+
+        Return the costs of the model variables."""
+        participants_ids = [participant.player.identifier for participant in played_pairs.participants]
+        if self._participants_ids != participants_ids:
+            self._previous_slots_pairs = []
+        if self._participants_ids != participants_ids or any(
+            slots_pair not in self._matches_model_variables for slots_pair in candidates
+        ):
+            self._build(played_pairs.participants, candidates)
+        excluded_slots_pairs = self._matches_model_variables.keys() - set(candidates)
+        for slots_pair in excluded_slots_pairs ^ self._excluded_slots_pairs:
+            upper_bound = 0 if slots_pair in excluded_slots_pairs else 1
+            self._matches_model_variables[slots_pair].Proto().domain[:] = [0, upper_bound]
+        self._excluded_slots_pairs = excluded_slots_pairs
+
+        # specify to model how to select the best choice by giving a weight to each possibility
+        # here based on players scores difference (privileging the smallest score gaps)
+        costs = [
+            self.pair_cost(played_pairs, first_slot, second_slot)
+            for first_slot, second_slot in self._matches_model_variables
+        ]
+        self._model.Minimize(cp_model.LinearExpr.WeightedSum(list(self._matches_model_variables.values()), costs))
+        return costs
+
+    def _set_hints(self, played_pairs: PlayedPairs, candidates: list[tuple[int, int]], costs: list[int]) -> None:
+        """Hint the solver with the cheapest complete pairing among the greedy one and the previous solution.
+
+        The objective is bounded by the hinted pairing cost, or unbounded if no pairing is complete (e.g. the previous
+        solution pairs being played, until the played pairs are reset)."""
+        slots_pairs_costs = dict(zip(self._matches_model_variables, costs))
+        candidates_set = set(candidates)
+        complete_pairings = [
+            slots_pairs
+            for slots_pairs in (played_pairs.greedy_slots_pairs(), self._previous_slots_pairs)
+            if 2 * len(slots_pairs) == len(played_pairs.participants) and candidates_set.issuperset(slots_pairs)
+        ]
+        hint_slots_pairs = min(
+            complete_pairings,
+            key=lambda slots_pairs: sum(slots_pairs_costs[slots_pair] for slots_pair in slots_pairs),
+            default=None,
+        )
+        self._model.ClearHints()
+        objective_bound = self._objective_bound.Proto().linear
+        objective_bound.vars[:] = [match_var.Index() for match_var in self._matches_model_variables.values()]
+        objective_bound.coeffs[:] = costs
+        if hint_slots_pairs is None:
+            objective_bound.domain[:] = [0, sum(costs)]
+            return
+        for slots_pair in hint_slots_pairs:
+            self._model.AddHint(self._matches_model_variables[slots_pair], 1)
+        objective_bound.domain[:] = [0, sum(slots_pairs_costs[slots_pair] for slots_pair in hint_slots_pairs)]
+
+    def _clear_hints(self) -> None:
+        """Remove the solver hints and the objective upper bound."""
+        self._model.ClearHints()
+        objective_bound = self._objective_bound.Proto().linear
+        objective_bound.domain[:] = [0, sum(objective_bound.coeffs)]
+
+    def _run_solver(self, pairing_config: PairingConfig) -> tuple[cp_model.CpSolver, int]:
+        """Call the solver with the pairing config settings, return the solver and its status."""
+        solver = cp_model.CpSolver()
+        solver.parameters.num_search_workers = pairing_config.num_search_workers
+        if pairing_config.max_time_in_seconds > 0:
+            solver.parameters.max_time_in_seconds = pairing_config.max_time_in_seconds
+        solver.parameters.relative_gap_limit = pairing_config.relative_gap_limit
+        self._search_callback = StoppableSearch()
+        if self.is_stop_requested:  # stopped before the search started
+            solver.parameters.max_time_in_seconds = 0.0
+        try:
+            return solver, solver.Solve(self._model, self._search_callback)
+        finally:
+            self._search_callback = None
+
+    def solve_candidates(
+        self, played_pairs: PlayedPairs, candidates: list[tuple[int, int]], pairing_config: PairingConfig
+    ) -> list[tuple[Participant, Participant]] | None:
+        """The best pairing found before the time limit is returned, even if it is not proved optimal.
+
+        The search is warm-started from the greedy pairing or the previous solution. If the pairing config asks it,
+        the model is solved again without hints to measure the solve time they saved."""
+        start = time.perf_counter()
+        costs = self._update(played_pairs, candidates)
+        self._set_hints(played_pairs, candidates, costs)
+        self.build_time += time.perf_counter() - start
+
+        # call the solver to find the best solution respecting the given constraints
+        # i.e. selecting exactly one match per player AND selecting minimal weight
+        start = time.perf_counter()
+        solver, status = self._run_solver(pairing_config)
+        solve_time = time.perf_counter() - start
+        self.solve_time += solve_time
+        if pairing_config.measure_hints:
+            self._clear_hints()
+            start = time.perf_counter()
+            self._run_solver(pairing_config)
+            self.hints_saved_time = (self.hints_saved_time or 0.0) + time.perf_counter() - start - solve_time
+        if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            self.is_proven_infeasible = status == cp_model.INFEASIBLE
+            return None
+        self._previous_slots_pairs = [
+            slots_pair for slots_pair, match_var in self._matches_model_variables.items() if solver.Value(match_var)
+        ]
+        participants = played_pairs.participants
+        return [
+            (participants[first_slot], participants[second_slot])
+            for first_slot, second_slot in self._previous_slots_pairs
+        ]
+
+
+class BlossomEngine(MatchingEngine):
+    """Generate participants pairs as a minimum cost perfect matching, using the Edmonds’ blossom algorithm.
+
+    The score gaps costs are turned into the weights of a maximum weight matching among the maximum cardinality ones,
+    on the graph of the candidate pairs. It runs in polynomial time, without any solver settings."""
+
+    def solve_candidates(
+        self, played_pairs: PlayedPairs, candidates: list[tuple[int, int]], pairing_config: PairingConfig
+    ) -> list[tuple[Participant, Participant]] | None:
+        start = time.perf_counter()
+        participants = played_pairs.participants
+        # integer costs keep the matching exact
+        costs = [self.pair_cost(played_pairs, first_slot, second_slot) for first_slot, second_slot in candidates]
+        max_cost = max(costs, default=0)
+        edges = [(slot, other_slot, max_cost + 1 - cost) for (slot, other_slot), cost in zip(candidates, costs)]
+        self.build_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        mates = max_weight_matching(edges, max_cardinality=True)
+        self.solve_time += time.perf_counter() - start
+        if len(mates) < len(participants) or -1 in mates:  # no perfect matching
+            self.is_proven_infeasible = True
+            return None
+        return [
+            (participant, participants[mates[slot]])
+            for slot, participant in enumerate(participants)
+            if slot < mates[slot]
+        ]
+
+
+PAIRING_ENGINES: dict[str, type[PairingEngine]] = {"cp-sat": ConstraintsEngine, "blossom": BlossomEngine}
+
+
+def get_pairing_engine_class(engine_name: str) -> type[PairingEngine]:
+    """Return the given pairing engine class (the blossom one if the given engine is not available)."""
+    engine_class = PAIRING_ENGINES.get(engine_name, BlossomEngine)
+    return engine_class if engine_class.is_available else BlossomEngine
@@ -13,10 +13,15 @@ class Participant(Serializable):
 
     player: Player
     score: float = 0
+    standings = None  # the tournament standings, kept up to date by add_score (not a dataclass field)
 
     def add_score(self, to_add: float) -> None:
-        """Add up the participant score."""
+        """Add up the participant score (moving it in the tournament standings)."""
+        previous_score = self.score
         self.score += to_add
+        self.set_dirty()
+        if self.standings is not None:
+            self.standings.update(self, previous_score)
 
     def __lt__(self, other: Self) -> bool:
         """Order participant by score."""
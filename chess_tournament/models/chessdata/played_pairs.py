@@ -0,0 +1,193 @@
+"""Define the played pairs data structure, used by the matchmaking to avoid duplicate encounters."""
+
+from array import array
+from datetime import date
+from typing import Iterator
+
+from .blossom import max_weight_matching
+from .participant import Participant
+from .player import Player
+
+
+def _bits_indexes(bits: int) -> Iterator[int]:
+    """Yield the indexes of the set bits of an integer, in ascending order."""
+    while bits:
+        lowest_bit = bits & -bits
+        yield lowest_bit.bit_length() - 1
+        bits ^= lowest_bit
+
+
+class PlayedPairs:
+    """Symmetric bit matrix of the participants pairs who already met, indexed by the participants slots.
+
+    Each row is packed in an integer whose bit j is set if the participant of the row met the participant of slot j."""
+
+    def __init__(self, participants: list[Participant]) -> None:
+        self.participants = list(participants)
+        self.slots = {participant.player.identifier: slot for slot, participant in enumerate(self.participants)}
+        self._rows = [0] * len(self.participants)
+
+    def __len__(self) -> int:
+        """Return the number of played pairs."""
+        return sum(row.bit_count() for row in self._rows) // 2
+
+    def fingerprint(self) -> bytes:
+        """Return the participants (by slot, with their scores) and the played pairs bit matrix as bytes."""
+        participants = [(participant.player.identifier, participant.score) for participant in self.participants]
+        return repr(participants).encode() + self._packed_rows()
+
+    def _packed_rows(self) -> bytes:
+        """Return the played pairs bit matrix rows as fixed size little-endian bytes."""
+        row_size = (len(self._rows) + 7) // 8
+        return b"".join(row.to_bytes(row_size, "little") for row in self._rows)
+
+    def encode_arrays(self) -> tuple[array, bytes]:
+        """Return a compact encoding of the participants scores (by slot) and of the played pairs bit matrix."""
+        return array("d", [participant.score for participant in self.participants]), self._packed_rows()
+
+    @classmethod
+    def decode_arrays(cls, scores: array, packed_rows: bytes) -> "PlayedPairs":
+        """Instantiate the played pairs of a compact encoding, with placeholder participants (identified by slot)."""
+        played_pairs = cls(
+            [Participant(Player(str(slot), "", "", date.min), score=score) for slot, score in enumerate(scores)]
+        )
+        row_size = (len(scores) + 7) // 8
+        played_pairs._rows = [
+            int.from_bytes(packed_rows[slot * row_size:(slot + 1) * row_size], "little") for slot in range(len(scores))
+        ]
+        return played_pairs
+
+    def slots_pair(self, participants_pair: tuple[Participant, Participant]) -> tuple[int, int]:
+        """Return the slots of the given participants."""
+        return self.slots[participants_pair[0].player.identifier], self.slots[participants_pair[1].player.identifier]
+
+    def add(self, participants_pair: tuple[Participant, Participant]) -> None:
+        """Register a played pair (in both directions)."""
+        first, second = self.slots_pair(participants_pair)
+        self._rows[first] |= 1 << second
+        self._rows[second] |= 1 << first
+
+    def has_met(self, participants_pair: tuple[Participant, Participant]) -> bool:
+        """Return True if the participants already met, False otherwise."""
+        return self.has_met_slots(*self.slots_pair(participants_pair))
+
+    def has_met_slots(self, slot: int, other_slot: int) -> bool:
+        """Return True if the participants of the given slots already met, False otherwise."""
+        return bool(self._rows[slot] >> other_slot & 1)
+
+    @property
+    def is_exhausted(self) -> bool:
+        """Return True if every participant met all the others, False otherwise."""
+        full_row = (1 << len(self._rows)) - 1
+        return all(row == full_row ^ (1 << slot) for slot, row in enumerate(self._rows))
+
+    def copy(self) -> "PlayedPairs":
+        """Return a copy of the played pairs, whose participants are detached copies (with the same slots)."""
+        played_pairs = PlayedPairs(
+            [Participant(participant.player, participant.score) for participant in self.participants]
+        )
+        played_pairs._rows = list(self._rows)
+        return played_pairs
+
+    def restricted(self, slots: list[int]) -> "PlayedPairs":
+        """Return the played pairs between the participants of the given slots (renumbered in the given order).
+
+        The participants are detached copies, light enough to be sent to another process."""
+        restricted_played_pairs = PlayedPairs(
+            [Participant(self.participants[slot].player, self.participants[slot].score) for slot in slots]
+        )
+        for restricted_slot, slot in enumerate(slots):
+            row = self._rows[slot]
+            restricted_played_pairs._rows[restricted_slot] = sum(
+                1 << other_restricted_slot
+                for other_restricted_slot, other_slot in enumerate(slots)
+                if row >> other_slot & 1
+            )
+        return restricted_played_pairs
+
+    def clear(self) -> None:
+        """Forget all the played pairs."""
+        self._rows = [0] * len(self.participants)
+
+    def met_slots(self, slot: int) -> Iterator[int]:
+        """Yield the slots of the participants already met by the participant of the given slot."""
+        return _bits_indexes(self._rows[slot])
+
+    def remaining_slots(self, slot: int) -> Iterator[int]:
+        """Yield the greater slots of the participants not met yet by the participant of the given slot."""
+        return _bits_indexes(~self._rows[slot] & ((1 << len(self._rows)) - 1) & ~((2 << slot) - 1))
+
+    def remaining_slots_pairs(self) -> list[tuple[int, int]]:
+        """Return the slots pairs not played yet (each pair once, ordered by slots)."""
+        return [(slot, other_slot) for slot in range(len(self._rows)) for other_slot in self.remaining_slots(slot)]
+
+    def _ordered_slots(self) -> list[int]:
+        """Return the participants slots by descending score."""
+        return sorted(range(len(self.participants)), key=lambda slot: -self.participants[slot].score)
+
+    def greedy_slots_pairs(self) -> list[tuple[int, int]]:
+        """Return the slots pairs of a greedy pairing by score order (each participant with the next one not met yet).
+
+        The pairing may be incomplete, some participants having met all the following ones."""
+        ordered_slots = self._ordered_slots()
+        is_paired = [False] * len(ordered_slots)
+        slots_pairs = []
+        for position, slot in enumerate(ordered_slots):
+            if is_paired[slot]:
+                continue
+            for other_position in range(position + 1, len(ordered_slots)):
+                other_slot = ordered_slots[other_position]
+                if not is_paired[other_slot] and not self._rows[slot] >> other_slot & 1:
+                    is_paired[slot] = is_paired[other_slot] = True
+                    slots_pairs.append((min(slot, other_slot), max(slot, other_slot)))
+                    break
+        return slots_pairs
+
+    def nearest_slots_pairs(self, total_nearest: int) -> list[tuple[int, int]]:
+        """Return the not played slots pairs between each participant and its k nearest opponents by score.
+
+        The pairs of the greedy pairing are added, so that the slots pairs contain a perfect matching as soon as the
+        greedy pairing is complete."""
+        scores = [participant.score for participant in self.participants]
+        ordered_slots = self._ordered_slots()
+        slots_pairs = set(self.greedy_slots_pairs())
+        for position, slot in enumerate(ordered_slots):
+            # walk away from the participant in score order, the closest score first
+            lower_position, upper_position = position - 1, position + 1
+            total_found = 0
+            while total_found < total_nearest and (lower_position >= 0 or upper_position < len(ordered_slots)):
+                if upper_position >= len(ordered_slots) or (
+                    lower_position >= 0
+                    and scores[ordered_slots[lower_position]] - scores[slot]
+                    <= scores[slot] - scores[ordered_slots[upper_position]]
+                ):
+                    other_slot = ordered_slots[lower_position]
+                    lower_position -= 1
+                else:
+                    other_slot = ordered_slots[upper_position]
+                    upper_position += 1
+                if not self._rows[slot] >> other_slot & 1:
+                    slots_pairs.add((min(slot, other_slot), max(slot, other_slot)))
+                    total_found += 1
+        return sorted(slots_pairs)
+
+    def has_perfect_matching(self) -> bool:
+        """Return True if all the participants can be paired with opponents they did not meet yet, False otherwise.
+
+        The greedy pairing is tried first, a maximum cardinality matching of the not played pairs graph being computed
+        only if it is incomplete."""
+        if len(self.participants) % 2:
+            return False
+        if 2 * len(self.greedy_slots_pairs()) == len(self.participants):
+            return True
+        edges = [(slot, other_slot, 1) for slot, other_slot in self.remaining_slots_pairs()]
+        mates = max_weight_matching(edges, max_cardinality=True)
+        return len(mates) == len(self.participants) and -1 not in mates
+
+    def remaining_pairs(self) -> list[tuple[Participant, Participant]]:
+        """Return the pairs not played yet (each pair once, ordered by slots)."""
+        return [
+            (participant, self.participants[other_slot])
+            for slot, participant in enumerate(self.participants)
+            for other_slot in self.remaining_slots(slot)
+        ]
@@ -17,6 +17,39 @@ class Round(Serializable):
     matches: tuple[Match, ...]
     start_time: datetime | None = None
     end_time: datetime | None = None
+    # matchmaking metadata (in seconds), None for the rounds paired randomly, served by the pairing cache or by the
+    # previous versions
+    pairing_build_time: float | None = None
+    pairing_solve_time: float | None = None
+    hints_saved_time: float | None = None  # only measured if asked by the pairing config
+
+    def __post_init__(self) -> None:
+        for match in self.matches:
+            match.set_parent(self)
+        self.total_finished_matches = sum(1 for match in self.matches if match.is_ended)  # kept by register_score
+
+    @property
+    def total_matches(self) -> int:
+        """Return the number of matches of the round."""
+        return len(self.matches)
+
+    @property
+    def total_open_matches(self) -> int:
+        """Return the number of matches whose score is not registered yet."""
+        return len(self.matches) - self.total_finished_matches
+
+    @property
+    def are_all_matches_ended(self) -> bool:
+        """Return True if the score of every match is registered, False otherwise."""
+        return self.total_finished_matches == len(self.matches)
+
+    def register_score(self, match_m: int, participants_status: tuple[Match.Points, Match.Points]) -> Match:
+        """Register the score of the given match (counting it as finished), return the match."""
+        match = self.matches[match_m]
+        if not match.is_ended:
+            self.total_finished_matches += 1
+        match.register_score(participants_status)
+        return match
 
     @property
     def is_ended(self) -> bool:
@@ -31,10 +64,12 @@ class Round(Serializable):
     def start_round(self, start_time: datetime = datetime.now()) -> None:
         """Register the starting time of the round."""
         self.start_time = start_time
+        self.set_dirty()
 
     def end_round(self, end_time: datetime = datetime.now()) -> None:
         """Register the ending time of the round."""
         self.end_time = end_time
+        self.set_dirty()
 
     def encode(self) -> dict[str, object]:
         """Transform the instance of the object into JSON compatible format."""
@@ -42,12 +77,15 @@ class Round(Serializable):
             "name": self.name,
             "start_time": str(self.start_time) if self.start_time is not None else "",
             "end_time": str(self.end_time) if self.end_time is not None else "",
-            "matches": [match.encode() for match in self.matches],
+            "matches": [match.cached_encode() for match in self.matches],
+            "pairing_build_time": self.pairing_build_time,
+            "pairing_solve_time": self.pairing_solve_time,
+            "hints_saved_time": self.hints_saved_time,
         }
 
     @classmethod
-    def decode(cls, encoded_data: dict[str, Any], participants_db: list[Participant]) -> Self:
-        """Instantiate a new object from data in JSON format."""
+    def decode(cls, encoded_data: dict[str, Any], participants_db: dict[str, Participant]) -> Self:
+        """Instantiate a new object from data in JSON format (participants being indexed by their player ID)."""
         encoded_data["start_time"] = (
             datetime.fromisoformat(encoded_data["start_time"]) if encoded_data["start_time"] else None
         )
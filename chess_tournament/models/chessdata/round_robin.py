@@ -0,0 +1,64 @@
+"""Define the round-robin schedule (Berger tables), computed once when a round-robin tournament starts."""
+
+from typing import Optional
+
+RoundSchedule = list[int]  # participants indexes, by pairs (the first one of each pair having the white pieces)
+
+
+def round_robin_error(total_participants: int, total_rounds: int) -> Optional[str]:
+    """Return why the participants cannot play the rounds as a round-robin, None if they can."""
+    if total_participants < 2 or total_participants % 2:
+        return "A round-robin needs an even number of participants"
+    if total_rounds == 0 or total_rounds % (total_participants - 1):
+        return f"A round-robin of {total_participants} participants needs k * {total_participants - 1} rounds"
+    return None
+
+
+def berger_cycle(total_participants: int) -> list[RoundSchedule]:
+    """Return the rounds of the Berger tables (FIDE Handbook C.05 Annex 1) for an even number of participants.
+
+    The last participant stays on the first board, having the white pieces every other round, while the others move
+    by half a turn of the table each round: in round r, the participants i and j (other than the last one) meet when
+    i + j = r (modulo n - 1)."""
+    total_boards = total_participants // 2
+    last = total_participants - 1
+    cycle = []
+    for round_r in range(total_participants - 1):
+        first = round_r * total_boards % last  # participant meeting the last one
+        round_schedule = [last, first] if round_r % 2 else [first, last]
+        for board in range(1, total_boards):
+            round_schedule.extend(((first + board) % last, (first - board) % last))
+        cycle.append(round_schedule)
+    return cycle
+
+
+def berger_schedule(total_participants: int, total_rounds: int) -> list[RoundSchedule]:
+    """Return the rounds of the Berger tables played as many times as the rounds allow (see round_robin_error).
+
+    The colours are swapped from a cycle to the next, and the last two rounds of a cycle followed by another one are
+    played in reverse order, as FIDE recommends, so that no participant gets the same colour three times in a row."""
+    error = round_robin_error(total_participants, total_rounds)
+    if error is not None:
+        raise ValueError(error)
+    cycle = berger_cycle(total_participants)
+    total_cycles = total_rounds // len(cycle)
+    schedule = []
+    for cycle_c in range(total_cycles):
+        cycle_schedule = list(cycle)
+        if cycle_c < total_cycles - 1 and len(cycle) > 1:
+            cycle_schedule[-2:] = cycle_schedule[-1], cycle_schedule[-2]
+        if cycle_c % 2:
+            cycle_schedule = [swapped_colours(round_schedule) for round_schedule in cycle_schedule]
+        schedule.extend(cycle_schedule)
+    return schedule
+
+
+def swapped_colours(round_schedule: RoundSchedule) -> RoundSchedule:
+    """Return the round schedule, the colours of every pair being swapped."""
+    return [participant for white, black in scheduled_pairs([round_schedule], 0) for participant in (black, white)]
+
+
+def scheduled_pairs(schedule: list[RoundSchedule], round_r: int) -> list[tuple[int, int]]:
+    """Return the participants indexes pairs (white, black) of the given round."""
+    round_schedule = schedule[round_r]
+    return list(zip(round_schedule[::2], round_schedule[1::2]))
@@ -0,0 +1,214 @@
+"""Define the score groups decomposition of the matchmaking by score."""
+
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import FIRST_EXCEPTION, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import replace
+from itertools import groupby
+from typing import Any, Optional
+
+from .pairing_config import PairingConfig
+from .pairing_engines import MIN_SOLVE_TIME, PairingEngine, get_pairing_engine_class
+from .participant import Participant
+from .played_pairs import PlayedPairs
+
+PARALLEL_MIN_PARTICIPANTS = 128  # below, starting worker processes costs more than solving the groups in sequence
+POLL_PERIOD = 0.1  # seconds between two checks of a stop request
+
+_stop_event: Any = None  # set by the worker processes initializer, to stop their search from the main process
+
+ScoreGroup = list[int]  # participants slots
+
+
+def split_into_score_groups(played_pairs: PlayedPairs) -> list[ScoreGroup]:
+    """Partition the participants into groups of equal score (by descending score), each one of even size.
+
+    The last participant of an odd sized group floats down to the next group."""
+    participants = played_pairs.participants
+    ordered_slots = sorted(range(len(participants)), key=lambda slot: -participants[slot].score)
+    score_groups, floaters = [], []
+    for _, same_score_slots in groupby(ordered_slots, key=lambda slot: participants[slot].score):
+        score_group = floaters + list(same_score_slots)
+        floaters = [score_group.pop()] if len(score_group) % 2 else []
+        if score_group:
+            score_groups.append(score_group)
+    if floaters:  # odd number of participants
+        score_groups.append(floaters)
+    return score_groups
+
+
+def merge_unpaired_score_groups(
+    score_groups: list[ScoreGroup], groups_pairs: list[list[tuple[int, int]] | None]
+) -> list[ScoreGroup]:
+    """Merge each score group that could not be paired with the next one (or the previous one if it is the last)."""
+    merged_score_groups: list[ScoreGroup] = []
+    is_previous_unpaired = False
+    for score_group, group_pairs in zip(score_groups, groups_pairs):
+        if is_previous_unpaired:
+            merged_score_groups[-1] = merged_score_groups[-1] + score_group
+            is_previous_unpaired = False
+        else:
+            merged_score_groups.append(score_group)
+            is_previous_unpaired = group_pairs is None
+    if is_previous_unpaired and len(merged_score_groups) > 1:
+        merged_score_groups[-2:] = [merged_score_groups[-2] + merged_score_groups[-1]]
+    return merged_score_groups
+
+
+def _init_worker_process(stop_event: Any) -> None:
+    global _stop_event
+    _stop_event = stop_event
+
+
+def pair_score_group(
+    played_pairs: PlayedPairs, pairing_config: PairingConfig, pairing_engine: Optional[PairingEngine] = None
+) -> list[tuple[int, int]] | None:
+    """Return the slots pairs of the score group participants, None if there is none (or if the search is stopped).
+
+    In the worker processes, the engine is stopped once the main process sets the stop event."""
+    if pairing_engine is None:
+        pairing_engine = get_pairing_engine_class(pairing_config.engine)()
+    is_solved = threading.Event()
+    if _stop_event is not None:
+        if _stop_event.is_set():  # stopped before this score group was started
+            return None
+
+        def stop_on_request() -> None:
+            while not is_solved.wait(POLL_PERIOD):
+                if _stop_event.is_set():
+                    pairing_engine.stop()
+                    return
+
+        threading.Thread(target=stop_on_request, daemon=True).start()
+    try:
+        pairs = pairing_engine.solve(played_pairs, pairing_config)
+    finally:
+        is_solved.set()
+    return None if pairs is None else [played_pairs.slots_pair(participants_pair) for participants_pair in pairs]
+
+
+class ScoreGroupsEngine(PairingEngine):
+    """Generate participants pairs by pairing each score group independently, with the configured engine.
+
+    The score groups are paired in parallel worker processes for large tournaments. The score groups that cannot be
+    paired (e.g. all their pairs were already played) are merged with their neighbors, the whole tournament being
+    paired at once only if the decomposition is infeasible. All the score groups share the solver time limit, and a
+    stop request reaches the running engines (in this process or in the worker processes)."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._group_engine: PairingEngine | None = None  # engine of the score group being paired in this process
+
+    def stop(self) -> None:
+        super().stop()
+        group_engine = self._group_engine  # read once: the matchmaking thread replaces it
+        if group_engine is not None:
+            group_engine.stop()
+
+    def _pair_score_groups(
+        self, played_pairs: PlayedPairs, score_groups: list[ScoreGroup], pairing_config: PairingConfig
+    ) -> list[list[tuple[int, int]] | None]:
+        """Return the slots pairs of each score group (None for the score groups that cannot be paired).
+
+        Each score group gets a share of the time limit proportional to its size (and to the number of workers), so
+        that the whole pairing fits in the time limit."""
+        groups_played_pairs = [played_pairs.restricted(score_group) for score_group in score_groups]
+        total_workers = 1
+        if len(score_groups) > 1 and len(played_pairs.participants) >= PARALLEL_MIN_PARTICIPANTS:
+            total_workers = min(len(score_groups), os.cpu_count() or 1)
+        if pairing_config.num_search_workers == 0:  # the available cores are shared by the worker processes
+            pairing_config = replace(pairing_config, num_search_workers=max(1, (os.cpu_count() or 1) // total_workers))
+        if total_workers > 1:  # the worker processes already isolate the solver from the application
+            pairing_config = replace(pairing_config, isolated=False)
+        groups_pairing_configs = [
+            replace(
+                pairing_config,
+                max_time_in_seconds=min(
+                    pairing_config.max_time_in_seconds,
+                    pairing_config.max_time_in_seconds * total_workers * len(score_group) / len(played_pairs.slots),
+                ),
+            )
+            for score_group in score_groups
+        ]
+        if total_workers > 1:
+            try:
+                return self._pair_in_worker_processes(total_workers, groups_played_pairs, groups_pairing_configs)
+            except (OSError, BrokenProcessPool):  # no worker processes available
+                pass
+        groups_pairs: list[list[tuple[int, int]] | None] = []
+        for group_played_pairs, group_pairing_config in zip(groups_played_pairs, groups_pairing_configs):
+            if self.is_stop_requested:
+                groups_pairs.append(None)
+                continue
+            self._group_engine = get_pairing_engine_class(group_pairing_config.engine)()
+            try:
+                groups_pairs.append(pair_score_group(group_played_pairs, group_pairing_config, self._group_engine))
+            finally:
+                self._group_engine = None
+        return groups_pairs
+
+    def _pair_in_worker_processes(
+        self,
+        total_workers: int,
+        groups_played_pairs: list[PlayedPairs],
+        groups_pairing_configs: list[PairingConfig],
+    ) -> list[list[tuple[int, int]] | None]:
+        """Pair the score groups in worker processes, until they are all paired or a stop is requested.
+
+        Once stopped, the pending score groups are cancelled and the running ones return their best pairs so far."""
+        # spawned, since forking the process running the background matchmaking thread is unsafe
+        context = multiprocessing.get_context("spawn")
+        stop_event = context.Event()
+        with ProcessPoolExecutor(total_workers, context, _init_worker_process, (stop_event,)) as executor:
+            futures = [
+                executor.submit(pair_score_group, group_played_pairs, group_pairing_config)
+                for group_played_pairs, group_pairing_config in zip(groups_played_pairs, groups_pairing_configs)
+            ]
+            while wait(futures, POLL_PERIOD, FIRST_EXCEPTION).not_done:
+                if self.is_stop_requested:
+                    stop_event.set()
+                    for future in futures:
+                        future.cancel()
+                    break
+            wait(futures)
+        return [None if future.cancelled() else future.result() for future in futures]
+
+    def solve(
+        self, played_pairs: PlayedPairs, pairing_config: PairingConfig
+    ) -> list[tuple[Participant, Participant]] | None:
+        start = time.perf_counter()
+        score_groups = split_into_score_groups(played_pairs)
+        self.build_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        deadline = None
+        if pairing_config.max_time_in_seconds > 0:
+            deadline = start + pairing_config.max_time_in_seconds
+        paired_score_groups: dict[tuple[int, ...], list[tuple[int, int]] | None] = {}
+        while True:
+            unpaired_score_groups = [group for group in score_groups if tuple(group) not in paired_score_groups]
+            groups_pairing_config = pairing_config
+            if deadline is not None:  # the merged score groups are paired within the remaining time
+                remaining_time = max(MIN_SOLVE_TIME, deadline - time.perf_counter())
+                groups_pairing_config = replace(pairing_config, max_time_in_seconds=remaining_time)
+            groups_pairs = self._pair_score_groups(played_pairs, unpaired_score_groups, groups_pairing_config)
+            paired_score_groups.update(zip(map(tuple, unpaired_score_groups), groups_pairs))
+            groups_pairs = [paired_score_groups[tuple(score_group)] for score_group in score_groups]
+            if None not in groups_pairs or len(score_groups) == 1 or self.is_stop_requested:
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            score_groups = merge_unpaired_score_groups(score_groups, groups_pairs)
+        self.solve_time = time.perf_counter() - start
+
+        if None in groups_pairs:
+            return None
+        participants = played_pairs.participants
+        return [
+            (participants[score_group[first_slot]], participants[score_group[second_slot]])
+            for score_group, group_pairs in zip(score_groups, groups_pairs)
+            for first_slot, second_slot in group_pairs
+        ]
@@ -0,0 +1,98 @@
+"""Define the isolated solver process, which runs a matchmaking by score with a hard timeout and a memory cap."""
+
+import multiprocessing
+import time
+from array import array
+from dataclasses import replace
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Optional
+
+from .pairing_config import PairingConfig
+from .played_pairs import PlayedPairs
+
+try:
+    import resource
+except ImportError:  # not available on Windows, the memory cap being ignored
+    resource = None
+
+TIMEOUT_MARGIN = 10.0  # seconds added to the solver time limit (process start, imports and model build)
+POLL_PERIOD = 0.1  # seconds between two checks of a stop request
+
+SolverProcessResult = tuple[Optional[list[tuple[int, int]]], float, float, Optional[float], bool]
+
+
+def _solver_process_main(
+    connection: Connection,
+    engine_class: type,
+    scores: array,
+    packed_rows: bytes,
+    candidates: array,
+    rematch_penalty: int,
+    encoded_pairing_config: dict[str, Any],
+) -> None:
+    """Solve the encoded candidates pairs in the solver process, then send back the slots pairs, the timings and
+    whether the problem was proven infeasible."""
+    pairing_config = PairingConfig.decode(encoded_pairing_config)
+    if resource is not None and pairing_config.memory_limit_in_mb > 0:
+        memory_limit = pairing_config.memory_limit_in_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+    try:
+        played_pairs = PlayedPairs.decode_arrays(scores, packed_rows)
+        pairing_engine = engine_class()
+        pairing_engine._rematch_penalty = rematch_penalty
+        pairs = pairing_engine.solve_candidates(
+            played_pairs, list(zip(candidates[::2], candidates[1::2])), replace(pairing_config, isolated=False)
+        )
+        slots_pairs = None if pairs is None else [played_pairs.slots_pair(pair) for pair in pairs]
+        result = (
+            slots_pairs,
+            pairing_engine.build_time,
+            pairing_engine.solve_time,
+            pairing_engine.hints_saved_time,
+            pairing_engine.is_proven_infeasible,
+        )
+    except MemoryError:  # the memory cap is reached
+        result = (None, 0.0, 0.0, None, False)
+    connection.send(result)
+    connection.close()
+
+
+def solve_in_process(
+    engine_class: type,
+    played_pairs: PlayedPairs,
+    candidates: list[tuple[int, int]],
+    rematch_penalty: int,
+    pairing_config: PairingConfig,
+    is_stop_requested: Callable[[], bool],
+    deadline: Optional[float] = None,
+) -> Optional[SolverProcessResult]:
+    """Solve the candidates pairs with the given engine in a dedicated process, None if it timed out or crashed.
+
+    The process is killed once the given deadline (time.perf_counter time, by default the solver time limit plus a
+    margin from now) is exceeded, or if a stop is requested."""
+    scores, packed_rows = played_pairs.encode_arrays()
+    flat_candidates = array("i", [slot for candidate in candidates for slot in candidate])
+    context = multiprocessing.get_context("spawn")  # forking a multithreaded process is unsafe
+    receiver, sender = context.Pipe(duplex=False)
+    solver_process = context.Process(
+        target=_solver_process_main,
+        args=(sender, engine_class, scores, packed_rows, flat_candidates, rematch_penalty, pairing_config.encode()),
+        daemon=True,
+    )
+    solver_process.start()
+    sender.close()
+    if deadline is None and pairing_config.max_time_in_seconds > 0:
+        deadline = time.perf_counter() + pairing_config.max_time_in_seconds + TIMEOUT_MARGIN
+    try:
+        result = None
+        while not is_stop_requested() and (deadline is None or time.perf_counter() < deadline):
+            if receiver.poll(POLL_PERIOD):
+                result = receiver.recv()
+                break
+    except EOFError:  # the process crashed (e.g. killed for its memory use)
+        result = None
+    finally:
+        receiver.close()
+        solver_process.kill()
+        solver_process.join()
+    return result
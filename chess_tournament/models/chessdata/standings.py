@@ -0,0 +1,97 @@
+"""Define the live standings of a tournament, updated incrementally as the scores are registered."""
+
+from bisect import bisect_left, insort
+from itertools import islice
+from operator import itemgetter
+from typing import Iterator
+
+from .participant import Participant
+
+
+_slot_of = itemgetter(0)
+
+
+class Standings:
+    """Participants grouped in score buckets, the distinct scores being kept sorted.
+
+    A score change moves one participant between two buckets (a bisection in the few distinct scores, at most twice
+    the number of rounds plus one), so that the top k, the tie groups and the ranks are read without sorting all the
+    participants. Tied participants are ordered as the tournament participants (by registration slot), whatever the
+    order of their score changes, so that the standings are the same once reloaded."""
+
+    def __init__(self, participants: list[Participant]) -> None:
+        # the (slot, participant) of each score, sorted by slot
+        self._buckets: dict[float, list[tuple[int, Participant]]] = {}
+        self._negated_scores: list[float] = []  # ascending, i.e. by descending score
+        self._slots: dict[str, int] = {}  # registration order of the participants
+        self._next_slot = 0
+        for participant in participants:
+            self.add(participant)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def add(self, participant: Participant) -> None:
+        """Register the participant (after the already registered ones) in the bucket of its score."""
+        self._slots[participant.player.identifier] = self._next_slot
+        self._next_slot += 1
+        self._add_to_bucket(participant)
+        participant.standings = self
+
+    def remove(self, participant: Participant) -> None:
+        """Unregister the participant."""
+        self._remove_from_bucket(participant, participant.score)
+        del self._slots[participant.player.identifier]
+        participant.standings = None
+
+    def update(self, participant: Participant, previous_score: float) -> None:
+        """Move the participant from the bucket of its previous score to the bucket of its current one."""
+        self._remove_from_bucket(participant, previous_score)
+        self._add_to_bucket(participant)
+
+    def _add_to_bucket(self, participant: Participant) -> None:
+        bucket = self._buckets.get(participant.score)
+        if bucket is None:
+            bucket = self._buckets[participant.score] = []
+            insort(self._negated_scores, -participant.score)
+        insort(bucket, (self._slots[participant.player.identifier], participant), key=_slot_of)
+
+    def _remove_from_bucket(self, participant: Participant, score: float) -> None:
+        bucket = self._buckets[score]
+        del bucket[bisect_left(bucket, self._slots[participant.player.identifier], key=_slot_of)]
+        if not bucket:
+            del self._buckets[score]
+            del self._negated_scores[bisect_left(self._negated_scores, -score)]
+
+    def tie_groups(self) -> Iterator[list[Participant]]:
+        """Yield the participants with the same score, by descending score."""
+        for negated_score in self._negated_scores:
+            yield [participant for _, participant in self._buckets[-negated_score]]
+
+    def top(self, total: int) -> list[Participant]:
+        """Return the given number of best participants (in O(k), ties being cut in registration order)."""
+        best_participants: list[Participant] = []
+        for negated_score in self._negated_scores:
+            if len(best_participants) >= total:
+                break
+            bucket = islice(self._buckets[-negated_score], total - len(best_participants))
+            best_participants.extend(participant for _, participant in bucket)
+        return best_participants
+
+    def top_with_ties(self, total: int) -> list[Participant]:
+        """Return the given number of best participants, and those tied with the last one."""
+        best_participants: list[Participant] = []
+        for tie_group in self.tie_groups():
+            if len(best_participants) >= total:
+                break
+            best_participants.extend(tie_group)
+        return best_participants
+
+    def rank(self, participant: Participant) -> int:
+        """Return the rank of the participant (1 for the best ones, tied participants sharing the same rank)."""
+        rank = 1
+        for negated_score in self._negated_scores:
+            if -negated_score == participant.score:
+                return rank
+            rank += len(self._buckets[-negated_score])
+        raise KeyError(participant.player.identifier)
@@ -0,0 +1,99 @@
+"""Define the tournaments status index, answering the past/ongoing/future filters without scanning all tournaments."""
+
+from bisect import bisect_left, bisect_right, insort
+from datetime import date
+from operator import itemgetter
+
+from .tournament import Tournament, TournamentHeader
+
+_date_of = itemgetter(0)
+
+
+class TournamentsStatusIndex:
+    """Indexes of the tournaments sorted by begin date and by end date, and set of the ongoing ones.
+
+    The past (or future) tournaments are a prefix of the end dates (or a suffix of the begin dates) found by
+    bisection, only those ending (or beginning) today having their rounds checked. The ongoing tournaments (started
+    and not ended) are maintained explicitly, the model updating the index when a tournament starts or ends."""
+
+    statuses = ("past", "future", "ongoing", "all")
+
+    def __init__(self, tournaments: list[Tournament | TournamentHeader]) -> None:
+        self._tournaments = tournaments  # the list of the model, indexed in place
+        self._by_begin_date: list[tuple[date, int]] = []
+        self._by_end_date: list[tuple[date, int]] = []
+        self._ongoing: set[int] = set()
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Index all the tournaments (e.g. once loaded)."""
+        self._by_begin_date = sorted((tournament.begin_date, t) for t, tournament in enumerate(self._tournaments))
+        self._by_end_date = sorted((tournament.end_date, t) for t, tournament in enumerate(self._tournaments))
+        self._ongoing = {t for t, tournament in enumerate(self._tournaments) if self._is_ongoing(tournament)}
+
+    def add(self, tournament_t: int) -> None:
+        """Index the given new tournament."""
+        tournament = self._tournaments[tournament_t]
+        insort(self._by_begin_date, (tournament.begin_date, tournament_t))
+        insort(self._by_end_date, (tournament.end_date, tournament_t))
+        self.update(tournament_t)
+
+    def update(self, tournament_t: int) -> None:
+        """Update the index once the given tournament started or ended."""
+        if self._is_ongoing(self._tournaments[tournament_t]):
+            self._ongoing.add(tournament_t)
+        else:
+            self._ongoing.discard(tournament_t)
+
+    @staticmethod
+    def _is_ongoing(tournament: Tournament | TournamentHeader) -> bool:
+        return tournament.is_started and not tournament.is_ended
+
+    def _ending_today(self, today: date) -> tuple[int, list[int]]:
+        """Return the number of tournaments ended before today, and the indexes of those ending today."""
+        first = bisect_left(self._by_end_date, today, key=_date_of)
+        last = bisect_right(self._by_end_date, today, lo=first, key=_date_of)
+        return first, [t for _, t in self._by_end_date[first:last] if self._tournaments[t].is_ended]
+
+    def _beginning_today(self, today: date) -> tuple[int, list[int]]:
+        """Return the position of the first tournament beginning after today, and the not started ones of today."""
+        first = bisect_left(self._by_begin_date, today, key=_date_of)
+        last = bisect_right(self._by_begin_date, today, lo=first, key=_date_of)
+        return last, [t for _, t in self._by_begin_date[first:last] if not self._tournaments[t].is_started]
+
+    def count(self, status: str, today: date) -> int:
+        """Return the number of tournaments of the given status (see select)."""
+        if status == "past":
+            total_ended_before, ending_today = self._ending_today(today)
+            return total_ended_before + len(ending_today)
+        if status == "future":
+            first_after, beginning_today = self._beginning_today(today)
+            return len(self._by_begin_date) - first_after + len(beginning_today)
+        if status == "ongoing":
+            return sum(1 for t in self._ongoing if self._tournaments[t].begin_date <= today)
+        if status == "all":
+            return len(self._tournaments)
+        raise KeyError(status)
+
+    def select(self, status: str, today: date) -> list[int]:
+        """Return the sorted indexes of the tournaments of the given status.
+
+        past: ended before today (or today, all rounds being finished), future: beginning after today (or today, not
+        started yet), ongoing: begun, started and not ended, all: every tournament."""
+        if status == "past":
+            total_ended_before, selected = self._ending_today(today)
+            selected.extend(t for _, t in self._by_end_date[:total_ended_before])
+        elif status == "future":
+            first_after, selected = self._beginning_today(today)
+            selected.extend(t for _, t in self._by_begin_date[first_after:])
+        elif status == "ongoing":
+            selected = [t for t in self._ongoing if self._tournaments[t].begin_date <= today]
+        elif status == "all":
+            return list(range(len(self._tournaments)))
+        else:
+            raise KeyError(status)
+        return sorted(selected)
+
+    def ordered_by_begin_date(self) -> list[int]:
+        """Return the indexes of the tournaments by begin date (then by creation order)."""
+        return [t for _, t in self._by_begin_date]
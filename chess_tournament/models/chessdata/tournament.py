@@ -1,14 +1,18 @@
 """Define tournaments related data structures."""
 
+from dataclasses import replace
 from datetime import date
-from typing import Any, Optional, Self
+from typing import Any, Callable, Optional, Self
 
 from ..serialization import Serializable
 from .match import Match
 from .matchmaking import MatchMaking
+from .pairing_config import PairingConfig
 from .participant import Participant
 from .player import Player
 from .round import Round
+from .round_robin import RoundSchedule, round_robin_error
+from .standings import Standings
 
 
 class Tournament(Serializable, MatchMaking):
@@ -23,16 +27,29 @@ class Tournament(Serializable, MatchMaking):
         total_rounds: int = 4,
         participants: Optional[list[Participant]] = None,
         rounds: Optional[list[Round]] = None,
+        pairing_config: Optional[PairingConfig] = None,
+        round_robin: bool = False,
+        round_robin_schedule: Optional[list[RoundSchedule]] = None,
     ):
-        super(MatchMaking, self).__init__()
-        self._remaining_matches_possibilities: set[tuple[Participant, Participant]] = set()
+        super().__init__()
         self.name = name
         self.location = location
         self.begin_date = begin_date
         self.end_date = end_date
         self.total_rounds = total_rounds
         self.participants = participants if participants is not None else []
+        self.participants_by_id = {participant.player.identifier: participant for participant in self.participants}
+        self.standings = Standings(self.participants)
         self.rounds = rounds if rounds is not None else []
+        self.total_all_matches = sum(round.total_matches for round in self.rounds)  # kept by add_round
+        self.pairing_config = pairing_config if pairing_config is not None else PairingConfig()
+        self.round_robin = round_robin  # each round looked up in the schedule computed when the tournament starts
+        self.round_robin_schedule = round_robin_schedule
+        for participant in self.participants:
+            participant.set_parent(self)
+        for round in self.rounds:
+            round.set_parent(self)
+        self.reconstruct_played_pairs_from_past_matches(self.participants, self.rounds)
 
     @property
     def total_finished_rounds(self) -> int:
@@ -50,6 +67,11 @@ class Tournament(Serializable, MatchMaking):
         """Order tournaments by starting date."""
         return self.begin_date < other.begin_date
 
+    @property
+    def is_next_round_missing(self) -> bool:
+        """Return True if the last round ended but the next one was not generated, False otherwise."""
+        return bool(self.rounds) and self.rounds[-1].is_ended and len(self.rounds) < self.total_rounds
+
     @property
     def current_round(self) -> Round:
         """Return the last started round."""
@@ -69,16 +91,61 @@ class Tournament(Serializable, MatchMaking):
         """Return True if at least one round has been generated, False otherwise."""
         return self.total_started_rounds > 0
 
+    @property
+    def start_error(self) -> Optional[str]:
+        """Return why the tournament cannot start with its participants, None if it can."""
+        if len(self.participants) < 2:
+            return "Not enough participants"
+        if len(self.participants) % 2:
+            return "Select an even number of participants"
+        if self.round_robin:
+            return round_robin_error(len(self.participants), self.total_rounds)
+        return None
+
     @property
     def total_started_rounds(self) -> int:
         """Return the total number of rounds generated."""
         return len(self.rounds)
 
-    def set_next_round(self) -> None:
-        """Do the matchmaking and register the round internally."""
+    def generate_next_round(self) -> Round:
+        """Do the matchmaking of the next round, without registering it (e.g. in a background worker)."""
         matches_list = self.generate_pairs(self.total_started_rounds, self.participants)
-        round = Round(name=f"Round {(len(self.rounds) + 1)}", matches=matches_list)
+        return Round(name=f"Round {(len(self.rounds) + 1)}", matches=matches_list, **self.pairing_stats)
+
+    def add_round(self, round: Round) -> None:
+        """Register the given round internally."""
         self.rounds.append(round)
+        self.total_all_matches += round.total_matches
+        round.set_parent(self)
+
+    def set_next_round(self) -> None:
+        """Do the matchmaking and register the round internally."""
+        self.add_round(self.generate_next_round())
+
+    def add_generated_round(self, encoded_round: dict[str, Any]) -> Round:
+        """Register the encoded next round generated elsewhere (e.g. in a worker process), return the decoded round."""
+        round = Round.decode(encoded_round, self.participants_by_id)
+        pairs = [match.participants_pair for match in round.matches]
+        self.register_generated_pairs(self.total_started_rounds, self.participants, pairs)
+        self.add_round(round)
+        return round
+
+    def add_participant(self, participant: Participant) -> None:
+        """Register a new participant."""
+        self.participants.append(participant)
+        self.participants_by_id[participant.player.identifier] = participant
+        self.standings.add(participant)
+        participant.set_parent(self)
+
+    def delete_participant(self, player_id: str) -> bool:
+        """Unregister the participant of the given player ID, return True if found, False otherwise."""
+        participant = self.participants_by_id.pop(player_id, None)
+        if participant is None:
+            return False
+        self.participants.remove(participant)
+        self.standings.remove(participant)
+        self.set_dirty()
+        return True
 
     def start_round(self) -> None:
         """Register the starting time of the current round."""
@@ -98,8 +165,11 @@ class Tournament(Serializable, MatchMaking):
             "begin_date": str(self.begin_date),
             "end_date": str(self.end_date),
             "total_rounds": int(self.total_rounds),
-            "participants": [participant.encode() for participant in self.participants],
-            "rounds": [round.encode() for round in self.rounds],
+            "participants": [participant.cached_encode() for participant in self.participants],
+            "rounds": [round.cached_encode() for round in self.rounds],
+            "pairing_config": self.pairing_config.encode(),
+            "round_robin": self.round_robin,
+            "round_robin_schedule": self.round_robin_schedule,
         }
 
     @classmethod
@@ -110,9 +180,82 @@ class Tournament(Serializable, MatchMaking):
         encoded_data["participants"] = [
             Participant.decode(encoded_participant, players_db) for encoded_participant in encoded_data["participants"]
         ]
+        if "pairing_config" in encoded_data:  # not stored by the previous versions
+            encoded_data["pairing_config"] = PairingConfig.decode(encoded_data["pairing_config"])
+        participants_db = {participant.player.identifier: participant for participant in encoded_data["participants"]}
         encoded_data["rounds"] = [
-            Round.decode(encoded_round, encoded_data["participants"]) for encoded_round in encoded_data["rounds"]
+            Round.decode(encoded_round, participants_db) for encoded_round in encoded_data["rounds"]
         ]
-        tournament = cls(**encoded_data)
-        tournament.reconstruct_remaining_possibilities_from_past_matches(tournament.participants, tournament.rounds)
-        return tournament
+        return cls(**encoded_data)
+
+
+def generate_encoded_next_round(tournament: Tournament, num_search_workers: int) -> dict[str, Any]:
+    """Return the encoded next round of the given tournament, solved with at most the given number of search workers.
+
+    Run by the worker processes of the batch matchmaking, the round being registered by the caller."""
+    if not 0 < tournament.pairing_config.num_search_workers <= num_search_workers:
+        tournament.pairing_config = replace(tournament.pairing_config, num_search_workers=num_search_workers)
+    return tournament.generate_next_round().encode()
+
+
+class TournamentHeader:
+    """Tournament header data (enough to list and filter tournaments), the whole tournament being loaded on demand."""
+
+    def __init__(
+        self,
+        name: str,
+        location: str,
+        begin_date: date,
+        end_date: date,
+        total_rounds: int,
+        total_started_rounds: int,
+        total_finished_rounds: int,
+        encoded_loader: Callable[[], dict[str, Any]],
+        players_db: dict[str, Player],
+    ):
+        self.name = name
+        self.location = location
+        self.begin_date = begin_date
+        self.end_date = end_date
+        self.total_rounds = total_rounds
+        self.total_started_rounds = total_started_rounds
+        self.total_finished_rounds = total_finished_rounds
+        self._encoded_loader = encoded_loader
+        self._players_db = players_db
+
+    __str__ = Tournament.__str__
+    __lt__ = Tournament.__lt__
+    is_ended = Tournament.is_ended
+    is_started = Tournament.is_started
+
+    @classmethod
+    def from_encoded(
+        cls,
+        encoded_data: dict[str, Any],
+        players_db: dict[str, Player],
+        encoded_loader: Optional[Callable[[], dict[str, Any]]] = None,
+    ) -> Self:
+        """Instantiate a header from the encoded tournament (by default kept to be decoded on demand)."""
+        encoded_rounds = encoded_data.get("rounds", [])
+        total_finished_rounds = len(encoded_rounds)
+        if encoded_rounds and not encoded_rounds[-1]["end_time"]:
+            total_finished_rounds -= 1
+        return cls(
+            name=encoded_data["name"],
+            location=encoded_data["location"],
+            begin_date=date.fromisoformat(encoded_data["begin_date"]),
+            end_date=date.fromisoformat(encoded_data["end_date"]),
+            total_rounds=int(encoded_data["total_rounds"]),
+            total_started_rounds=encoded_data.get("total_started_rounds", len(encoded_rounds)),
+            total_finished_rounds=encoded_data.get("total_finished_rounds", total_finished_rounds),
+            encoded_loader=encoded_loader if encoded_loader is not None else lambda: encoded_data,
+            players_db=players_db,
+        )
+
+    def cached_encode(self) -> dict[str, Any]:
+        """Return the encoded tournament (as stored, since it cannot have changed)."""
+        return self._encoded_loader()
+
+    def load(self) -> Tournament:
+        """Decode the whole tournament."""
+        return Tournament.decode(self._encoded_loader(), self._players_db)
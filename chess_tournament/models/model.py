@@ -1,12 +1,30 @@
 """Define all the model methods required by the controller."""
 
+import multiprocessing
+import os
+import time
 from collections.abc import KeysView
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import replace
 from datetime import date
 from pathlib import Path
-from typing import Any, Callable, Iterator, Optional
-
-from .chessdata import Match, Participant, Player, Tournament
+from typing import Any, Optional
+
+from .chessdata import (
+    Match,
+    PairingCache,
+    PairingConfig,
+    Participant,
+    Player,
+    Round,
+    Tournament,
+    TournamentHeader,
+    TournamentsStatusIndex,
+    generate_encoded_next_round,
+)
 from .save_load_system import BackupManager, save_at_the_end
+from .storage import IStorage, JSONStorage, Operation
+from .storage.interface import CompleteLog
 
 Log = str
 
@@ -19,26 +37,90 @@ class InconsistentDates(Exception):
     """Exception raised when ending is anterior to starting."""
 
 
+class UnreadyTournament(Exception):
+    """Exception raised when a tournament cannot start with its participants (e.g. round-robin rounds)."""
+
+
 class Model(BackupManager):
     """Expose public methods to allow chess data manipulation from the controller.
 
     This class abstract the internal data structure to the controller."""
 
-    status_filter: dict[str, Callable[[Tournament], bool]] = {
-        "past": lambda tournament: tournament.end_date < date.today()
-        or (tournament.end_date == date.today() and tournament.is_ended),
-        "future": lambda tournament: tournament.begin_date > date.today()
-        or (tournament.begin_date == date.today() and not tournament.total_started_rounds),
-        "ongoing": lambda tournament: tournament.begin_date <= date.today()
-        and tournament.is_started
-        and not tournament.is_ended,
-        "all": lambda tournament: True,
-    }
-
-    def __init__(self, data_path: Path) -> None:
-        super().__init__(data_path)
+    def __init__(
+        self,
+        data_path: Path,
+        storage_class: type[IStorage] = JSONStorage,
+        pairing_config: Optional[PairingConfig] = None,
+        persistent_pairing_cache: bool = False,
+        pairing_overrides: Optional[dict[str, Any]] = None,
+    ) -> None:
+        super().__init__(data_path, storage_class)
         self.players = {}
         self.tournaments = []
+        self.pairing_config = pairing_config if pairing_config is not None else PairingConfig()  # new tournaments
+        self.pairing_overrides = pairing_overrides or {}  # settings replaced in the loaded tournaments (and saved)
+        # the matchmaking states already solved are served by the cache (kept in the data path if persistent)
+        self.pairing_cache = PairingCache(data_path / "pairing_cache" if persistent_pairing_cache else None)
+        # the matchmaking runs in a background worker (the solvers releasing the GIL), one tournament at a time
+        self._matchmaking_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="matchmaking")
+        self._next_rounds: dict[int, Future[Round]] = {}  # pending matchmaking
+        self._next_rounds_start_times: dict[int, float] = {}  # set by the worker once the matchmaking starts
+        self._speculations: set[int] = set()  # tournaments whose next round may be speculatively paired
+        self._status_index = TournamentsStatusIndex(self.tournaments)  # past/ongoing/future tournaments
+
+    def load(self, lazy: bool = False) -> tuple[CompleteLog, CompleteLog]:
+        """Load model’s data (see BackupManager.load), index the tournaments status and override their settings."""
+        load_logs = super().load(lazy)
+        self._status_index.rebuild()
+        is_pairing_config_overridden = False
+        for tournament_t, tournament in enumerate(self.tournaments):
+            if isinstance(tournament, Tournament):  # the headers being set up once loaded
+                is_pairing_config_overridden |= self._set_up_matchmaking(tournament_t)
+        if is_pairing_config_overridden:
+            self.save(tournaments_file=True)
+        return load_logs
+
+    def _load_tournament(self, tournament_t: int) -> Tournament:
+        """Return the given tournament (loading it the first time it is needed, if only its header was loaded)."""
+        tournament = self.tournaments[tournament_t]
+        if isinstance(tournament, TournamentHeader):
+            tournament = tournament.load()
+            self.tournaments[tournament_t] = tournament
+            if self._set_up_matchmaking(tournament_t):
+                self.save(tournaments_file=True)
+        return tournament
+
+    def _set_up_matchmaking(self, tournament_t: int) -> bool:
+        """Share the model pairing cache with the given loaded tournament, and override its pairing settings.
+
+        Return True if any of its pairing settings changed."""
+        tournament = self.tournaments[tournament_t]
+        tournament.pairing_cache = self.pairing_cache
+        pairing_config = replace(tournament.pairing_config, **self.pairing_overrides)
+        if pairing_config == tournament.pairing_config:
+            return False
+        tournament.pairing_config = pairing_config
+        self.record(Operation.SET_PAIRING_CONFIG, tournament_t=tournament_t, pairing_config=pairing_config.encode())
+        return True
+
+    def _get_tournament(self, tournament_t: int) -> Tournament:
+        """Return the given tournament, with its next round registered if its matchmaking is pending (or missing)."""
+        tournament = self._load_tournament(tournament_t)
+        if tournament_t not in self._next_rounds and tournament.is_next_round_missing:
+            self.request_next_round(tournament_t)  # e.g. the application ended during the matchmaking
+        if tournament_t in self._next_rounds:
+            self._register_next_round(tournament_t)
+        return tournament
+
+    def close(self) -> None:
+        """Wait for the pending matchmaking (registering their rounds), then close the storage backend."""
+        self._stop_speculations()
+        if self._next_rounds:
+            for tournament_t in list(self._next_rounds):
+                self._register_next_round(tournament_t, save=False)
+            self.save(tournaments_file=True)
+        self._matchmaking_worker.shutdown()
+        super().close()
 
     # -- players --------------------------------------------------------------
 
@@ -56,6 +138,7 @@ class Model(BackupManager):
                     player_data["birth_date"] = date.fromisoformat(player_data["birth_date"])
                 # create new player
                 self.players[player_data["identifier"]] = Player(**player_data)
+                self.record(Operation.ADD_PLAYER, player=self.players[player_data["identifier"]].encode())
             else:
                 raise AlreadyUsedID(player_data["identifier"])
         # Log only the last one (players are added 1 by 1 from the interface)
@@ -68,6 +151,8 @@ class Model(BackupManager):
         player.first_name = player_data["first_name"].capitalize()
         player.last_name = player_data["last_name"].upper()
         player.birth_date = date.fromisoformat(player_data["birth_date"])
+        player.set_dirty()
+        self.record(Operation.EDIT_PLAYER, player=player.encode())
         return str(player)
 
     def get_players_id(self) -> KeysView:
@@ -97,97 +182,269 @@ class Model(BackupManager):
     @save_at_the_end(tournaments_file=True)
     def add_participants_to_tournament(self, tournament_t: int, *participants_data: str) -> tuple[Log, Log]:
         """Create participants from players and link them to the given tournaments."""
-        tournament = self.tournaments[tournament_t]
+        tournament = self._get_tournament(tournament_t)
         for player_id in participants_data:
             participant = Participant(self.players[player_id])
-            tournament.participants.append(participant)
+            tournament.add_participant(participant)
+            self.record(Operation.ADD_PARTICIPANT, tournament_t=tournament_t, participant=participant.encode())
         # Log only the last one (participants are added 1 by 1 from the interface)
         return str(participant.player), str(tournament)
 
     @save_at_the_end(tournaments_file=True)
     def delete_participants_from_tournament(self, tournament_t: int, *participants_data: str) -> tuple[Log, Log]:
         """Create participants from players and link them to the given tournaments."""
-        tournament = self.tournaments[tournament_t]
+        tournament = self._get_tournament(tournament_t)
         for player_id in participants_data:
             participant_to_log = str(self.players[player_id])
-            for p_index, participant in enumerate(tournament.participants):
-                if participant.player.identifier == player_id:
-                    del tournament.participants[p_index]
-                    break
+            if tournament.delete_participant(player_id):
+                self.record(Operation.DELETE_PARTICIPANT, tournament_t=tournament_t, player=player_id)
         # Log only the last one (participants are deleted 1 by 1 from the interface)
         return participant_to_log, str(tournament)
 
     def get_total_participants(self, tournament_t: int) -> int:
         """Return the total number of participant from a given tournament."""
-        return len(self.tournaments[tournament_t].participants)
+        return len(self._get_tournament(tournament_t).participants)
 
     def get_ordered_participants_str(self, tournament_t: int) -> list[str]:
         """Return participants descriptions."""
         sorted_participants = sorted(
-            self.tournaments[tournament_t].participants,
+            self._get_tournament(tournament_t).participants,
             key=lambda participant: participant.player,
         )
         return [str(participant) for participant in sorted_participants]
 
-    def get_participants_id(self, tournament_t: int) -> Iterator[str]:
-        """Return the participants ID from a given tournament."""
-        return (participant.player.identifier for participant in self.tournaments[tournament_t].participants)
+    def get_participants_id(self, tournament_t: int) -> KeysView[str]:
+        """Return the participants ID from a given tournament (as a view, for constant time membership checks)."""
+        return self._get_tournament(tournament_t).participants_by_id.keys()
 
     def _get_winners(self, tournament_t: int) -> list[str]:
         """Return strings representation of tournaments winners."""
-        tournament = self.tournaments[tournament_t]
-        ordered_participants = sorted(tournament.participants)
-        bests = []
-        for i in range(len(ordered_participants)):
-            bests.append(str(ordered_participants[i]))
-            if i >= 2:
-                # in case of tie, continue listing winners with the same score
-                if (
-                    len(ordered_participants) > i + 1
-                    and ordered_participants[i].score == ordered_participants[i + 1].score
-                ):
-                    continue
-                break
-        return bests
+        # the 3 best participants, and those tied with the third one (read from the live standings)
+        return [str(participant) for participant in self._get_tournament(tournament_t).standings.top_with_ties(3)]
 
     # -- matches --------------------------------------------------------------
 
     @save_at_the_end(tournaments_file=True)
     def register_score(self, tournament_t: int, match_m: int, first_player_result_str: str) -> Log:
         """Register participant score for a given match."""
-        tournament = self.tournaments[tournament_t]
+        tournament = self._get_tournament(tournament_t)
         round = tournament.current_round
+        round_r = tournament.current_round_index
         first_result = Match.Points[first_player_result_str]
         pair_result = Match.get_pairs_score_from_first(first_result)
-        round.matches[match_m].register_score(pair_result)
-        are_all_matches_ended = all([bool(match.participants_scores is not None) for match in round.matches])
-        if are_all_matches_ended:
+        match = round.register_score(match_m, pair_result)
+        self.record(
+            Operation.REGISTER_SCORE,
+            tournament_t=tournament_t,
+            round_r=round_r,
+            match_m=match_m,
+            participants_scores=[score.name for score in pair_result],
+        )
+        if round.are_all_matches_ended:
             round.end_round()
+            self.record(Operation.END_ROUND, tournament_t=tournament_t, round_r=round_r, end_time=str(round.end_time))
             if tournament.total_finished_rounds < tournament.total_rounds:
-                tournament.set_next_round()
-        return str(round.matches[match_m])
+                self.request_next_round(tournament_t)  # the score is saved without waiting for the matchmaking
+            else:
+                self._status_index.update(tournament_t)  # ended
+        else:
+            self._speculate_next_round(tournament_t)
+        return str(match)
+
+    def _set_next_round(self, tournament_t: int) -> None:
+        """Do the matchmaking of the next round of the given tournament (waiting for it)."""
+        self.request_next_round(tournament_t)
+        self._register_next_round(tournament_t)
+
+    # -- background matchmaking -----------------------------------------------
+
+    def request_next_round(self, tournament_t: int) -> Future[Round]:
+        """Start the matchmaking of the next round of the given tournament in the background worker.
+
+        The round is registered once collected (or when the tournament is needed), the future being returned. The
+        speculative pairings are stopped, since the actual matchmaking would wait for them in the worker."""
+        if tournament_t not in self._next_rounds:
+            tournament = self._load_tournament(tournament_t)
+            self._stop_speculations()
+            tournament.pairing_engine.is_stop_requested = False
+            self._next_rounds_start_times.pop(tournament_t, None)
+            self._next_rounds[tournament_t] = self._matchmaking_worker.submit(self._generate_next_round, tournament_t)
+        return self._next_rounds[tournament_t]
+
+    def _generate_next_round(self, tournament_t: int) -> Round:
+        """Do the matchmaking of the next round of the given tournament (run by the worker)."""
+        self._next_rounds_start_times[tournament_t] = time.perf_counter()
+        return self.tournaments[tournament_t].generate_next_round()
+
+    def _speculate_next_round(self, tournament_t: int) -> None:
+        """Pair the next round of every outcome of the open matches in the background worker, once they are few.
+
+        The pairings are kept in the pairing cache: the matchmaking of the actual outcome is then served at once."""
+        tournament = self.tournaments[tournament_t]
+        if (
+            tournament.current_round.total_open_matches > tournament.pairing_config.speculative_matches
+            or tournament.total_finished_rounds + 1 >= tournament.total_rounds
+            or tournament.round_robin  # the next round is already scheduled
+        ):
+            return
+        open_pairs = [match.participants_pair for match in tournament.current_round.matches if not match.is_ended]
+        tournament.stop_speculation()  # the outcomes of the previous speculative pairing are not all possible anymore
+        self._matchmaking_worker.submit(tournament.speculate_pairs, tournament.speculative_states(open_pairs))
+        self._speculations.add(tournament_t)
+
+    def _stop_speculations(self) -> None:
+        """Stop the speculative pairings of all the tournaments (those queued in the worker ending at once)."""
+        for tournament_t in self._speculations:
+            self.tournaments[tournament_t].stop_speculation()
+        self._speculations.clear()
+
+    def is_next_round_pending(self, tournament_t: int) -> bool:
+        """Return True if the matchmaking of the next round of the given tournament is not collected yet."""
+        return tournament_t in self._next_rounds
+
+    def get_next_round_progress(self, tournament_t: int) -> tuple[float, float]:
+        """Return the elapsed time of the pending matchmaking and its solver time limit (in seconds, 0: none).
+
+        The time spent waiting for the worker (e.g. behind another tournament matchmaking) is not counted."""
+        start_time = self._next_rounds_start_times.get(tournament_t)
+        elapsed_time = 0.0 if start_time is None else time.perf_counter() - start_time
+        return elapsed_time, self.tournaments[tournament_t].pairing_config.max_time_in_seconds
+
+    def stop_next_round_search(self, tournament_t: int) -> None:
+        """Ask the pending matchmaking to stop its search, the best pairing found so far being used."""
+        if tournament_t in self._next_rounds:
+            self.tournaments[tournament_t].stop_pairing()
+
+    def collect_next_round(self, tournament_t: int, timeout: Optional[float] = None) -> bool:
+        """Register the next round once its matchmaking ended (waiting at most timeout seconds).
+
+        Return True if the round is registered (or was not pending), False if the matchmaking is still running."""
+        if tournament_t not in self._next_rounds:
+            return True
+        future = self._next_rounds[tournament_t]
+        if not future.done():
+            try:
+                future.exception(timeout)
+            except TimeoutError:
+                return False
+        self._register_next_round(tournament_t)
+        return True
+
+    def _register_next_round(self, tournament_t: int, save: bool = True) -> None:
+        """Wait for the pending matchmaking of the given tournament, then register its round (and save it)."""
+        future = self._next_rounds.pop(tournament_t)
+        self._next_rounds_start_times.pop(tournament_t, None)
+        round = future.result()
+        self.tournaments[tournament_t].add_round(round)
+        self._record_new_round(tournament_t, round)
+        if save:
+            self.save(tournaments_file=True)
+
+    def _record_new_round(self, tournament_t: int, round: Round) -> None:
+        """Notify the storage backend of the registered next round of the given tournament."""
+        tournament = self.tournaments[tournament_t]
+        if tournament.total_started_rounds == 1:
+            self._status_index.update(tournament_t)  # started
+            if tournament.round_robin:  # the schedule is computed with the first round
+                self.record(
+                    Operation.SET_ROUND_ROBIN_SCHEDULE,
+                    tournament_t=tournament_t,
+                    schedule=tournament.round_robin_schedule,
+                )
+        self.record(
+            Operation.ADD_ROUND,
+            tournament_t=tournament_t,
+            round_r=tournament.current_round_index,
+            round=round.encode(),
+        )
+
+    # -- batch matchmaking ----------------------------------------------------
+
+    def get_tournaments_awaiting_next_round(self) -> list[int]:
+        """Return the indexes of the tournaments whose last round ended, the next one being not registered yet."""
+        return [
+            tournament_t
+            for tournament_t, tournament in enumerate(self.tournaments)
+            if 0 < tournament.total_finished_rounds == tournament.total_started_rounds < tournament.total_rounds
+        ]
 
     @save_at_the_end(tournaments_file=True)
+    def generate_next_rounds(self, tournaments_t: list[int], max_workers: int = 0) -> list[tuple[bool, Log]]:
+        """Generate the next round of the given tournaments concurrently in worker processes, then save them at once.
+
+        The worker processes share a budget of solver workers (0: as many as available cores), the tournaments whose
+        pairing is cached (or whose background matchmaking already runs) being served in this process. A log is
+        returned for each tournament, a failed matchmaking being requested again in the background worker."""
+
+        def generated_log(tournament: Tournament) -> tuple[bool, Log]:
+            round = tournament.current_round
+            return True, f"{tournament.name}: {round.name} >>> {len(round.matches)} matches generated"
+
+        logs: list[tuple[bool, Log]] = []
+        batch: dict[int, Tournament] = {}
+        for tournament_t in tournaments_t:
+            tournament = self._load_tournament(tournament_t)
+            if tournament_t in self._next_rounds and not self._next_rounds[tournament_t].cancel():
+                self._register_next_round(tournament_t, save=False)  # already running in the background worker
+                logs.append(generated_log(tournament))
+                continue
+            self._next_rounds.pop(tournament_t, None)
+            self._next_rounds_start_times.pop(tournament_t, None)
+            if not tournament.is_next_round_missing:
+                logs.append((False, f"{tournament.name}: no round to generate"))
+            elif tournament.round_robin or tournament.is_next_pairing_cached():
+                tournament.set_next_round()  # looked up in the schedule or the pairing cache
+                self._record_new_round(tournament_t, tournament.current_round)
+                logs.append(generated_log(tournament))
+            else:
+                tournament.stop_speculation()
+                batch[tournament_t] = tournament
+        if not batch:
+            return logs
+        total_workers = max_workers or os.cpu_count() or 1
+        total_processes = min(len(batch), total_workers)
+        num_search_workers = max(1, total_workers // total_processes)
+        failed_tournaments_t = []
+        # the worker processes are spawned, since forking a process running the background worker thread is unsafe
+        with ProcessPoolExecutor(total_processes, mp_context=multiprocessing.get_context("spawn")) as executor:
+            futures = {
+                tournament_t: executor.submit(generate_encoded_next_round, tournament, num_search_workers)
+                for tournament_t, tournament in batch.items()
+            }
+            for tournament_t, future in futures.items():
+                tournament = batch[tournament_t]
+                try:
+                    round = tournament.add_generated_round(future.result())
+                except Exception as err:  # e.g. a crashed worker process
+                    failed_tournaments_t.append(tournament_t)
+                    logs.append((False, f"{tournament.name}: matchmaking failed ({err!r}), retried in the background"))
+                    continue
+                self._record_new_round(tournament_t, round)
+                logs.append(generated_log(tournament))
+        for tournament_t in failed_tournaments_t:  # once the worker processes are released
+            self.request_next_round(tournament_t)
+        return logs
+
     def get_round_matches(self, tournament_t: int) -> tuple[Match, ...]:
-        """Return matches of the given round."""
-        round_r = self.tournaments[tournament_t].current_round_index
-        if round_r == len(self.tournaments[tournament_t].rounds):
-            self.tournaments[tournament_t].set_next_round()
-        return self.tournaments[tournament_t].get_round_matches(round_r)
+        """Return matches of the given round (the generated round being saved once registered)."""
+        tournament = self._get_tournament(tournament_t)
+        round_r = tournament.current_round_index
+        if round_r == len(tournament.rounds):
+            self._set_next_round(tournament_t)
+        return tournament.get_round_matches(round_r)
 
     def get_total_matches(self, tournament_t: int) -> int:
         """Return the total number of matches from a given tournament’s round."""
-        round_r = self.tournaments[tournament_t].current_round_index
-        return len(self.tournaments[tournament_t].get_round_matches(round_r))
+        tournament = self._get_tournament(tournament_t)
+        return tournament.current_round.total_matches if tournament.is_started else 0
 
     def get_total_all_matches(self, tournament_t: int) -> int:
         """Return the total number of matches from a given tournaments (all rounds)."""
-        tournament = self.tournaments[tournament_t]
-        return sum(len(tournament.get_round_matches(round_r)) for round_r in range(tournament.total_started_rounds))
+        return self._get_tournament(tournament_t).total_all_matches
 
     def get_all_matches_str(self, tournament_t: int) -> list[str]:
         """Return matches descriptions."""
-        tournament = self.tournaments[tournament_t]
+        tournament = self._get_tournament(tournament_t)
         matches = []
         for r, round in enumerate(tournament.rounds):
             matches.append(round.name)
@@ -196,14 +453,17 @@ class Model(BackupManager):
 
     def start_tournament(self, tournament_t: int) -> tuple[Log, int]:
         """Start the given tournament (and generate the first round matches)."""
+        start_error = self._get_tournament(tournament_t).start_error
+        if start_error is not None:
+            raise UnreadyTournament(start_error)
         matches = self.get_round_matches(tournament_t)
-        return str(self.tournaments[tournament_t]), len(matches)
+        return str(self._get_tournament(tournament_t)), len(matches)
 
     def get_matches_str(self, tournament_t: int, round_r: Optional[int] = None) -> list[str]:
         """Return matches descriptions."""
         if round_r is None:
-            round_r = self.tournaments[tournament_t].current_round_index
-        return [str(match) for match in self.tournaments[tournament_t].get_round_matches(round_r)]
+            round_r = self._get_tournament(tournament_t).current_round_index
+        return [str(match) for match in self._get_tournament(tournament_t).get_round_matches(round_r)]
 
     # -- tournaments ----------------------------------------------------------
 
@@ -214,6 +474,7 @@ class Model(BackupManager):
             tournament_data["name"] = tournament_data["name"].strip()
             tournament_data["location"] = tournament_data["location"].capitalize()
             tournament_data["total_rounds"] = int(tournament_data["total_rounds"])
+            tournament_data["round_robin"] = bool(tournament_data.get("round_robin", False))
             if isinstance(tournament_data["begin_date"], str):
                 tournament_data["begin_date"] = date.fromisoformat(tournament_data["begin_date"])
             if isinstance(tournament_data["end_date"], str):
@@ -223,26 +484,39 @@ class Model(BackupManager):
                     f"{tournament_data['name']} ending date ({tournament_data['end_date']})"
                     + f" is anterior to starting date ({tournament_data['begin_date']})"
                 )
-            tournament = Tournament(**tournament_data)
+            tournament = Tournament(**tournament_data, pairing_config=self.pairing_config)
+            tournament.pairing_cache = self.pairing_cache
             self.tournaments.append(tournament)
+            self._status_index.add(len(self.tournaments) - 1)
+            self.record(
+                Operation.ADD_TOURNAMENT, tournament_t=len(self.tournaments) - 1, tournament=tournament.encode()
+            )
         return str(tournament)  # Log only the last one (tournaments are added 1 by 1 from the interface)
 
     @save_at_the_end(tournaments_file=True)
     def start_round(self, tournament_t: int):
         """Start the next round of the given tournament."""
-        self.tournaments[tournament_t].start_round()
+        tournament = self._get_tournament(tournament_t)
+        tournament.start_round()
+        self.record(
+            Operation.START_ROUND,
+            tournament_t=tournament_t,
+            round_r=tournament.current_round_index,
+            start_time=str(tournament.current_round.start_time),
+        )
 
     def get_ordered_tournaments_str(self) -> list[str]:
         """Return ordered tournaments descriptions."""
-        sorted_tournaments = sorted(self.tournaments)
-        return [str(tournament) for tournament in sorted_tournaments]
+        return [str(self.tournaments[tournament_t]) for tournament_t in self._status_index.ordered_by_begin_date()]
 
     def get_tournaments_states_statistics(self) -> dict[str, int]:
         """Return tournaments states statistics (number of ongoing/past/future/all)."""
-        statistics = {}
-        for filter_name, func_status_filter in self.status_filter.items():
-            statistics[filter_name] = sum(1 for tournament in self.tournaments if func_status_filter(tournament))
-        return statistics
+        today = date.today()
+        return {status: self._status_index.count(status, today) for status in TournamentsStatusIndex.statuses}
+
+    def get_pairing_cache_statistics(self) -> dict[str, int]:
+        """Return the pairing cache statistics (number of hits/misses/entries)."""
+        return self.pairing_cache.statistics
 
     def get_total_tournaments(self) -> int:
         """Return the total number of tournaments."""
@@ -251,14 +525,13 @@ class Model(BackupManager):
     def get_tournaments_str(self, status: str = "all") -> list[tuple[int, str, str]]:
         """Return tournaments descriptions."""
         return [
-            (t_index, tournament.name, str(tournament))
-            for t_index, tournament in enumerate(self.tournaments)
-            if self.status_filter[status](tournament)
+            (t_index, self.tournaments[t_index].name, str(self.tournaments[t_index]))
+            for t_index in self._status_index.select(status, date.today())
         ]
 
     def get_tournament_info(self, tournament_t: int) -> dict[str, Any]:
         """Return various tournament data as dictionary."""
-        tournament = self.tournaments[tournament_t]
+        tournament = self._get_tournament(tournament_t)
         return {
             "str": str(tournament),
             "name": tournament.name,
@@ -269,11 +542,10 @@ class Model(BackupManager):
             "is_current_round_started": tournament.current_round.is_started if tournament.is_started else False,
             "current_round_name": tournament.current_round.name if tournament.is_started else None,
             "total_started_rounds": tournament.total_started_rounds,
-            "total_finished_matches": sum(1 for match in tournament.current_round.matches if match.is_ended)
-            if tournament.total_started_rounds > 0
-            else 0,
-            "total_matches": len(tournament.current_round.matches) if tournament.total_started_rounds > 0 else 0,
+            "total_finished_matches": tournament.current_round.total_finished_matches if tournament.is_started else 0,
+            "total_matches": tournament.current_round.total_matches if tournament.is_started else 0,
             "total_finished_rounds": tournament.total_finished_rounds,
             "total_participants": len(tournament.participants),
+            "start_error": None if tournament.is_started else tournament.start_error,
             "winners": self._get_winners(tournament_t) if tournament.is_ended else None,
         }
@@ -1,11 +1,17 @@
 """Define the interface for the Serializable class that aims to be used on backupable chess data classes."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Self
+from typing import Any, Optional, Self
 
 
 class Serializable(ABC):
-    """To be backupable, the inherited class has to implement an encode and decode methods."""
+    """To be backupable, the inherited class has to implement an encode and decode methods.
+
+    The encoding is cached until the instance is marked as dirty by one of its mutators (a dirty instance also
+    marks its parent, i.e. the instance whose encoding contains its own)."""
+
+    _encoded: Optional[dict] = None
+    _parent: Optional["Serializable"] = None
 
     @abstractmethod
     def encode(self) -> dict:
@@ -15,3 +21,31 @@ class Serializable(ABC):
     @abstractmethod
     def decode(cls, encoded_dict: dict[str, Any], db: Any) -> Self:
         """Instantiate a new object from data in JSON format."""
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the instance state to pickle (without the cached encoding)."""
+        state = self.__dict__.copy()
+        state.pop("_encoded", None)
+        return state
+
+    @property
+    def is_dirty(self) -> bool:
+        """Return True if the instance changed since its last cached encoding, False otherwise."""
+        return self._encoded is None
+
+    def set_dirty(self) -> None:
+        """Invalidate the cached encoding of the instance and of its parents."""
+        self._encoded = None
+        if self._parent is not None and not self._parent.is_dirty:
+            self._parent.set_dirty()
+
+    def set_parent(self, parent: "Serializable") -> None:
+        """Register the instance whose encoding contains this one (and mark it as dirty)."""
+        self._parent = parent
+        parent.set_dirty()
+
+    def cached_encode(self) -> dict:
+        """Return the cached encoding of the instance (encoding it again only if it is dirty)."""
+        if self._encoded is None:
+            self._encoded = self.encode()
+        return self._encoded
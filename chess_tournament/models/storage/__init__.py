@@ -0,0 +1,6 @@
+from .interface import IStorage, Mutation, Operation  # noqa: F401
+from .journal import JournalStorage  # noqa: F401
+from .json_files import JSONStorage  # noqa: F401
+from .sharded import ShardedStorage  # noqa: F401
+from .snapshot_cache import SnapshotCache  # noqa: F401
+from .sqlite import SQLiteStorage  # noqa: F401
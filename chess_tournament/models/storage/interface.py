@@ -0,0 +1,99 @@
+"""Define the interface for all the storage backends, these methods will be used by the backup manager."""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from enum import Enum, auto
+from pathlib import Path
+from typing import Any
+
+from ..chessdata import Player, Tournament, TournamentHeader
+
+LogMessage = str
+CompleteLog = tuple[bool, LogMessage]
+
+
+class Operation(Enum):
+    """List of the model mutations a storage backend can be notified of."""
+
+    ADD_PLAYER = auto()
+    EDIT_PLAYER = auto()
+    ADD_TOURNAMENT = auto()
+    ADD_PARTICIPANT = auto()
+    DELETE_PARTICIPANT = auto()
+    ADD_ROUND = auto()
+    START_ROUND = auto()
+    REGISTER_SCORE = auto()
+    END_ROUND = auto()
+    SET_PAIRING_CONFIG = auto()
+    SET_ROUND_ROBIN_SCHEDULE = auto()
+
+
+@dataclass
+class Mutation:
+    """One model mutation, described with JSON compatible data."""
+
+    operation: Operation
+    data: dict[str, Any]
+
+
+def decode_players(encoded_players: list[dict[str, Any]], players: dict[str, Player]) -> None:
+    """Instantiate the encoded players and register them in the given players dictionary."""
+    for encoded_player in encoded_players:
+        player = Player.decode(encoded_player)
+        players[player.identifier] = player
+
+
+def decode_tournaments(
+    encoded_tournaments: list[dict[str, Any]],
+    players: dict[str, Player],
+    tournaments: list[Tournament | TournamentHeader],
+    lazy: bool = False,
+) -> None:
+    """Instantiate the encoded tournaments (only their headers if lazy) and append them to the tournaments list."""
+    for encoded_tournament in encoded_tournaments:
+        if lazy:
+            tournaments.append(TournamentHeader.from_encoded(encoded_tournament, players))
+        else:
+            tournaments.append(Tournament.decode(encoded_tournament, players))
+
+
+class IStorage(ABC):
+    """A "valid" storage backend must implements the following methods."""
+
+    def __init__(self, data_path: Path) -> None:
+        self.data_path = data_path
+
+    def record(self, mutation: Mutation) -> None:
+        """Be notified of a model mutation (before the save that follows it)."""
+
+    @abstractmethod
+    def save(
+        self,
+        players: dict[str, Player],
+        tournaments: list[Tournament | TournamentHeader],
+        players_file: bool = False,
+        tournaments_file: bool = False,
+    ) -> None:
+        """Persist the model’s data changed since the last save."""
+
+    @abstractmethod
+    def load(
+        self, players: dict[str, Player], tournaments: list[Tournament | TournamentHeader], lazy: bool = False
+    ) -> tuple[CompleteLog, CompleteLog]:
+        """Fill the given players dictionary and tournaments list with the stored data.
+
+        In lazy mode, only the tournaments headers are loaded (the whole tournaments being loaded on demand)."""
+
+    def close(self, players: dict[str, Player], tournaments: list[Tournament | TournamentHeader]) -> None:
+        """Release the storage resources once the application ends."""
+
+    def source_files(self) -> list[Path]:
+        """Return the files the data is loaded from (used to check the validity of the snapshot cache)."""
+        return []
+
+    def get_state(self) -> dict[str, Any]:
+        """Return the internal state built by the load (to be restored when loading from the snapshot cache)."""
+        return {}
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        """Restore the internal state built by the load."""
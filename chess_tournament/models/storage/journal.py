@@ -0,0 +1,191 @@
+"""Define the journal storage backend (append-only log of mutations, periodically folded into a snapshot)."""
+
+import os
+from json import JSONDecodeError, dumps, loads
+from pathlib import Path
+from typing import Any, Iterator
+
+from ..chessdata import Match, Player, Tournament, TournamentHeader
+from .interface import CompleteLog, IStorage, Mutation, Operation, decode_players, decode_tournaments
+from .json_files import json_load_data, write_atomically
+
+EncodedPlayers = dict[str, dict[str, Any]]
+EncodedTournaments = list[dict[str, Any]]
+
+
+def apply_mutation(
+    mutation: Mutation, encoded_players: EncodedPlayers, encoded_tournaments: EncodedTournaments
+) -> None:
+    """Replay a mutation on encoded (JSON compatible) data."""
+    data = mutation.data
+    if mutation.operation in (Operation.ADD_PLAYER, Operation.EDIT_PLAYER):
+        encoded_players[data["player"]["identifier"]] = data["player"]
+    elif mutation.operation == Operation.ADD_TOURNAMENT:
+        encoded_tournaments.append(data["tournament"])
+    else:
+        encoded_tournament = encoded_tournaments[data["tournament_t"]]
+        if mutation.operation == Operation.ADD_PARTICIPANT:
+            encoded_tournament["participants"].append(data["participant"])
+        elif mutation.operation == Operation.DELETE_PARTICIPANT:
+            encoded_tournament["participants"] = [
+                encoded_participant
+                for encoded_participant in encoded_tournament["participants"]
+                if encoded_participant["player"] != data["player"]
+            ]
+        elif mutation.operation == Operation.ADD_ROUND:
+            encoded_tournament["rounds"].append(data["round"])
+        elif mutation.operation == Operation.START_ROUND:
+            encoded_tournament["rounds"][data["round_r"]]["start_time"] = data["start_time"]
+        elif mutation.operation == Operation.END_ROUND:
+            encoded_tournament["rounds"][data["round_r"]]["end_time"] = data["end_time"]
+        elif mutation.operation == Operation.SET_PAIRING_CONFIG:
+            encoded_tournament["pairing_config"] = data["pairing_config"]
+        elif mutation.operation == Operation.SET_ROUND_ROBIN_SCHEDULE:
+            encoded_tournament["round_robin_schedule"] = data["schedule"]
+        elif mutation.operation == Operation.REGISTER_SCORE:
+            encoded_match = encoded_tournament["rounds"][data["round_r"]]["matches"][data["match_m"]]
+            encoded_match["participants_scores"] = data["participants_scores"]
+            scores = dict(zip(encoded_match["participants_pair"], data["participants_scores"]))
+            for encoded_participant in encoded_tournament["participants"]:
+                if encoded_participant["player"] in scores:
+                    points = Match.Points[scores[encoded_participant["player"]]]
+                    encoded_participant["score"] = float(encoded_participant["score"]) + points.value
+
+
+class JournalStorage(IStorage):
+    """Append each mutation to a journal file, so that the save cost does not depend on the archive size.
+
+    The journal is folded into a snapshot once it reaches the compaction threshold (and when the application ends).
+    """
+
+    compaction_threshold = 500
+
+    def __init__(self, data_path: Path) -> None:
+        super().__init__(data_path)
+        self._pending_mutations: list[Mutation] = []
+        self._sequence = 0  # sequence number of the last mutation written
+        self._journal_length = 0
+
+    @property
+    def snapshot_file(self) -> Path:
+        return self.data_path / "journal_snapshot.json"
+
+    @property
+    def journal_file(self) -> Path:
+        return self.data_path / "journal.jsonl"
+
+    def source_files(self) -> list[Path]:
+        if not self.snapshot_file.exists():
+            return [self.data_path / "players.json", self.data_path / "tournaments.json", self.journal_file]
+        return [self.snapshot_file, self.journal_file]
+
+    def get_state(self) -> dict[str, Any]:
+        return {"sequence": self._sequence, "journal_length": self._journal_length}
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        self._sequence = state["sequence"]
+        self._journal_length = state["journal_length"]
+
+    def record(self, mutation: Mutation) -> None:
+        """Keep the mutation until the next save."""
+        self._pending_mutations.append(mutation)
+
+    def save(
+        self,
+        players: dict[str, Player],
+        tournaments: list[Tournament | TournamentHeader],
+        players_file: bool = False,
+        tournaments_file: bool = False,
+    ) -> None:
+        """Append the pending mutations to the journal (then compact it if it became too long)."""
+        if not self._pending_mutations:
+            return
+        records = []
+        for mutation in self._pending_mutations:
+            self._sequence += 1
+            records.append(
+                dumps({"sequence": self._sequence, "operation": mutation.operation.name, "data": mutation.data})
+            )
+        with open(self.journal_file, "a") as journal:
+            journal.write("\n".join(records) + "\n")
+            journal.flush()
+            os.fsync(journal.fileno())
+        self._journal_length += len(records)
+        self._pending_mutations = []
+        if self._journal_length >= self.compaction_threshold:
+            self.compact(players, tournaments)
+
+    def compact(self, players: dict[str, Player], tournaments: list[Tournament | TournamentHeader]) -> None:
+        """Fold the journal into the snapshot, then empty the journal."""
+        snapshot = {
+            "sequence": self._sequence,
+            "players": [player.cached_encode() for player in players.values()],
+            "tournaments": [tournament.cached_encode() for tournament in tournaments],
+        }
+        # the snapshot sequence number allows to ignore already folded records if the truncation does not happen
+        write_atomically(snapshot, self.snapshot_file)
+        with open(self.journal_file, "w") as journal:
+            os.fsync(journal.fileno())
+        self._journal_length = 0
+
+    def _read_journal(self) -> Iterator[tuple[int, Mutation]]:
+        """Yield the journal records (stop at the first torn record, i.e. an interrupted write)."""
+        if not self.journal_file.exists():
+            return
+        with open(self.journal_file, "r") as journal:
+            for line in journal:
+                try:
+                    record = loads(line)
+                except JSONDecodeError:
+                    self._journal_length = self.compaction_threshold  # force compaction to drop the torn record
+                    return
+                self._journal_length += 1
+                yield record["sequence"], Mutation(Operation[record["operation"]], record["data"])
+
+    def _load_snapshot(self) -> tuple[dict[str, Any], Path]:
+        """Return the last snapshot, or the JSON files of the JSON storage backend if no snapshot exists yet."""
+        if self.snapshot_file.exists():
+            return json_load_data(self.snapshot_file), self.snapshot_file
+        snapshot: dict[str, Any] = {"sequence": 0, "players": [], "tournaments": []}
+        for key in ("players", "tournaments"):
+            json_file = self.data_path / f"{key}.json"
+            if json_file.exists():
+                snapshot[key] = json_load_data(json_file)
+        return snapshot, self.data_path
+
+    def load(
+        self, players: dict[str, Player], tournaments: list[Tournament | TournamentHeader], lazy: bool = False
+    ) -> tuple[CompleteLog, CompleteLog]:
+        """Load model’s data from the snapshot then replay the journal on it."""
+        try:
+            snapshot, source = self._load_snapshot()
+        except JSONDecodeError as err:
+            return (False, f"Corrupted JSON {self.snapshot_file} file ({err.msg})"), (
+                False,
+                "Unable to load tournaments without players.",
+            )
+        encoded_players = {encoded_player["identifier"]: encoded_player for encoded_player in snapshot["players"]}
+        encoded_tournaments = snapshot["tournaments"]
+        self._sequence = snapshot["sequence"]
+        total_replayed = 0
+        for sequence, mutation in self._read_journal():
+            if sequence <= self._sequence:
+                continue  # already folded into the snapshot
+            apply_mutation(mutation, encoded_players, encoded_tournaments)
+            self._sequence = sequence
+            total_replayed += 1
+
+        decode_players(list(encoded_players.values()), players)
+        decode_tournaments(encoded_tournaments, players, tournaments, lazy)
+        if self._journal_length >= self.compaction_threshold:
+            self.compact(players, tournaments)
+        return (True, f"{len(players)} player(s) loaded from {source}"), (
+            True,
+            f"{len(tournaments)} tournaments(s){' headers' if lazy else ''} loaded from {source}"
+            + f" ({total_replayed} journal record(s) replayed)",
+        )
+
+    def close(self, players: dict[str, Player], tournaments: list[Tournament | TournamentHeader]) -> None:
+        """Fold the journal into the snapshot to speed up the next start."""
+        if self._journal_length:
+            self.compact(players, tournaments)
@@ -0,0 +1,124 @@
+"""Define the JSON files storage backend (whole files rewritten at each save)."""
+
+import os
+from json import JSONDecodeError, dump, load
+from pathlib import Path
+from typing import Any
+
+from ..chessdata import Player, Tournament, TournamentHeader
+from .interface import CompleteLog, IStorage, decode_players, decode_tournaments
+
+
+def save_to_json(data: Any, path: Path) -> CompleteLog:
+    """Write compatible JSON data to JSON file."""
+    try:
+        with open(path, "w") as json_file:
+            dump(data, json_file, indent=2)
+    except FileNotFoundError as err:
+        return False, f"Unable to save to {path.absolute()} ({err.strerror})"
+    else:
+        return True, f"autosave in {path.absolute()}"
+
+
+def write_atomically(data: Any, path: Path) -> None:
+    """Write JSON data to a temporary file then replace the given file by it (never leaving a partial file)."""
+    temporary_path = path.with_name(path.name + ".tmp")
+    with open(temporary_path, "w") as json_file:
+        dump(data, json_file)
+        json_file.flush()
+        os.fsync(json_file.fileno())
+    os.replace(temporary_path, path)
+
+
+def json_load_data(filename: Path) -> Any:
+    """Load data from a given JSON file."""
+    with open(filename, "r") as json_file:
+        encoded_data = load(json_file)
+    return encoded_data
+
+
+class JSONStorage(IStorage):
+    """Store players and tournaments in two JSON files."""
+
+    @property
+    def players_file(self) -> Path:
+        return self.data_path / "players.json"
+
+    @property
+    def tournaments_file(self) -> Path:
+        return self.data_path / "tournaments.json"
+
+    def source_files(self) -> list[Path]:
+        return [self.players_file, self.tournaments_file]
+
+    def save(
+        self,
+        players: dict[str, Player],
+        tournaments: list[Tournament | TournamentHeader],
+        players_file: bool = False,
+        tournaments_file: bool = False,
+    ) -> None:
+        """Encode model’s data then write them to JSON file(s)."""
+        if players_file:
+            self._save_players(players)
+        if tournaments_file:
+            self._save_tournaments(tournaments)
+
+    def _save_players(self, players: dict[str, Player]) -> None:
+        """Encode then write all players."""
+        players_encoded = []
+        for player in players.values():
+            players_encoded.append(player.cached_encode())
+        save_to_json(path=self.players_file, data=players_encoded)
+
+    def _save_tournaments(self, tournaments: list[Tournament | TournamentHeader]) -> None:
+        """Encode then write all tournaments."""
+        tournaments_encoded = []
+        for tournament in tournaments:
+            tournaments_encoded.append(tournament.cached_encode())
+        save_to_json(path=self.tournaments_file, data=tournaments_encoded)
+
+    def load(
+        self, players: dict[str, Player], tournaments: list[Tournament | TournamentHeader], lazy: bool = False
+    ) -> tuple[CompleteLog, CompleteLog]:
+        """Load model’s data from JSON files."""
+        status_players_to_log = self._load_players(players)
+        if status_players_to_log[0] is False:
+            status_tournaments_to_log = False, "Unable to load tournaments without players."
+        else:
+            status_tournaments_to_log = self._load_tournaments(players, tournaments, lazy)
+        return status_players_to_log, status_tournaments_to_log
+
+    def _load_players(self, players: dict[str, Player]) -> CompleteLog:
+        """Load players from the players JSON file."""
+        try:
+            encoded_players = json_load_data(self.players_file)
+        except FileNotFoundError as err:
+            status_players_to_log = False, f"No data loaded from {self.players_file} ({err.strerror})"
+        except JSONDecodeError as err:
+            status_players_to_log = False, f"Corrupted JSON {self.players_file} file ({err.msg})"
+        else:
+            decode_players(encoded_players, players)
+            status_players_to_log = True, f"{len(encoded_players)} player(s) loaded from {self.players_file}"
+        finally:
+            return status_players_to_log
+
+    def _load_tournaments(
+        self, players: dict[str, Player], tournaments: list[Tournament | TournamentHeader], lazy: bool = False
+    ) -> CompleteLog:
+        """Load tournaments from the tournaments JSON file."""
+        try:
+            encoded_tournaments = json_load_data(self.tournaments_file)
+        except FileNotFoundError as err:
+            status_tournaments_to_log = False, f"No data loaded from {self.tournaments_file} ({err.strerror})"
+        except JSONDecodeError as err:
+            status_tournaments_to_log = False, f"Corrupted JSON {self.tournaments_file} file ({err.msg})"
+        else:
+            decode_tournaments(encoded_tournaments, players, tournaments, lazy)
+            status_tournaments_to_log = (
+                True,
+                f"{len(encoded_tournaments)} tournaments(s){' headers' if lazy else ''} loaded"
+                + f" from {self.tournaments_file}",
+            )
+        finally:
+            return status_tournaments_to_log
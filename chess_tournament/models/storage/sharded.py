@@ -0,0 +1,105 @@
+"""Define the sharded storage backend (one JSON file per tournament, listed in a manifest file)."""
+
+from functools import partial
+from json import JSONDecodeError
+from pathlib import Path
+from typing import Any
+
+from ..chessdata import Player, Tournament, TournamentHeader
+from .interface import CompleteLog, Mutation, decode_tournaments
+from .json_files import JSONStorage, json_load_data, write_atomically
+
+
+def tournament_header(tournament_t: int, tournament: Tournament) -> dict[str, Any]:
+    """Return the manifest entry of a tournament (its file name and its header data)."""
+    return {
+        "file": f"tournament_{tournament_t}.json",
+        "name": tournament.name,
+        "location": tournament.location,
+        "begin_date": str(tournament.begin_date),
+        "end_date": str(tournament.end_date),
+        "total_rounds": int(tournament.total_rounds),
+        "total_started_rounds": tournament.total_started_rounds,
+        "total_finished_rounds": tournament.total_finished_rounds,
+    }
+
+
+class ShardedStorage(JSONStorage):
+    """Store each tournament in its own JSON file, so that a save only rewrites the mutated tournaments.
+
+    Players are still stored in the players JSON file."""
+
+    def __init__(self, data_path: Path) -> None:
+        super().__init__(data_path)
+        self._manifest: list[dict[str, Any]] = []
+        self._mutated_tournaments: set[int] = set()
+
+    @property
+    def shards_path(self) -> Path:
+        return self.data_path / "tournaments"
+
+    @property
+    def manifest_file(self) -> Path:
+        return self.shards_path / "manifest.json"
+
+    def source_files(self) -> list[Path]:
+        return [self.players_file, self.manifest_file, *sorted(self.shards_path.glob("tournament_*.json"))]
+
+    def get_state(self) -> dict[str, Any]:
+        return {"manifest": self._manifest}
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        self._manifest = state["manifest"]
+
+    def record(self, mutation: Mutation) -> None:
+        """Remember which tournaments have to be rewritten by the next save."""
+        if "tournament_t" in mutation.data:
+            self._mutated_tournaments.add(mutation.data["tournament_t"])
+
+    def _save_tournaments(self, tournaments: list[Tournament | TournamentHeader]) -> None:
+        """Rewrite the mutated tournaments files (and the manifest if one of their header changed)."""
+        self.shards_path.mkdir(exist_ok=True)
+        is_manifest_outdated = False
+        for tournament_t in sorted(self._mutated_tournaments):
+            header = tournament_header(tournament_t, tournaments[tournament_t])
+            write_atomically(tournaments[tournament_t].cached_encode(), self.shards_path / header["file"])
+            if tournament_t == len(self._manifest):
+                self._manifest.append(header)
+                is_manifest_outdated = True
+            elif self._manifest[tournament_t] != header:
+                self._manifest[tournament_t] = header
+                is_manifest_outdated = True
+        if is_manifest_outdated:
+            write_atomically({"tournaments": self._manifest}, self.manifest_file)
+        self._mutated_tournaments.clear()
+
+    def _load_tournaments(
+        self, players: dict[str, Player], tournaments: list[Tournament | TournamentHeader], lazy: bool = False
+    ) -> CompleteLog:
+        """Load the tournaments files listed in the manifest (only the manifest headers if lazy)."""
+        if not self.manifest_file.exists() and self.tournaments_file.exists():
+            # one-shot migration from the JSON storage backend
+            status_tournaments_to_log = super()._load_tournaments(players, tournaments)
+            if status_tournaments_to_log[0]:
+                self._mutated_tournaments.update(range(len(tournaments)))
+                self._save_tournaments(tournaments)
+            return status_tournaments_to_log
+
+        loaded_file = self.manifest_file
+        try:
+            self._manifest = json_load_data(loaded_file)["tournaments"]
+            if lazy:
+                for header in self._manifest:
+                    encoded_loader = partial(json_load_data, self.shards_path / header["file"])
+                    tournaments.append(TournamentHeader.from_encoded(header, players, encoded_loader))
+                return True, f"{len(self._manifest)} tournaments(s) headers loaded from {self.manifest_file}"
+            encoded_tournaments = []
+            for header in self._manifest:
+                loaded_file = self.shards_path / header["file"]
+                encoded_tournaments.append(json_load_data(loaded_file))
+        except FileNotFoundError as err:
+            return False, f"No data loaded from {loaded_file} ({err.strerror})"
+        except JSONDecodeError as err:
+            return False, f"Corrupted JSON {loaded_file} file ({err.msg})"
+        decode_tournaments(encoded_tournaments, players, tournaments)
+        return True, f"{len(encoded_tournaments)} tournaments(s) loaded from {self.shards_path}"
@@ -0,0 +1,94 @@
+"""Define the snapshot cache of the decoded model’s data, used to skip the decoding at start."""
+
+import gc
+import pickle
+from hashlib import blake2b
+from pathlib import Path
+from typing import Any, Optional
+
+from ..chessdata import Player, Tournament
+from .interface import IStorage
+
+SourceKey = tuple[str, int, int, str]  # file name, size, modification time and content hash
+
+
+def _file_hash(path: Path) -> str:
+    """Return the hash of the file content."""
+    file_hash = blake2b(digest_size=16)
+    with open(path, "rb") as source_file:
+        while chunk := source_file.read(1 << 20):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+class SnapshotCache:
+    """Pickle the decoded players and tournaments, the cache being valid as long as the storage files are unchanged.
+
+    A source file is considered unchanged if its size and modification time are the same, or else if its content hash
+    is the same."""
+
+    version = 14  # to increase when the pickled classes change
+
+    def __init__(self, data_path: Path, storage: IStorage) -> None:
+        self.storage = storage
+        self.cache_file = data_path / "snapshot_cache.pickle"
+
+    def _sources_keys(self) -> list[SourceKey]:
+        """Return the current keys of the storage source files."""
+        keys = []
+        for path in self.storage.source_files():
+            if path.exists():
+                file_stat = path.stat()
+                keys.append((path.name, file_stat.st_size, file_stat.st_mtime_ns, _file_hash(path)))
+        return keys
+
+    def _are_sources_unchanged(self, cached_keys: list[SourceKey]) -> bool:
+        """Return True if the storage source files match the cached keys, False otherwise."""
+        existing_paths = [path for path in self.storage.source_files() if path.exists()]
+        if [path.name for path in existing_paths] != [key[0] for key in cached_keys]:
+            return False
+        for path, (_, size, mtime, content_hash) in zip(existing_paths, cached_keys):
+            file_stat = path.stat()
+            if file_stat.st_size != size:
+                return False
+            if file_stat.st_mtime_ns != mtime and _file_hash(path) != content_hash:
+                return False
+        return True
+
+    def load(self) -> Optional[tuple[dict[str, Player], list[Tournament], dict[str, Any]]]:
+        """Return the cached players, tournaments and storage state, or None if the cache is missing or outdated."""
+        gc.disable()  # the unpickled objects are all alive, garbage collections would only slow down the load
+        try:
+            with open(self.cache_file, "rb") as cache_file:
+                snapshot = pickle.load(cache_file)
+        except (OSError, pickle.UnpicklingError, AttributeError, EOFError, ImportError):
+            return None
+        finally:
+            gc.enable()
+        if (
+            not isinstance(snapshot, dict)
+            or snapshot.get("version") != self.version
+            or snapshot.get("storage") != self.storage.__class__.__name__
+            or not self._are_sources_unchanged(snapshot["sources"])
+        ):
+            return None
+        return snapshot["players"], snapshot["tournaments"], snapshot["storage_state"]
+
+    def save(self, players: dict[str, Player], tournaments: list[Tournament]) -> None:
+        """Pickle the decoded data with the current keys of the storage source files."""
+        snapshot = {
+            "version": self.version,
+            "storage": self.storage.__class__.__name__,
+            "sources": self._sources_keys(),
+            "storage_state": self.storage.get_state(),
+            "players": players,
+            "tournaments": tournaments,
+        }
+        temporary_path = self.cache_file.with_name(self.cache_file.name + ".tmp")
+        with open(temporary_path, "wb") as cache_file:
+            pickle.dump(snapshot, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+        temporary_path.replace(self.cache_file)
+
+    def clear(self) -> None:
+        """Delete the cache file."""
+        self.cache_file.unlink(missing_ok=True)
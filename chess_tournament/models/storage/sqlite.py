@@ -0,0 +1,422 @@
+"""Define the SQLite storage backend (one row updated per mutation instead of whole files)."""
+
+import sqlite3
+from datetime import date
+from functools import partial
+from json import JSONDecodeError, dumps, loads
+from pathlib import Path
+from typing import Any, Optional
+
+from ..chessdata import Match, Player, Tournament, TournamentHeader
+from .interface import CompleteLog, IStorage, Mutation, Operation, decode_players, decode_tournaments
+from .json_files import json_load_data
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    identifier TEXT PRIMARY KEY,
+    last_name TEXT NOT NULL,
+    first_name TEXT NOT NULL,
+    birth_date TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tournaments (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    location TEXT NOT NULL,
+    begin_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    total_rounds INTEGER NOT NULL,
+    engine TEXT,
+    num_search_workers INTEGER,
+    max_time_in_seconds REAL,
+    relative_gap_limit REAL,
+    decomposition INTEGER,
+    nearest_opponents INTEGER,
+    measure_hints INTEGER,
+    isolated INTEGER,
+    memory_limit_in_mb INTEGER,
+    speculative_matches INTEGER,
+    round_robin INTEGER,
+    round_robin_schedule TEXT
+);
+CREATE TABLE IF NOT EXISTS participants (
+    tournament_id INTEGER NOT NULL REFERENCES tournaments (id),
+    player_id TEXT NOT NULL REFERENCES players (identifier),
+    position INTEGER NOT NULL,
+    score REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (tournament_id, player_id)
+);
+CREATE TABLE IF NOT EXISTS rounds (
+    tournament_id INTEGER NOT NULL REFERENCES tournaments (id),
+    round_r INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    start_time TEXT,
+    end_time TEXT,
+    pairing_build_time REAL,
+    pairing_solve_time REAL,
+    hints_saved_time REAL,
+    PRIMARY KEY (tournament_id, round_r)
+);
+CREATE TABLE IF NOT EXISTS matches (
+    tournament_id INTEGER NOT NULL,
+    round_r INTEGER NOT NULL,
+    match_m INTEGER NOT NULL,
+    first_player_id TEXT NOT NULL REFERENCES players (identifier),
+    second_player_id TEXT NOT NULL REFERENCES players (identifier),
+    first_score TEXT,
+    second_score TEXT,
+    PRIMARY KEY (tournament_id, round_r, match_m),
+    FOREIGN KEY (tournament_id, round_r) REFERENCES rounds (tournament_id, round_r)
+);
+CREATE INDEX IF NOT EXISTS participants_player_index ON participants (player_id);
+CREATE INDEX IF NOT EXISTS matches_first_player_index ON matches (first_player_id);
+CREATE INDEX IF NOT EXISTS matches_second_player_index ON matches (second_player_id);
+CREATE INDEX IF NOT EXISTS tournaments_dates_index ON tournaments (begin_date, end_date);
+CREATE INDEX IF NOT EXISTS matches_round_index ON matches (tournament_id, round_r);
+"""
+PAIRING_CONFIG_COLUMNS = {
+    "engine": "TEXT",
+    "num_search_workers": "INTEGER",
+    "max_time_in_seconds": "REAL",
+    "relative_gap_limit": "REAL",
+    "decomposition": "INTEGER",
+    "nearest_opponents": "INTEGER",
+    "measure_hints": "INTEGER",
+    "isolated": "INTEGER",
+    "memory_limit_in_mb": "INTEGER",
+    "speculative_matches": "INTEGER",
+}
+ROUND_ROBIN_COLUMNS = {
+    "round_robin": "INTEGER",
+    "round_robin_schedule": "TEXT",  # JSON encoded
+}
+PAIRING_STATS_COLUMNS = {
+    "pairing_build_time": "REAL",
+    "pairing_solve_time": "REAL",
+    "hints_saved_time": "REAL",
+}
+
+
+class SQLiteStorage(IStorage):
+    """Store players and tournaments in normalized tables of a SQLite database.
+
+    Each mutation is applied with single-row INSERT/UPDATE/DELETE statements, committed by the next save."""
+
+    def __init__(self, data_path: Path) -> None:
+        super().__init__(data_path)
+        is_new_database = not self.database_file.exists()
+        self.connection = sqlite3.connect(self.database_file)
+        self.connection.executescript(SCHEMA)
+        self._add_missing_columns()
+        self._is_import_needed = is_new_database
+
+    def _add_missing_columns(self) -> None:
+        """Add the columns missing from a database created by a previous version."""
+        for table, columns in (
+            ("tournaments", PAIRING_CONFIG_COLUMNS | ROUND_ROBIN_COLUMNS),
+            ("rounds", PAIRING_STATS_COLUMNS),
+        ):
+            table_columns = {row[1] for row in self.connection.execute(f"PRAGMA table_info({table})")}
+            for column, column_type in columns.items():
+                if column not in table_columns:
+                    self.connection.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+
+    @property
+    def database_file(self) -> Path:
+        return self.data_path / "chess_tournament.sqlite3"
+
+    def source_files(self) -> list[Path]:
+        return [self.database_file]
+
+    def _insert_player(self, encoded_player: dict[str, Any]) -> None:
+        self.connection.execute(
+            "INSERT INTO players (identifier, last_name, first_name, birth_date) VALUES (?, ?, ?, ?)",
+            (
+                encoded_player["identifier"],
+                encoded_player["last_name"],
+                encoded_player["first_name"],
+                encoded_player["birth_date"],
+            ),
+        )
+
+    def _insert_participant(self, tournament_t: int, encoded_participant: dict[str, Any]) -> None:
+        self.connection.execute(
+            "INSERT INTO participants (tournament_id, player_id, position, score) VALUES (?, ?, "
+            + "(SELECT COALESCE(MAX(position), -1) + 1 FROM participants WHERE tournament_id = ?), ?)",
+            (tournament_t, encoded_participant["player"], tournament_t, encoded_participant["score"]),
+        )
+
+    def _insert_round(self, tournament_t: int, round_r: int, encoded_round: dict[str, Any]) -> None:
+        self.connection.execute(
+            "INSERT INTO rounds (tournament_id, round_r, name, start_time, end_time, "
+            + ", ".join(PAIRING_STATS_COLUMNS)
+            + ") VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                tournament_t,
+                round_r,
+                encoded_round["name"],
+                encoded_round["start_time"] or None,
+                encoded_round["end_time"] or None,
+                *[encoded_round.get(column) for column in PAIRING_STATS_COLUMNS],
+            ),
+        )
+        self.connection.executemany(
+            "INSERT INTO matches (tournament_id, round_r, match_m, first_player_id, second_player_id, first_score,"
+            + " second_score) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (tournament_t, round_r, match_m, *encoded_match["participants_pair"])
+                + (tuple(encoded_match["participants_scores"]) or (None, None))
+                for match_m, encoded_match in enumerate(encoded_round["matches"])
+            ],
+        )
+
+    def _insert_tournament(self, tournament_t: int, encoded_tournament: dict[str, Any]) -> None:
+        self.connection.execute(
+            "INSERT INTO tournaments (id, name, location, begin_date, end_date, total_rounds, "
+            + ", ".join(PAIRING_CONFIG_COLUMNS | ROUND_ROBIN_COLUMNS)
+            + ") VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                tournament_t,
+                encoded_tournament["name"],
+                encoded_tournament["location"],
+                encoded_tournament["begin_date"],
+                encoded_tournament["end_date"],
+                encoded_tournament["total_rounds"],
+                *[encoded_tournament.get("pairing_config", {}).get(column) for column in PAIRING_CONFIG_COLUMNS],
+                encoded_tournament.get("round_robin", False),
+                dumps(encoded_tournament.get("round_robin_schedule")),
+            ),
+        )
+        for encoded_participant in encoded_tournament["participants"]:
+            self._insert_participant(tournament_t, encoded_participant)
+        for round_r, encoded_round in enumerate(encoded_tournament["rounds"]):
+            self._insert_round(tournament_t, round_r, encoded_round)
+
+    def record(self, mutation: Mutation) -> None:
+        """Apply the mutation to the database (in a transaction committed by the next save)."""
+        data = mutation.data
+        if mutation.operation == Operation.ADD_PLAYER:
+            self._insert_player(data["player"])
+        elif mutation.operation == Operation.EDIT_PLAYER:
+            self.connection.execute(
+                "UPDATE players SET last_name = ?, first_name = ?, birth_date = ? WHERE identifier = ?",
+                (
+                    data["player"]["last_name"],
+                    data["player"]["first_name"],
+                    data["player"]["birth_date"],
+                    data["player"]["identifier"],
+                ),
+            )
+        elif mutation.operation == Operation.ADD_TOURNAMENT:
+            self._insert_tournament(data["tournament_t"], data["tournament"])
+        elif mutation.operation == Operation.ADD_PARTICIPANT:
+            self._insert_participant(data["tournament_t"], data["participant"])
+        elif mutation.operation == Operation.DELETE_PARTICIPANT:
+            self.connection.execute(
+                "DELETE FROM participants WHERE tournament_id = ? AND player_id = ?",
+                (data["tournament_t"], data["player"]),
+            )
+        elif mutation.operation == Operation.ADD_ROUND:
+            self._insert_round(data["tournament_t"], data["round_r"], data["round"])
+        elif mutation.operation == Operation.SET_PAIRING_CONFIG:
+            self.connection.execute(
+                "UPDATE tournaments SET "
+                + ", ".join(f"{column} = ?" for column in PAIRING_CONFIG_COLUMNS)
+                + " WHERE id = ?",
+                (*[data["pairing_config"][column] for column in PAIRING_CONFIG_COLUMNS], data["tournament_t"]),
+            )
+        elif mutation.operation == Operation.SET_ROUND_ROBIN_SCHEDULE:
+            self.connection.execute(
+                "UPDATE tournaments SET round_robin_schedule = ? WHERE id = ?",
+                (dumps(data["schedule"]), data["tournament_t"]),
+            )
+        elif mutation.operation == Operation.START_ROUND:
+            self.connection.execute(
+                "UPDATE rounds SET start_time = ? WHERE tournament_id = ? AND round_r = ?",
+                (data["start_time"], data["tournament_t"], data["round_r"]),
+            )
+        elif mutation.operation == Operation.END_ROUND:
+            self.connection.execute(
+                "UPDATE rounds SET end_time = ? WHERE tournament_id = ? AND round_r = ?",
+                (data["end_time"], data["tournament_t"], data["round_r"]),
+            )
+        elif mutation.operation == Operation.REGISTER_SCORE:
+            match_key = (data["tournament_t"], data["round_r"], data["match_m"])
+            first_score, second_score = data["participants_scores"]
+            self.connection.execute(
+                "UPDATE matches SET first_score = ?, second_score = ?"
+                + " WHERE tournament_id = ? AND round_r = ? AND match_m = ?",
+                (first_score, second_score, *match_key),
+            )
+            players_id = self.connection.execute(
+                "SELECT first_player_id, second_player_id FROM matches"
+                + " WHERE tournament_id = ? AND round_r = ? AND match_m = ?",
+                match_key,
+            ).fetchone()
+            for player_id, score in zip(players_id, data["participants_scores"]):
+                self.connection.execute(
+                    "UPDATE participants SET score = score + ? WHERE tournament_id = ? AND player_id = ?",
+                    (Match.Points[score].value, data["tournament_t"], player_id),
+                )
+
+    def save(
+        self,
+        players: dict[str, Player],
+        tournaments: list[Tournament | TournamentHeader],
+        players_file: bool = False,
+        tournaments_file: bool = False,
+    ) -> None:
+        """Commit the mutations applied since the last save."""
+        self.connection.commit()
+
+    def import_json_files(self) -> tuple[int, int]:
+        """One-shot import of the JSON storage backend files, return the number of imported players and tournaments."""
+        players_file, tournaments_file = self.data_path / "players.json", self.data_path / "tournaments.json"
+        encoded_players = json_load_data(players_file) if players_file.exists() else []
+        encoded_tournaments = json_load_data(tournaments_file) if tournaments_file.exists() else []
+        with self.connection:
+            for encoded_player in encoded_players:
+                self._insert_player(encoded_player)
+            for tournament_t, encoded_tournament in enumerate(encoded_tournaments):
+                self._insert_tournament(tournament_t, encoded_tournament)
+        return len(encoded_players), len(encoded_tournaments)
+
+    def _select_encoded_tournaments(self, selected_tournament: Optional[int] = None) -> list[dict[str, Any]]:
+        """Return the stored tournaments (or only the selected one) in JSON compatible format."""
+        condition, parameters = ("", ())
+        if selected_tournament is not None:
+            condition, parameters = " WHERE tournament_id = ?", (selected_tournament,)
+        encoded_tournaments = {}
+        tournaments_rows = self.connection.execute(
+            "SELECT id, name, location, begin_date, end_date, total_rounds, "
+            + ", ".join(PAIRING_CONFIG_COLUMNS | ROUND_ROBIN_COLUMNS)
+            + " FROM tournaments"
+            + condition.replace("tournament_id", "id")
+            + " ORDER BY id",
+            parameters,
+        )
+        for tournament_t, name, location, begin_date, end_date, total_rounds, *columns_row in tournaments_rows:
+            *pairing_config_row, round_robin, round_robin_schedule = columns_row
+            encoded_tournaments[tournament_t] = {
+                "name": name,
+                "location": location,
+                "begin_date": begin_date,
+                "end_date": end_date,
+                "total_rounds": total_rounds,
+                "participants": [],
+                "rounds": [],
+                "round_robin": bool(round_robin),
+                "round_robin_schedule": loads(round_robin_schedule) if round_robin_schedule else None,
+            }
+            pairing_config = {
+                column: value for column, value in zip(PAIRING_CONFIG_COLUMNS, pairing_config_row) if value is not None
+            }
+            if pairing_config:  # not stored by the previous versions
+                encoded_tournaments[tournament_t]["pairing_config"] = pairing_config
+        for tournament_t, player_id, score in self.connection.execute(
+            "SELECT tournament_id, player_id, score FROM participants"
+            + condition
+            + " ORDER BY tournament_id, position",
+            parameters,
+        ):
+            encoded_tournaments[tournament_t]["participants"].append({"player": player_id, "score": score})
+        for tournament_t, name, start_time, end_time, *pairing_stats_row in self.connection.execute(
+            "SELECT tournament_id, name, start_time, end_time, "
+            + ", ".join(PAIRING_STATS_COLUMNS)
+            + " FROM rounds"
+            + condition
+            + " ORDER BY tournament_id, round_r",
+            parameters,
+        ):
+            encoded_tournaments[tournament_t]["rounds"].append(
+                {"name": name, "start_time": start_time or "", "end_time": end_time or "", "matches": []}
+                | dict(zip(PAIRING_STATS_COLUMNS, pairing_stats_row))
+            )
+        for tournament_t, round_r, *participants_pair, first_score, second_score in self.connection.execute(
+            "SELECT tournament_id, round_r, first_player_id, second_player_id, first_score, second_score FROM matches"
+            + condition
+            + " ORDER BY tournament_id, round_r, match_m",
+            parameters,
+        ):
+            encoded_tournaments[tournament_t]["rounds"][round_r]["matches"].append(
+                {
+                    "participants_pair": participants_pair,
+                    "participants_scores": [first_score, second_score] if first_score is not None else [],
+                }
+            )
+        return list(encoded_tournaments.values())
+
+    def _select_encoded_tournament(self, tournament_t: int) -> dict[str, Any]:
+        """Return the given stored tournament in JSON compatible format."""
+        return self._select_encoded_tournaments(selected_tournament=tournament_t)[0]
+
+    def _select_tournaments_headers(self, players: dict[str, Player]) -> list[TournamentHeader]:
+        """Return the stored tournaments headers (each one loading its tournament from the database on demand)."""
+        return [
+            TournamentHeader(
+                name=name,
+                location=location,
+                begin_date=date.fromisoformat(begin_date),
+                end_date=date.fromisoformat(end_date),
+                total_rounds=total_rounds,
+                total_started_rounds=total_started_rounds,
+                total_finished_rounds=total_finished_rounds,
+                encoded_loader=partial(self._select_encoded_tournament, tournament_t),
+                players_db=players,
+            )
+            for (
+                tournament_t,
+                name,
+                location,
+                begin_date,
+                end_date,
+                total_rounds,
+                total_started_rounds,
+                total_finished_rounds,
+            ) in self.connection.execute(
+                "SELECT id, name, location, begin_date, end_date, total_rounds,"
+                + " (SELECT COUNT(*) FROM rounds WHERE tournament_id = tournaments.id),"
+                + " (SELECT COUNT(*) FROM rounds WHERE tournament_id = tournaments.id AND end_time IS NOT NULL)"
+                + " FROM tournaments ORDER BY id"
+            )
+        ]
+
+    def load(
+        self, players: dict[str, Player], tournaments: list[Tournament | TournamentHeader], lazy: bool = False
+    ) -> tuple[CompleteLog, CompleteLog]:
+        """Load model’s data from the database (importing the JSON files the first time)."""
+        import_log = ""
+        if self._is_import_needed:
+            self._is_import_needed = False
+            try:
+                total_imported_players, total_imported_tournaments = self.import_json_files()
+            except JSONDecodeError as err:
+                return (False, f"Unable to import corrupted JSON files in {self.database_file} ({err.msg})"), (
+                    False,
+                    "Unable to load tournaments without players.",
+                )
+            if total_imported_players or total_imported_tournaments:
+                import_log = (
+                    f" ({total_imported_players} player(s) and {total_imported_tournaments} tournament(s)"
+                    + f" imported from the JSON files of {self.data_path})"
+                )
+
+        encoded_players = [
+            {"identifier": identifier, "last_name": last_name, "first_name": first_name, "birth_date": birth_date}
+            for identifier, last_name, first_name, birth_date in self.connection.execute(
+                "SELECT identifier, last_name, first_name, birth_date FROM players ORDER BY rowid"
+            )
+        ]
+        decode_players(encoded_players, players)
+        if lazy:
+            tournaments.extend(self._select_tournaments_headers(players))
+        else:
+            decode_tournaments(self._select_encoded_tournaments(), players, tournaments)
+        return (True, f"{len(encoded_players)} player(s) loaded from {self.database_file}{import_log}"), (
+            True,
+            f"{len(tournaments)} tournaments(s){' headers' if lazy else ''} loaded from {self.database_file}",
+        )
+
+    def close(self, players: dict[str, Player], tournaments: list[Tournament | TournamentHeader]) -> None:
+        """Commit the last mutations then close the database connection."""
+        self.connection.commit()
+        self.connection.close()
@@ -50,6 +50,10 @@ class IView(ABC):
     def enter_score(self, players: tuple[str, str]) -> RequestAnswer:
         """Display a menu to select the participants score (WIN/LOSE/DRAW)."""
 
+    @abstractmethod
+    def show_matchmaking_progress(self, elapsed_time: float, time_limit: float) -> None:
+        """Display the progress of the next round matchmaking (Ctrl-C asking to stop its search)."""
+
     # --- participants methods ---
 
     @abstractmethod
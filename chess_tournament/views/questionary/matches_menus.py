@@ -4,6 +4,8 @@ import questionary as q
 from ..requests import Request, RequestAnswer, valid_request_or_exit
 from .common import clear_screen_and_show_log, print_title
 
+PROGRESS_BAR_WIDTH = 20
+
 
 class MatchesMenus:
     """Matches related View’s mixin class."""
@@ -32,3 +34,11 @@ class MatchesMenus:
         )
         answer = question.ask()
         return valid_request_or_exit(check=answer, return_if_ok=(Request.ADD_MATCH_RESULT, answer))
+
+    def show_matchmaking_progress(self, elapsed_time: float, time_limit: float) -> None:
+        """Display the elapsed time of the next round matchmaking (with a progress bar if it has a time limit)."""
+        progress_bar = ""
+        if time_limit > 0:
+            done_width = min(PROGRESS_BAR_WIDTH, int(PROGRESS_BAR_WIDTH * elapsed_time / time_limit))
+            progress_bar = f" [{'#' * done_width}{'.' * (PROGRESS_BAR_WIDTH - done_width)}] {time_limit:g}s"
+        q.print(f"Matchmaking... {elapsed_time:.1f}s{progress_bar} (Ctrl-C to stop the search)", end="\r")
@@ -22,6 +22,7 @@ class TournamentsMenus:
                 q.Choice(title="Register a new tournament", value=Request.ADD_TOURNAMENT),
                 q.Choice(title="Manage existing tournament", value=Request.EDIT_TOURNAMENT),
                 q.Choice(title="List tournaments", value=Request.LIST_TOURNAMENTS),
+                q.Choice(title="Generate the next round of all tournaments", value=Request.GENERATE_NEXT_ROUNDS),
                 q.Separator(),
                 q.Choice(title="Back", value=Request.MAIN_MENU),
             ],
@@ -35,10 +36,8 @@ class TournamentsMenus:
         print_title("Unready tournament menu")
         print_important_info(f"{tournament_info['str']}")
         choice_start_tournament = q.Choice(title="Start tournament", value=Request.GENERATE_MATCHES)
-        if tournament_info["total_participants"] < 2:
-            choice_start_tournament.disabled = "Not enough participants"
-        elif tournament_info["total_participants"] % 2 == 1:
-            choice_start_tournament.disabled = "Select an even number of participants"
+        if tournament_info["start_error"] is not None:
+            choice_start_tournament.disabled = tournament_info["start_error"]
         question = q.select(
             "What do you want to do ?",
             choices=[
@@ -128,7 +127,7 @@ class TournamentsMenus:
 
     @clear_screen_and_show_log
     def show_tournament_registration(self) -> RequestAnswer:
-        """Prompt 5 input questions (name, location, dates, rounds number) with user entries validation."""
+        """Prompt 6 input questions (name, location, dates, rounds number, mode) with user entries validation."""
         print_title("Tournament registration menu")
         add_tournament_questions = [
             {
@@ -167,6 +166,13 @@ class TournamentsMenus:
                 "validate": lambda x: x.isnumeric(),
                 "default": "4",
             },
+            {
+                "type": "confirm",
+                "name": "round_robin",
+                "qmark": ">",
+                "message": "Round-robin (each participant meets all the others, in k * (participants - 1) rounds) ?",
+                "default": False,
+            },
         ]
         raw_tournament_data = q.prompt(add_tournament_questions)
         return valid_request_or_exit(
@@ -21,6 +21,7 @@ class Request(Enum):
     ADD_TOURNAMENT = auto()
     EDIT_TOURNAMENT = auto()
     LIST_TOURNAMENTS = auto()
+    GENERATE_NEXT_ROUNDS = auto()
     START_ROUND = auto()
     PRINT = auto()
     EXPORT = auto()
@@ -1,17 +1,33 @@
 """Define the chess manager entry point and main function."""
 
 import argparse
+from dataclasses import fields
 from pathlib import Path
+from typing import Any
 
 from chess_tournament.controllers.controller import Controller
+from chess_tournament.models.chessdata import PairingConfig
+from chess_tournament.models.chessdata.pairing_engines import PAIRING_ENGINES
+from chess_tournament.models.save_load_system import STORAGES
+from chess_tournament.models.storage import IStorage
 from chess_tournament.views.interface import IView
 from chess_tournament.views.questionary.view import View  # change to dynamic import if multiple views
 
 
-def main(view_class: type[IView], data_path: Path):
+def main(
+    view_class: type[IView],
+    data_path: Path,
+    storage_class: type[IStorage],
+    lazy_loading: bool,
+    pairing_config: PairingConfig,
+    persistent_pairing_cache: bool,
+    pairing_overrides: dict[str, Any],
+):
     """Main program function that initializes the view and the controller then call its main function loop."""
     view = view_class()
-    chess_tournament_manager = Controller(view, data_path)
+    chess_tournament_manager = Controller(
+        view, data_path, storage_class, lazy_loading, pairing_config, persistent_pairing_cache, pairing_overrides
+    )
     chess_tournament_manager.run()
 
 
@@ -21,5 +37,111 @@ if __name__ == "__main__":
     parser.add_argument(
         "-p", "--data-path", default="./data", help="specify a backup path (default: ./data/)", type=Path
     )
+    parser.add_argument(
+        "-s",
+        "--storage",
+        default="json",
+        choices=STORAGES.keys(),
+        help="specify the storage backend (default: json)",
+    )
+    parser.add_argument(
+        "-l",
+        "--lazy",
+        action="store_true",
+        help="load only the tournaments headers at start (a tournament being fully loaded once selected)",
+    )
+    default_pairing_config = PairingConfig()
+    parser.add_argument(
+        "-e",
+        "--engine",
+        default=argparse.SUPPRESS,
+        choices=PAIRING_ENGINES.keys(),
+        help=f"specify the matchmaking by score engine (default: {default_pairing_config.engine})",
+    )
+    parser.add_argument(
+        "--workers",
+        dest="num_search_workers",
+        default=argparse.SUPPRESS,
+        help="specify the number of matchmaking solver workers (default: 0, i.e. as many as available cores)",
+        metavar="WORKERS",
+        type=int,
+    )
+    parser.add_argument(
+        "--time-limit",
+        dest="max_time_in_seconds",
+        default=argparse.SUPPRESS,
+        help="specify the matchmaking solver time limit in seconds"
+        + f" (default: {default_pairing_config.max_time_in_seconds}, 0 for no limit)",
+        metavar="TIME_LIMIT",
+        type=float,
+    )
+    parser.add_argument(
+        "--gap-limit",
+        dest="relative_gap_limit",
+        default=argparse.SUPPRESS,
+        help="specify the matchmaking solver relative gap limit to the optimal pairing"
+        + f" (default: {default_pairing_config.relative_gap_limit})",
+        metavar="GAP_LIMIT",
+        type=float,
+    )
+    parser.add_argument(
+        "--decomposition",
+        action="store_true",
+        default=argparse.SUPPRESS,
+        help="pair each score group independently (in parallel for large tournaments)",
+    )
+    parser.add_argument(
+        "--nearest",
+        dest="nearest_opponents",
+        default=argparse.SUPPRESS,
+        help="limit the candidate pairs to the k nearest opponents by score of each participant (default: 0, all)",
+        metavar="NEAREST",
+        type=int,
+    )
+    parser.add_argument(
+        "--measure-hints",
+        action="store_true",
+        default=argparse.SUPPRESS,
+        help="solve the matchmaking again without solver hints to report the solve time they saved in the rounds",
+    )
+    parser.add_argument(
+        "--pairing-cache",
+        action="store_true",
+        help="keep the computed pairings in the data path, to serve the replayed rounds without solving them again",
+    )
+    parser.add_argument(
+        "--isolated",
+        action="store_true",
+        default=argparse.SUPPRESS,
+        help="run the matchmaking solver in a dedicated process, killed if it exceeds its time limit or memory cap",
+    )
+    parser.add_argument(
+        "--memory-limit",
+        dest="memory_limit_in_mb",
+        default=argparse.SUPPRESS,
+        help="specify the memory cap in MB of the isolated solver process"
+        + f" (default: {default_pairing_config.memory_limit_in_mb}, 0 for no limit)",
+        metavar="MEMORY_LIMIT",
+        type=int,
+    )
+    parser.add_argument(
+        "--speculative",
+        dest="speculative_matches",
+        default=argparse.SUPPRESS,
+        help="pair in advance the next round of every outcome once at most N matches are open (default: 0, disabled)",
+        metavar="N",
+        type=int,
+    )
     args = parser.parse_args()
-    main(view_class=View, data_path=args.data_path)
+    # the pairing settings given on the command line override those of the loaded tournaments
+    pairing_fields = {field.name for field in fields(PairingConfig)}
+    pairing_overrides = {name: value for name, value in vars(args).items() if name in pairing_fields}
+    main(
+        view_class=View,
+        data_path=args.data_path,
+        storage_class=STORAGES[args.storage],
+        lazy_loading=args.lazy,
+        pairing_config=PairingConfig(**pairing_overrides),
+        persistent_pairing_cache=args.pairing_cache,
+        pairing_overrides=pairing_overrides,
+    )
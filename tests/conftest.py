@@ -0,0 +1,62 @@
+"""Shared fixtures of the tests: models filled and played through the methods called by the controller."""
+
+import random
+from datetime import date
+from typing import Callable
+
+import pytest
+
+from chess_tournament.models.model import Model
+
+PLAYERS_IDS = [f"AB{i:05d}" for i in range(8)]
+
+
+@pytest.fixture
+def fill_model() -> Callable[[Model], None]:
+    """Return a function adding players and a started 4 rounds tournament of all of them to a model."""
+    random.seed(1)  # the first round is randomly generated
+
+    def fill_model(model: Model) -> None:
+        model.add_players(
+            *[
+                {"identifier": player_id, "last_name": f"Name{i}", "first_name": "First", "birth_date": "2000-01-01"}
+                for i, player_id in enumerate(PLAYERS_IDS)
+            ]
+        )
+        model.add_tournaments(
+            {
+                "name": "Open",
+                "location": "paris",
+                "begin_date": date(2020, 1, 1),
+                "end_date": date(2020, 1, 2),
+                "total_rounds": 4,
+            }
+        )
+        model.add_participants_to_tournament(0, *PLAYERS_IDS)
+        model.start_tournament(0)
+
+    return fill_model
+
+
+@pytest.fixture
+def play_rounds() -> Callable[[Model, int, int], None]:
+    """Return a function playing the given number of rounds of a tournament, with random results."""
+    rng = random.Random(1)
+
+    def play_rounds(model: Model, tournament_t: int, total_rounds: int) -> None:
+        for _ in range(total_rounds):
+            model.start_round(tournament_t)
+            for match_m in range(model.get_total_matches(tournament_t)):
+                model.register_score(tournament_t, match_m, rng.choice(["WIN", "LOSE", "DRAW"]))
+
+    return play_rounds
+
+
+@pytest.fixture
+def tournament_report() -> Callable[[Model, int], tuple[list[str], list[str]]]:
+    """Return a function describing the participants and all the matches of a tournament (to compare two loads)."""
+
+    def tournament_report(model: Model, tournament_t: int) -> tuple[list[str], list[str]]:
+        return model.get_ordered_participants_str(tournament_t), model.get_all_matches_str(tournament_t)
+
+    return tournament_report
@@ -0,0 +1,58 @@
+"""Check the blossom matching against a brute-force minimum cost perfect matching on small random graphs."""
+
+import random
+
+from chess_tournament.models.chessdata.blossom import max_weight_matching
+
+
+def brute_force_min_cost(total_vertices: int, costs: dict[tuple[int, int], int]) -> int | None:
+    """Return the minimum cost of a perfect matching, None if there is none."""
+
+    def min_cost(unmatched: tuple[int, ...]) -> int | None:
+        if not unmatched:
+            return 0
+        vertex, others = unmatched[0], unmatched[1:]
+        best = None
+        for other in others:
+            if (vertex, other) not in costs:
+                continue
+            rest = min_cost(tuple(remaining for remaining in others if remaining != other))
+            if rest is not None and (best is None or costs[vertex, other] + rest < best):
+                best = costs[vertex, other] + rest
+        return best
+
+    return min_cost(tuple(range(total_vertices)))
+
+
+def blossom_min_cost(total_vertices: int, costs: dict[tuple[int, int], int]) -> int | None:
+    """Return the cost of the perfect matching found as the blossom engine does, None if it is not perfect."""
+    max_cost = max(costs.values(), default=0)
+    mates = max_weight_matching([(u, v, max_cost + 1 - cost) for (u, v), cost in costs.items()], max_cardinality=True)
+    if len(mates) < total_vertices or -1 in mates:
+        return None
+    assert all(mates[mates[vertex]] == vertex for vertex in range(total_vertices))
+    return sum(costs[vertex, mate] for vertex, mate in enumerate(mates) if vertex < mate)
+
+
+def test_random_graphs_against_brute_force():
+    rng = random.Random(0)
+    total_without_perfect_matching = 0
+    for _ in range(500):
+        total_vertices = rng.choice((2, 4, 6, 8))
+        density = rng.random()
+        costs = {
+            (u, v): rng.randint(0, 16)
+            for u in range(total_vertices)
+            for v in range(u + 1, total_vertices)
+            if rng.random() < density
+        }
+        expected = brute_force_min_cost(total_vertices, costs)
+        total_without_perfect_matching += expected is None
+        assert blossom_min_cost(total_vertices, costs) == expected, costs
+    assert total_without_perfect_matching > 0
+
+
+def test_no_perfect_matching():
+    # a star (only one leaf matched with its center), then a triangle and an edge (the vertex 5 having no edge)
+    assert blossom_min_cost(4, {(0, 1): 1, (0, 2): 1, (0, 3): 1}) is None
+    assert blossom_min_cost(6, {(0, 1): 0, (1, 2): 0, (0, 2): 0, (3, 4): 0}) is None
@@ -0,0 +1,23 @@
+"""Check that the application is importable without its optional dependencies."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+WITHOUT_ORTOOLS = """
+import sys
+sys.modules["ortools"] = sys.modules["ortools.sat"] = sys.modules["ortools.sat.python"] = None  # masked
+from chess_tournament.models.chessdata.pairing_engines import PAIRING_ENGINES
+from chess_tournament.models.model import Model
+assert not PAIRING_ENGINES["cp-sat"].is_available
+assert PAIRING_ENGINES["blossom"].is_available
+"""
+
+
+def test_import_without_ortools():
+    completed = subprocess.run(
+        [sys.executable, "-c", WITHOUT_ORTOOLS], cwd=ROOT, capture_output=True, text=True, check=False
+    )
+    assert completed.returncode == 0, completed.stderr
@@ -0,0 +1,67 @@
+"""Check the journal storage backend recovery of an interrupted write, and its compaction into the snapshot."""
+
+from chess_tournament.models.model import Model
+from chess_tournament.models.storage import JournalStorage
+
+
+def test_torn_record_is_dropped(tmp_path, fill_model, play_rounds, tournament_report):
+    model = Model(tmp_path, JournalStorage)
+    model.load()
+    fill_model(model)
+    play_rounds(model, 0, 1)
+    expected_report = tournament_report(model, 0)
+    # the application is killed while appending a record (the model is not closed)
+    with open(tmp_path / "journal.jsonl", "a") as journal:
+        journal.write('{"sequence": 1000, "operation": "ADD_PLAYER", "data": {"pla')
+
+    model = Model(tmp_path, JournalStorage)
+    model.load()
+    assert tournament_report(model, 0) == expected_report
+    # the torn record is dropped by a compaction, so that the next records are not appended after it
+    assert (tmp_path / "journal_snapshot.json").exists()
+    assert (tmp_path / "journal.jsonl").read_text() == ""
+    play_rounds(model, 0, 1)
+    expected_report = tournament_report(model, 0)
+    model.close()
+
+    model = Model(tmp_path, JournalStorage)
+    model.load()
+    assert tournament_report(model, 0) == expected_report
+    model.close()
+
+
+def test_compaction_folds_the_journal_into_the_snapshot(
+    tmp_path, monkeypatch, fill_model, play_rounds, tournament_report
+):
+    monkeypatch.setattr(JournalStorage, "compaction_threshold", 10)
+    model = Model(tmp_path, JournalStorage)
+    model.load()
+    fill_model(model)
+    play_rounds(model, 0, 2)
+    expected_report = tournament_report(model, 0)
+    assert (tmp_path / "journal_snapshot.json").exists()
+    assert len((tmp_path / "journal.jsonl").read_text().splitlines()) < 10
+    model.close()
+
+    model = Model(tmp_path, JournalStorage)
+    model.load()
+    assert tournament_report(model, 0) == expected_report
+    model.close()
+
+
+def test_folded_records_are_not_replayed(tmp_path, fill_model, play_rounds, tournament_report):
+    model = Model(tmp_path, JournalStorage)
+    model.load()
+    fill_model(model)
+    play_rounds(model, 0, 1)
+    expected_report = tournament_report(model, 0)
+    journal_records = (tmp_path / "journal.jsonl").read_text()
+    model.close()  # the journal is folded into the snapshot, then emptied
+    # the application is killed before the journal is emptied
+    (tmp_path / "journal.jsonl").write_text(journal_records)
+
+    model = Model(tmp_path, JournalStorage)
+    model.load()
+    assert model.get_total_players() == 8
+    assert tournament_report(model, 0) == expected_report
+    model.close()
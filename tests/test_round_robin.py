@@ -0,0 +1,57 @@
+"""Check the round-robin schedule against the FIDE Berger tables, and its colours over several cycles."""
+
+from itertools import groupby
+
+import pytest
+
+from chess_tournament.models.chessdata.round_robin import berger_cycle, berger_schedule, scheduled_pairs
+
+FIDE_BERGER_TABLES = {
+    4: ["1-4 2-3", "4-3 1-2", "2-4 3-1"],
+    6: ["1-6 2-5 3-4", "6-4 5-3 1-2", "2-6 3-1 4-5", "6-5 1-4 2-3", "3-6 4-2 5-1"],
+    8: [
+        "1-8 2-7 3-6 4-5",
+        "8-5 6-4 7-3 1-2",
+        "2-8 3-1 4-7 5-6",
+        "8-6 7-5 1-4 2-3",
+        "3-8 4-2 5-1 6-7",
+        "8-7 1-6 2-5 3-4",
+        "4-8 5-3 6-2 7-1",
+    ],
+}
+
+
+@pytest.mark.parametrize("total_participants", FIDE_BERGER_TABLES)
+def test_berger_cycle_is_the_fide_table(total_participants: int) -> None:
+    cycle = berger_cycle(total_participants)
+    rounds = [
+        " ".join(f"{white + 1}-{black + 1}" for white, black in scheduled_pairs(cycle, round_r))
+        for round_r in range(len(cycle))
+    ]
+    assert rounds == FIDE_BERGER_TABLES[total_participants]
+
+
+@pytest.mark.parametrize("total_participants", [6, 8, 10, 16])
+@pytest.mark.parametrize("total_cycles", [1, 2, 3, 4])
+def test_berger_schedule_colours(total_participants: int, total_cycles: int) -> None:
+    schedule = berger_schedule(total_participants, total_cycles * (total_participants - 1))
+    colours: list[list[str]] = [[] for _ in range(total_participants)]
+    met: dict[frozenset[int], int] = {}
+    for round_r in range(len(schedule)):
+        pairs = scheduled_pairs(schedule, round_r)
+        assert sorted(participant for pair in pairs for participant in pair) == list(range(total_participants))
+        for white, black in pairs:
+            met[frozenset((white, black))] = met.get(frozenset((white, black)), 0) + 1
+            colours[white].append("W")
+            colours[black].append("B")
+    assert len(met) == total_participants * (total_participants - 1) // 2
+    assert set(met.values()) == {total_cycles}
+    for participant_colours in colours:
+        assert max(len(list(run)) for _, run in groupby(participant_colours)) <= 2
+        assert abs(participant_colours.count("W") - participant_colours.count("B")) <= total_cycles % 2
+
+
+@pytest.mark.parametrize("total_participants, total_rounds", [(5, 4), (5, 5), (6, 4), (6, 0), (6, 7)])
+def test_berger_schedule_rejects_incomplete_cycles(total_participants: int, total_rounds: int) -> None:
+    with pytest.raises(ValueError):
+        berger_schedule(total_participants, total_rounds)
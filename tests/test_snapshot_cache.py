@@ -0,0 +1,63 @@
+"""Check that the snapshot cache serves the decoded data only while the storage files are unchanged."""
+
+import json
+import os
+
+from chess_tournament.models.model import Model
+from chess_tournament.models.storage import JournalStorage, JSONStorage
+
+
+def create_archive(data_path, fill_model, play_rounds, tournament_report) -> tuple[list[str], list[str]]:
+    """Create a played tournament in the JSON files of the data path (and the snapshot cache), return its report."""
+    model = Model(data_path, JSONStorage)
+    model.load()
+    fill_model(model)
+    play_rounds(model, 0, 1)
+    report = tournament_report(model, 0)
+    model.close()
+    assert (data_path / "snapshot_cache.pickle").exists()
+    return report
+
+
+def test_unchanged_files_are_served_by_the_cache(tmp_path, fill_model, play_rounds, tournament_report):
+    expected_report = create_archive(tmp_path, fill_model, play_rounds, tournament_report)
+    os.utime(tmp_path / "tournaments.json")  # touched, but with the same content
+
+    model = Model(tmp_path, JSONStorage)
+    _, tournaments_log = model.load()
+    assert "snapshot_cache.pickle" in tournaments_log[1]
+    assert tournament_report(model, 0) == expected_report
+    model.close()
+
+
+def test_changed_files_invalidate_the_cache(tmp_path, fill_model, play_rounds, tournament_report):
+    create_archive(tmp_path, fill_model, play_rounds, tournament_report)
+    tournaments_file = tmp_path / "tournaments.json"
+    encoded_tournaments = json.loads(tournaments_file.read_text())
+    encoded_tournaments[0]["name"] = "Edited"  # e.g. restored from a backup
+    tournaments_file.write_text(json.dumps(encoded_tournaments))
+
+    model = Model(tmp_path, JSONStorage)
+    _, tournaments_log = model.load()
+    assert "snapshot_cache.pickle" not in tournaments_log[1]
+    assert model.get_tournament_info(0)["name"] == "Edited"
+    model.close()
+
+
+def test_cache_of_another_storage_backend_is_ignored(tmp_path, fill_model, play_rounds, tournament_report):
+    expected_report = create_archive(tmp_path, fill_model, play_rounds, tournament_report)
+
+    model = Model(tmp_path, JournalStorage)  # reading the JSON files until the first snapshot
+    _, tournaments_log = model.load()
+    assert "snapshot_cache.pickle" not in tournaments_log[1]
+    assert tournament_report(model, 0) == expected_report
+    model.close()
+
+
+def test_lazy_loading_does_not_use_the_cache(tmp_path, fill_model, play_rounds, tournament_report):
+    create_archive(tmp_path, fill_model, play_rounds, tournament_report)
+
+    model = Model(tmp_path, JSONStorage)
+    _, tournaments_log = model.load(lazy=True)
+    assert "snapshot_cache.pickle" not in tournaments_log[1]
+    model.close()
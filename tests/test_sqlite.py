@@ -0,0 +1,84 @@
+"""Check the SQLite storage backend import of the JSON files, and the migration of a previous version database."""
+
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+
+from chess_tournament.models.model import Model
+from chess_tournament.models.storage import JSONStorage, SQLiteStorage
+
+FIRST_VERSION_SCHEMA = """
+CREATE TABLE players (identifier TEXT PRIMARY KEY, last_name TEXT, first_name TEXT, birth_date TEXT);
+CREATE TABLE tournaments (
+    id INTEGER PRIMARY KEY, name TEXT, location TEXT, begin_date TEXT, end_date TEXT, total_rounds INTEGER
+);
+CREATE TABLE participants (
+    tournament_id INTEGER, player_id TEXT, position INTEGER, score REAL, PRIMARY KEY (tournament_id, player_id)
+);
+CREATE TABLE rounds (
+    tournament_id INTEGER, round_r INTEGER, name TEXT, start_time TEXT, end_time TEXT,
+    PRIMARY KEY (tournament_id, round_r)
+);
+CREATE TABLE matches (
+    tournament_id INTEGER, round_r INTEGER, match_m INTEGER, first_player_id TEXT, second_player_id TEXT,
+    first_score TEXT, second_score TEXT, PRIMARY KEY (tournament_id, round_r, match_m)
+);
+INSERT INTO players VALUES ('AB00000', 'NAME0', 'First', '2000-01-01'), ('AB00001', 'NAME1', 'First', '2000-01-01');
+INSERT INTO tournaments VALUES (0, 'Open', 'Paris', '2020-01-01', '2020-01-02', 1);
+INSERT INTO participants VALUES (0, 'AB00000', 0, 0), (0, 'AB00001', 1, 0);
+INSERT INTO rounds VALUES (0, 0, 'Round 1', '2020-01-01T10:00:00', '');
+INSERT INTO matches VALUES (0, 0, 0, 'AB00000', 'AB00001', NULL, NULL);
+"""
+
+
+def test_json_files_are_imported_once(tmp_path, fill_model, play_rounds, tournament_report):
+    model = Model(tmp_path, JSONStorage)
+    model.load()
+    fill_model(model)
+    play_rounds(model, 0, 1)
+    expected_report = tournament_report(model, 0)
+    model.close()
+
+    model = Model(tmp_path, SQLiteStorage)
+    players_log, _ = model.load()
+    assert "8 player(s) and 1 tournament(s) imported" in players_log[1]
+    assert tournament_report(model, 0) == expected_report
+    play_rounds(model, 0, 1)
+    expected_report = tournament_report(model, 0)
+    model.close()
+
+    model = Model(tmp_path, SQLiteStorage)
+    players_log, _ = model.load()
+    assert "tournament(s) imported" not in players_log[1]
+    assert model.get_total_players() == 8
+    assert tournament_report(model, 0) == expected_report
+    model.close()
+
+
+def table_columns(data_path: Path) -> dict[str, set[str]]:
+    """Return the columns of each table of the database of the given data path."""
+    with closing(sqlite3.connect(data_path / "chess_tournament.sqlite3")) as connection:
+        tables = [row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+        return {table: {row[1] for row in connection.execute(f"PRAGMA table_info({table})")} for table in tables}
+
+
+def test_previous_version_database_is_migrated(tmp_path):
+    (tmp_path / "previous").mkdir()
+    with closing(sqlite3.connect(tmp_path / "previous" / "chess_tournament.sqlite3")) as connection:
+        connection.executescript(FIRST_VERSION_SCHEMA)
+
+    model = Model(tmp_path / "previous", SQLiteStorage)
+    model.load()
+    assert len(model.get_matches_str(0)) == 1
+    model.register_score(0, 0, "WIN")
+    assert model.get_tournament_info(0)["total_finished_rounds"] == 1
+    model.close()
+
+    model = Model(tmp_path / "previous", SQLiteStorage)
+    model.load()
+    assert model.get_ordered_participants_str(0)[0] == "NAME0 First (AB00000) - 1.0 points"
+    model.close()
+    current_model = Model(tmp_path / "current", SQLiteStorage)
+    current_model.load()
+    current_model.close()
+    assert table_columns(tmp_path / "previous") == table_columns(tmp_path / "current")
@@ -0,0 +1,55 @@
+"""Check the live standings against a full sort of the participants, before and after a reload."""
+
+from itertools import groupby
+
+import pytest
+
+from chess_tournament.models.model import Model
+from chess_tournament.models.save_load_system import STORAGES
+
+
+def sorted_standings(model: Model, tournament_t: int) -> list[list[str]]:
+    """Return the participants identifiers grouped by descending score, tied ones by registration order."""
+    participants = sorted(model.tournaments[tournament_t].participants, key=lambda participant: -participant.score)
+    return [
+        [participant.player.identifier for participant in tie_group]
+        for _, tie_group in groupby(participants, key=lambda participant: participant.score)
+    ]
+
+
+def live_standings(model: Model, tournament_t: int) -> list[list[str]]:
+    """Return the participants identifiers grouped by descending score, read from the live standings."""
+    standings = model.tournaments[tournament_t].standings
+    return [[participant.player.identifier for participant in tie_group] for tie_group in standings.tie_groups()]
+
+
+@pytest.mark.parametrize("storage", STORAGES)
+def test_standings_are_the_same_once_reloaded(tmp_path, storage, fill_model, play_rounds):
+    model = Model(tmp_path, STORAGES[storage])
+    model.load()
+    fill_model(model)
+    play_rounds(model, 0, 2)
+    expected_standings = live_standings(model, 0)
+    assert expected_standings == sorted_standings(model, 0)
+    model.close()
+
+    for lazy in (False, True):
+        model = Model(tmp_path, STORAGES[storage])
+        model.load(lazy=lazy)
+        model.get_tournament_info(0)  # fully loaded
+        assert live_standings(model, 0) == expected_standings
+        model.close()
+
+    model = Model(tmp_path, STORAGES[storage])
+    model.load()
+    play_rounds(model, 0, 2)
+    expected_standings = live_standings(model, 0)
+    assert expected_standings == sorted_standings(model, 0)
+    expected_winners = model.get_tournament_info(0)["winners"]
+    model.close()
+
+    model = Model(tmp_path, STORAGES[storage])
+    model.load()
+    assert live_standings(model, 0) == expected_standings
+    assert model.get_tournament_info(0)["winners"] == expected_winners
+    model.close()
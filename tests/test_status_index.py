@@ -0,0 +1,68 @@
+"""Check the tournaments status index against the status filters of the previous versions (scanning all of them)."""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from chess_tournament.models.model import Model
+from chess_tournament.models.save_load_system import STORAGES
+
+TODAY = date.today()
+STATUS_FILTERS = {
+    "past": lambda tournament: tournament.end_date < TODAY or (tournament.end_date == TODAY and tournament.is_ended),
+    "future": lambda tournament: tournament.begin_date > TODAY
+    or (tournament.begin_date == TODAY and not tournament.total_started_rounds),
+    "ongoing": lambda tournament: tournament.begin_date <= TODAY and tournament.is_started and not tournament.is_ended,
+    "all": lambda tournament: True,
+}
+
+
+def check_status_index(model: Model) -> None:
+    """Compare the selected tournaments and the statistics of each status to the previous status filters."""
+    for status, status_filter in STATUS_FILTERS.items():
+        expected_tournaments_t = [t for t, tournament in enumerate(model.tournaments) if status_filter(tournament)]
+        assert [t for t, *_ in model.get_tournaments_str(status)] == expected_tournaments_t
+    assert model.get_tournaments_states_statistics() == {
+        status: sum(1 for tournament in model.tournaments if status_filter(tournament))
+        for status, status_filter in STATUS_FILTERS.items()
+    }
+    assert model.get_ordered_tournaments_str() == [str(tournament) for tournament in sorted(model.tournaments)]
+
+
+@pytest.mark.parametrize("storage", ["json", "sqlite"])
+def test_status_index_matches_the_status_filters(tmp_path, storage, fill_model, play_rounds):
+    rng = random.Random(1)
+    model = Model(tmp_path, STORAGES[storage])
+    model.load()
+    fill_model(model)
+    players_ids = list(model.get_players_id())
+    for tournament_t in range(1, 30):
+        begin_date = TODAY + timedelta(days=rng.randint(-2, 2))
+        end_date = begin_date + timedelta(days=rng.randint(0, 2))
+        model.add_tournaments(
+            {
+                "name": f"T{tournament_t}",
+                "location": "lyon",
+                "begin_date": begin_date,
+                "end_date": end_date,
+                "total_rounds": 1,
+            }
+        )
+        model.add_participants_to_tournament(tournament_t, *players_ids[:2])
+    check_status_index(model)
+    for tournament_t in rng.sample(range(1, 30), 20):
+        model.start_tournament(tournament_t)
+        check_status_index(model)
+        if rng.random() < 0.5:
+            play_rounds(model, tournament_t, 1)  # ended
+            check_status_index(model)
+    expected_statistics = model.get_tournaments_states_statistics()
+    model.close()
+
+    for lazy in (False, True):
+        model = Model(tmp_path, STORAGES[storage])
+        model.load(lazy=lazy)
+        check_status_index(model)
+        assert model.get_tournaments_states_statistics() == expected_statistics
+        model.close()